@@ -0,0 +1,119 @@
+# agency_scanner.py
+# ページ内に現れる不動産会社名（複数）を1回の走査で見つける
+#
+# 社名はバイト列のトライ木を正規表現にしたもの（共通の前方部分をまとめた選択）で探すので、
+# 社名の数が増えても走査の手間はほとんど変わらない
+
+import os
+import re
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# 1行1社。先頭の社名を自社として扱う
+AGENCY_NAMES_PATH = os.path.join(BASE_DIR, "agencies.txt")
+
+def load_agency_names(path=AGENCY_NAMES_PATH, default=()):
+    """
+    agencies.txt の社名一覧を返す（空行と # で始まる行は無視）。ファイルがなければ default
+    """
+    if not os.path.exists(path):
+        return list(default)
+    with open(path, encoding="utf-8") as f:
+        names = [line.strip() for line in f]
+    return [name for name in names if name and not name.startswith("#")]
+
+def _trie_pattern(words):
+    trie = {}
+    for word in words:
+        node = trie
+        for byte in word:
+            node = node.setdefault(byte, {})
+        node[None] = {}
+
+    def render(node):
+        branches = [
+            re.escape(bytes([byte])) + render(child)
+            for byte, child in sorted((k, v) for k, v in node.items() if k is not None)
+        ]
+        if not branches:
+            return b""
+        pattern = branches[0] if len(branches) == 1 else b"(?:" + b"|".join(branches) + b")"
+        if None in node:
+            # ここで終わる社名もある（長い方を優先して試す）
+            pattern = b"(?:" + pattern + b")?"
+        return pattern
+
+    return re.compile(render(trie))
+
+class AgencyScanner:
+    def __init__(self, names):
+        self.names = list(dict.fromkeys(names))
+        self._compiled = {}
+
+    def _for_encoding(self, encoding):
+        compiled = self._compiled.get(encoding)
+        if compiled is None:
+            encoded = {name.encode(encoding): name for name in self.names}
+            pattern = _trie_pattern(encoded) if encoded else None
+            # 他の社名の前方部分になっている社名（続きを読むまで確定できない）
+            prefixes = {e for e in encoded if any(o != e and o.startswith(e) for o in encoded)}
+            compiled = (pattern, encoded, prefixes, max((len(e) for e in encoded), default=1))
+            self._compiled[encoding] = compiled
+        return compiled
+
+    def scan(self, chunks, encoding="utf-8", stop_at=None, max_bytes=0, end_markers=()):
+        """
+        バイト列のチャンクを順に走査し、現れた社名を出現順のリストで返す
+        チャンクの境目をまたぐ社名も見つける
+        stop_at: この社名が見つかった時点で走査をやめる
+        max_bytes / end_markers: 打ち切り位置（バイト数 / これが現れたら終わり）
+        戻り値: (社名のリスト, 走査したバイト数)
+        """
+        pattern, encoded, prefixes, longest = self._for_encoding(encoding)
+        markers = [marker.encode(encoding) for marker in end_markers]
+        keep = max([longest] + [len(marker) for marker in markers]) - 1
+
+        found = {}
+        tail = b""
+        scanned = 0
+        base = 0      # window の先頭がページの先頭から何バイト目か
+        consumed = 0  # ここより前は一致として数え済み（持ち越した部分を走査し直しても数えない）
+        chunks = iter(chunks)
+        while True:
+            chunk = next(chunks, None)
+            last = chunk is None
+            if not last and not chunk:
+                continue
+            window = tail + (chunk or b"")
+            scanned += len(chunk or b"")
+            stop = last
+            ends = [pos for pos in (window.find(marker) for marker in markers) if pos >= 0]
+            if ends:
+                # 打ち切りの目印より後ろは見ない
+                window = window[:min(ends)]
+                stop = True
+            elif max_bytes and scanned >= max_bytes:
+                stop = True
+            # 末尾付近で終わる一致は、次のチャンクでもっと長い社名になるかもしれないので持ち越す
+            boundary = len(window) if stop else len(window) - keep
+            cut = boundary
+            if pattern is not None:
+                for match in pattern.finditer(window, max(consumed - base, 0)):
+                    if match.end() > boundary and match.group() in prefixes:
+                        cut = min(cut, match.start())
+                        break
+                    name = encoded.get(match.group())
+                    if name is not None:
+                        found.setdefault(name)
+                        consumed = base + match.end()
+            if stop or (stop_at is not None and stop_at in found):
+                break
+            cut = max(cut, 0)
+            tail = window[cut:]
+            base += cut
+        return list(found), scanned
+
+    def scan_text(self, text):
+        """
+        文字列（get_text や page_source）から、現れた社名を出現順のリストで返す
+        """
+        return self.scan([text.encode("utf-8")])[0]
@@ -0,0 +1,61 @@
+# bench_company_check.py
+# 保存済みの物件詳細ページで、社名判定のストリーミング走査と従来方式（全体を解析）を比べる
+#
+#   python bench_company_check.py 保存したページ.html ...
+#   python bench_company_check.py                      # tests/fixtures の詳細ページで比べる
+#
+# 判定結果が一致するか（チャンクの大きさを変えて境目をまたぐ場合も）と、処理時間・読んだバイト数を出す
+
+import glob
+import os
+import sys
+import time
+from suumo_checker import COMPANY_SCAN_CHUNK_SIZE, has_company_name, scan_company_name
+
+CHUNK_SIZES = (7, 1024, COMPANY_SCAN_CHUNK_SIZE)
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests", "fixtures")
+
+def chunked(content, size):
+    return (content[i:i + size] for i in range(0, len(content), size))
+
+def main(paths, repeat=5):
+    paths = paths or sorted(glob.glob(os.path.join(FIXTURES_DIR, "detail_*.html")))
+    pages = []
+    for path in paths:
+        with open(path, "rb") as f:
+            pages.append((path, f.read()))
+    if not pages:
+        print("使い方: python bench_company_check.py 保存したページ.html ...")
+        return 1
+
+    mismatches = 0
+    for path, content in pages:
+        expected = has_company_name(content)
+        for size in CHUNK_SIZES:
+            found, scanned = scan_company_name(chunked(content, size))
+            if found != expected:
+                mismatches += 1
+                print(f"❌ {path} チャンク {size}B: ストリーミング {found} / 従来 {expected}")
+        print(f"📄 {path}: {'あり' if expected else 'なし'}, {scanned:,} / {len(content):,} bytes を走査")
+    print(f"✅ 判定一致: {len(pages)}ページ x {len(CHUNK_SIZES)}通り, 不一致 {mismatches} 件")
+
+    total_bytes = sum(len(content) for _, content in pages)
+    cases = (
+        ("従来（全体を解析）", lambda content: has_company_name(content)),
+        ("ストリーミング", lambda content: scan_company_name(chunked(content, COMPANY_SCAN_CHUNK_SIZE))),
+    )
+    for label, func in cases:
+        start = time.perf_counter()
+        scanned = 0
+        for _ in range(repeat):
+            for _, content in pages:
+                result = func(content)
+                scanned += result[1] if isinstance(result, tuple) else len(content)
+        elapsed = time.perf_counter() - start
+        print(f"⏱️ {label}: {elapsed / (repeat * len(pages)) * 1000:.2f} ms/ページ, "
+              f"読んだバイト数 {scanned / repeat / total_bytes:.0%}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
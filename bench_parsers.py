@@ -0,0 +1,106 @@
+# bench_parsers.py
+# 保存済みの SUUMO ページで HTML パーサーの結果一致と処理速度を比べる
+#
+#   python bench_parsers.py 保存したページ.html ...
+#   python bench_parsers.py                      # tests/fixtures のページで比べる
+#
+# html.parser の結果を基準に、各バックエンドの抽出結果が同一か確認し、1ページあたりの処理時間を出す
+# あわせて詳細ページの部分解析（partial=True）と全体解析の結果・時間・ピークメモリを比べる
+
+import glob
+import os
+import sys
+import time
+import tracemalloc
+from page_parser import BACKENDS, resolve_backend
+from suumo_scrape import extract_conditions_from_html
+from suumo_checker import extract_bukken_ids_from_html, has_company_name
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests", "fixtures")
+
+EXTRACTORS = {
+    "条件抽出": extract_conditions_from_html,
+    "物件ID": extract_bukken_ids_from_html,
+    "社名判定": has_company_name,
+}
+
+def run_extractor(func, content, backend):
+    try:
+        return func(content, backend)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+def measure(func, pages, repeat):
+    # 1ページあたりの時間と、1回の処理中のピークメモリ
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, content in pages:
+            func(content)
+    elapsed = (time.perf_counter() - start) / (repeat * len(pages))
+
+    peak = 0
+    for _, content in pages:
+        tracemalloc.start()
+        func(content)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return elapsed, peak
+
+def compare_partial(pages, backends, repeat):
+    mismatches = 0
+    for backend in backends:
+        full = lambda content: run_extractor(
+            lambda c, b: extract_conditions_from_html(c, b, partial=False), content, backend)
+        partial = lambda content: run_extractor(extract_conditions_from_html, content, backend)
+        for path, content in pages:
+            if full(content) != partial(content):
+                mismatches += 1
+                print(f"❌ {path} 部分解析 {backend}: {partial(content)!r} != {full(content)!r}")
+        for label, func in (("全体解析", full), ("部分解析", partial)):
+            elapsed, peak = measure(func, pages, repeat)
+            print(f"⏱️ 条件抽出 {backend} {label}: {elapsed * 1000:.2f} ms/ページ, ピーク {peak / 1024:.0f} KB")
+    return mismatches
+
+def main(paths, repeat=5):
+    paths = paths or sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.html")))
+    pages = []
+    for path in paths:
+        with open(path, "rb") as f:
+            pages.append((path, f.read()))
+    if not pages:
+        print("使い方: python bench_parsers.py 保存したページ.html ...")
+        return 1
+
+    backends = [b for b in BACKENDS if resolve_backend(b) == b]
+    mismatches = 0
+
+    # 結果一致の確認
+    for path, content in pages:
+        for name, func in EXTRACTORS.items():
+            expected = run_extractor(func, content, "html.parser")
+            for backend in backends[1:]:
+                actual = run_extractor(func, content, backend)
+                if actual != expected:
+                    mismatches += 1
+                    print(f"❌ {path} {name} {backend}: {actual!r} != {expected!r}")
+    print(f"✅ 結果一致: {len(pages)}ページ x {len(EXTRACTORS)}項目 x {len(backends) - 1}バックエンド, 不一致 {mismatches} 件")
+
+    # 処理速度
+    total_bytes = sum(len(content) for _, content in pages)
+    for backend in backends:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for _, content in pages:
+                for func in EXTRACTORS.values():
+                    run_extractor(func, content, backend)
+        elapsed = time.perf_counter() - start
+        count = repeat * len(pages)
+        print(f"⏱️ {backend}: {elapsed / count * 1000:.2f} ms/ページ, "
+              f"{total_bytes * repeat / elapsed / 1e6:.2f} MB/s")
+
+    mismatches += compare_partial(pages, backends, repeat)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,114 @@
+# build_station_table.py
+# station_data.py の stationData を station_table.bin にコンパイルする
+#
+#   python build_station_table.py               # 生成
+#   python build_station_table.py --check-urls  # 各駅の検索 URL を実際に取得して検証し、生成
+#   python build_station_table.py --bench       # import 時間・RSS を旧モジュールと比較
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from station_codes import (
+    TABLE_PATH, URL_CHECKS_PATH, compile_rows, decode_table, encode_table, source_digest,
+    validate_station,
+)
+
+def build():
+    rows = compile_rows()
+    data = encode_table(rows, source_digest())
+    # 読み戻して元データと一致することを確認
+    _, columns = decode_table(data)
+    for i, row in enumerate(rows):
+        for name, values in columns.items():
+            if values[i] != row[name]:
+                raise ValueError(f"{i}行目の {name} が一致しません: {row}")
+
+    with open(TABLE_PATH, "wb") as f:
+        f.write(data)
+    print(f"✅ {TABLE_PATH} を生成しました（{len(rows)}駅, {len(data):,} bytes）")
+
+    for row in rows:
+        if row["invalid"]:
+            print(f"⚠️ 検索対象外: {row['lineName']} / {row['stationName']} ({row['stationCode']}) - {row['invalid']}")
+
+def check_urls(interval=1.0):
+    """
+    各駅の検索 URL（/chintai/<都道府県>/ek_<駅コード下5桁>/）を取得し、
+    404 や別ページへのリダイレクトになる駅を station_url_checks.json に記録する
+    """
+    import requests
+    from suumo_search_url import station_search_base_url
+
+    failures = {}
+    checked = {}
+    for row in compile_rows():
+        # 駅コード不正など、取得するまでもなく URL が作れない駅は除く
+        if validate_station(row):
+            continue
+        url = station_search_base_url(row)
+        if url not in checked:
+            try:
+                response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, allow_redirects=False)
+                if response.status_code == 200:
+                    checked[url] = ""
+                elif response.is_redirect:
+                    checked[url] = f"リダイレクト: {response.headers.get('Location', '')}"
+                else:
+                    checked[url] = f"HTTP {response.status_code}"
+            except Exception as e:
+                print(f"❌ リクエスト失敗: {url} - {e}")
+                checked[url] = ""
+            time.sleep(interval)
+        if checked[url]:
+            print(f"⚠️ {row['lineName']} / {row['stationName']}: {url} - {checked[url]}")
+            failures[row["stationCode"]] = checked[url]
+
+    with open(URL_CHECKS_PATH, "w", encoding="utf-8") as f:
+        json.dump(failures, f, ensure_ascii=False, indent=2, sort_keys=True)
+    print(f"🔍 {len(checked)} URL を確認、解決しない駅 {len(failures)} 件")
+
+# 子プロセスで import し、所要時間と RSS の増分を測る
+BENCH_SCRIPT = """
+import resource, sys, time
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, after - before)
+"""
+
+def bench(runs=5):
+    cases = [
+        ("旧: stationData リテラルの import", "import station_data"),
+        ("新: station_codes の import", "import station_codes"),
+        ("新: import + 初回 get_codes", "import station_codes; station_codes.get_codes('ＪＲ山手線', '東京')"),
+    ]
+    for label, statement in cases:
+        times, rss = [], []
+        for _ in range(runs):
+            # 1回目は .pyc の生成を含むので集計から外す
+            out = subprocess.run(
+                [sys.executable, "-c", BENCH_SCRIPT.format(statement=statement)],
+                capture_output=True, text=True, check=True,
+            ).stdout.split()
+            times.append(float(out[0]))
+            rss.append(int(out[1]))
+        times, rss = times[1:], rss[1:]
+        print(f"⏱️ {label}: {min(times) * 1000:.2f} ms, RSS +{max(rss)} KB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="station_data.py の stationData を station_table.bin にコンパイルする")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check-urls", action="store_true", help="各駅の検索 URL を実際に取得して検証してから生成する")
+    mode.add_argument("--bench", action="store_true", help="import 時間・RSS を旧モジュールと比較する（生成しない）")
+    args = parser.parse_args()
+    if args.bench:
+        bench()
+    else:
+        if args.check_urls:
+            check_urls()
+        build()
@@ -0,0 +1,93 @@
+# conditions_store.py
+# 掲載URLごとの抽出結果（extract_conditions_from_url の戻り値）を SQLite に保存して使い回す
+#
+# 保存から SUUMO_CONDITIONS_TTL 秒（既定 7 日）以内ならページを取得しない
+# 期限切れならページを取得し、本文のハッシュが前回と同じなら解析せずに保存済みの結果を使う
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from http_cache import CACHE_DIR
+from suumo_scrape import extract_conditions_from_html, fetch_listing_page
+
+DB_PATH = os.path.join(CACHE_DIR, "conditions.sqlite3")
+CONDITIONS_TTL = int(os.environ.get("SUUMO_CONDITIONS_TTL", str(7 * 24 * 60 * 60)))
+
+class ConditionsStore:
+    def __init__(self, path=DB_PATH, ttl=CONDITIONS_TTL):
+        self.ttl = ttl
+        self.stats = {"fresh": 0, "unchanged": 0, "parsed": 0}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS conditions ("
+            " url TEXT PRIMARY KEY,"
+            " data TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " content_hash TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, url):
+        """
+        (抽出結果, 取得時刻, 本文のハッシュ) を返す。なければ None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, fetched_at, content_hash FROM conditions WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1], row[2]
+
+    def put(self, url, data, content_hash):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO conditions (url, data, fetched_at, content_hash) VALUES (?, ?, ?, ?)",
+                (url, json.dumps(data, ensure_ascii=False), time.time(), content_hash),
+            )
+            self._conn.commit()
+
+    def touch(self, url):
+        with self._lock:
+            self._conn.execute("UPDATE conditions SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+    def extract(self, url):
+        """
+        extract_conditions_from_url と同じ結果を、保存済みのものを優先して返す
+        """
+        record = self.get(url)
+        if record and time.time() - record[1] < self.ttl:
+            self._count("fresh")
+            return record[0]
+
+        content = fetch_listing_page(url)
+        if content is None:
+            return None
+
+        content_hash = hashlib.sha1(content).hexdigest()
+        if record and record[2] == content_hash:
+            self.touch(url)
+            self._count("unchanged")
+            return record[0]
+
+        data = extract_conditions_from_html(content)
+        self.put(url, data, content_hash)
+        self._count("parsed")
+        return data
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def close(self):
+        self._conn.close()
+
+    def print_stats(self):
+        print(f"🗄️ 抽出結果の保存: 期限内 {self.stats['fresh']} / 変更なし {self.stats['unchanged']}"
+              f" / 解析 {self.stats['parsed']}")
@@ -7,7 +7,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 import time
 from suumo_scrape import extract_conditions_from_url
+from http_client import TransientFetchError
 from suumo_search_url import build_suumo_search_url
+from suumo_checker import COMPANY_NAME, agency_scanner, pick_agency
+from sheets_quota import quota
+from sheet_writer import delete_columns
+from result_archive import KEEP_COLUMNS, RESULT_FIRST_COL, archive_old_columns
 
 # ========== スプレッドシート設定 ==========
 SPREADSHEET_ID = '195OS2gb97TUJS8srYlqLT5QXuXU0zUZxmbeuWtsGQRY'
@@ -15,7 +20,8 @@ SHEET_NAME = 'Sheet1'
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 creds = Credentials.from_service_account_file('credentials.json', scopes=SCOPES)
 client = gspread.authorize(creds)
-sheet = client.open_by_key(SPREADSHEET_ID).worksheet(SHEET_NAME)
+spreadsheet = quota.read(client.open_by_key, SPREADSHEET_ID)
+sheet = quota.read(spreadsheet.worksheet, SHEET_NAME)
 
 # ========== Seleniumドライバー設定 ==========
 def get_driver():
@@ -27,16 +33,18 @@ def get_driver():
 
 # ========== 空いてる次の列（右端）を取得 ==========
 def get_next_available_col():
-    header_row = sheet.row_values(1)
+    header_row = quota.read(sheet.row_values, 1)
     return len(header_row) + 1
 
 # ========== 検索結果からえほうまき物件を探す ==========
+# 戻り値: 条件が一致した物件の掲載会社（自社なら COMPANY_NAME）。見つからなければ None
 def check_ehomaki_listing(search_url, expected_data):
     driver = get_driver()
     driver.get(search_url)
     time.sleep(2)
 
     listings = driver.find_elements(By.CSS_SELECTOR, 'div.cassetteitem')
+    other_agency = None
 
     for listing in listings:
         try:
@@ -81,9 +89,11 @@ def check_ehomaki_listing(search_url, expected_data):
             driver.get(detail_link)
             time.sleep(1.5)
 
-            if "合同会社えほうまき" in driver.page_source:
+            agency = pick_agency(agency_scanner.scan_text(driver.page_source))
+            if agency == COMPANY_NAME:
                 driver.quit()
-                return True
+                return agency
+            other_agency = other_agency or agency
 
             driver.back()
             time.sleep(1)
@@ -92,23 +102,28 @@ def check_ehomaki_listing(search_url, expected_data):
             continue
 
     driver.quit()
-    return False
+    return other_agency
 
 # 新しい列を1列増やして書き込む
 def append_new_column_and_write(row, value):
-    header = sheet.row_values(1)
+    header = quota.read(sheet.row_values, 1)
     current_cols = len(header)
     next_col = current_cols + 1
 
     # 列数が足りなければ拡張
-    sheet.resize(cols=next_col)
+    quota.write(sheet.resize, cols=next_col)
 
     # 書き込み
-    sheet.update_cell(row, next_col, value)
+    quota.write(sheet.update_cell, row, next_col, value)
 
 # ========== メイン処理 ==========
 def main():
-    urls = sheet.col_values(3)[1:]  # C列のURL（2行目から）
+    # 結果列が増えすぎていたら古い列をアーカイブに移す（シート全体を読むのは列数が超えたときだけ）
+    if KEEP_COLUMNS and sheet.col_count - (RESULT_FIRST_COL - 1) >= KEEP_COLUMNS:
+        rows = quota.read(sheet.get_all_values)
+        archive_old_columns(spreadsheet, rows, lambda columns: delete_columns(spreadsheet, sheet, columns))
+
+    urls = quota.read(sheet.col_values, 3)[1:]  # C列のURL（2行目から）
     next_col = get_next_available_col()
 
     for idx, url in enumerate(urls, start=2):
@@ -116,7 +131,12 @@ def main():
             continue
 
         print(f"🔍 処理中: Row {idx} - {url}")
-        data = extract_conditions_from_url(url)
+        try:
+            data = extract_conditions_from_url(url)
+        except TransientFetchError as e:
+            # 再試行しても取得できなかった行は「エラー」と書かずに次回に回す
+            print(f"⏭️ 取得できなかったため見送り: {e}")
+            continue
         if not data:
             print("⚠️ 抽出失敗")
             append_new_column_and_write(idx, "エラー")
@@ -135,11 +155,14 @@ def main():
             append_new_column_and_write(idx, "URLエラー")
             continue
 
-        is_listed = check_ehomaki_listing(search_url, data)
-        result = "⭕️" if is_listed else ""
+        agency = check_ehomaki_listing(search_url, data)
+        # 自社なら ⭕️、他社の掲載ならその社名
+        result = "⭕️" if agency == COMPANY_NAME else (agency or "")
         append_new_column_and_write(idx, result)
 
         print(f"✅ 結果: {result or '見つからず'}")
 
+    quota.print_stats()
+
 if __name__ == "__main__":
     main()
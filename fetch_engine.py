@@ -0,0 +1,33 @@
+# fetch_engine.py
+# 取得・解析関数（extract_conditions_from_url など）を asyncio で並行実行する
+#
+# 同時実行数は SUUMO_CONCURRENCY（既定 4）。ホストごとの秒間リクエスト数の上限は
+# http_client 側（SUUMO_MAX_RPS_PER_HOST）で守るので、ここでは同時に動く数だけを抑える
+# 各処理の中でさらに並行して取得しても（検索結果のページ送りなど）、同時に送るリクエストは
+# http_client が合計 SUUMO_CONCURRENCY までに抑える
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+CONCURRENCY = int(os.environ.get("SUUMO_CONCURRENCY", "4"))
+
+async def _run_all(func, items, concurrency):
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        async def run(item):
+            async with semaphore:
+                return await loop.run_in_executor(executor, func, item)
+
+        return await asyncio.gather(*(run(item) for item in items))
+
+def run_all(func, items, concurrency=None):
+    """
+    items の各要素に func を最大 concurrency 件ずつ並行して適用し、結果を items と同じ順で返す
+    """
+    items = list(items)
+    if not items:
+        return []
+    return asyncio.run(_run_all(func, items, concurrency or CONCURRENCY))
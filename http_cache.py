@@ -0,0 +1,181 @@
+# http_cache.py
+# SUUMO ページのディスクキャッシュ（本文は zlib 圧縮）
+#
+# ETag / Last-Modified があれば条件付き GET（304 ならキャッシュを使う）で確認し、
+# どちらもなければ TTL 内のキャッシュをそのまま使う
+#
+# 環境変数
+#   SUUMO_CACHE_DIR      : キャッシュの保存先（既定 .cache）
+#   SUUMO_HTTP_CACHE     : "0" でキャッシュを使わない
+#   SUUMO_HTTP_CACHE_TTL : 検証用ヘッダーがないページを使い回す秒数（既定 0 = 使い回さない）
+#   SUUMO_HTTP_CACHE_MAX_AGE : 最後に取得・確認してからこの秒数を過ぎたエントリは削除する（既定 7 日）
+#
+# 検証用ヘッダーも TTL もないページは使い回せないので保存しない
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import requests
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("SUUMO_CACHE_DIR", os.path.join(BASE_DIR, ".cache"))
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+ENABLED = os.environ.get("SUUMO_HTTP_CACHE", "1") != "0"
+DEFAULT_TTL = int(os.environ.get("SUUMO_HTTP_CACHE_TTL", "0"))
+MAX_AGE = int(os.environ.get("SUUMO_HTTP_CACHE_MAX_AGE", str(7 * 24 * 60 * 60)))
+
+# ファイル形式: メタデータ（JSON）のバイト数, メタデータ, zlib 圧縮した本文
+META_SIZE = struct.Struct("<I")
+
+_lock = threading.Lock()
+_stats = {"hits": 0, "revalidated": 0, "misses": 0, "bytes_saved": 0, "stored": 0, "pruned": 0}
+
+def normalize_url(url):
+    """
+    キャッシュキー用に URL を正規化する（スキーム・ホストの小文字化、既定ポートとフラグメントの除去、クエリの並べ替え）
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+def _cache_path(url, headers):
+    # PC 版とスマホ版でマークアップが違うので User-Agent もキーに含める
+    key = normalize_url(url) + "\n" + headers.get("User-Agent", "")
+    name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(HTTP_CACHE_DIR, name[:2], name)
+
+def _read_entry(path):
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        (meta_size,) = META_SIZE.unpack_from(data)
+        meta = json.loads(data[META_SIZE.size:META_SIZE.size + meta_size])
+        body = zlib.decompress(data[META_SIZE.size + meta_size:])
+        return meta, body
+    except (OSError, ValueError, struct.error, zlib.error):
+        return None, None
+
+def _write_entry(path, meta, body):
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    data = META_SIZE.pack(len(meta_bytes)) + meta_bytes + zlib.compress(body, 6)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def _cached_response(url, meta, body):
+    response = requests.Response()
+    response._content = body
+    response.status_code = 200
+    response.url = meta.get("url", url)
+    response.headers.update(meta.get("headers", {}))
+    response.encoding = meta.get("encoding")
+    response.from_cache = True
+    return response
+
+def _count(name, saved=0):
+    with _lock:
+        _stats[name] += 1
+        _stats["bytes_saved"] += saved
+
+def cached_fetch(url, headers, send, ttl=None):
+    """
+    send(追加ヘッダー) でリクエストするところを、キャッシュを挟んで行う
+    ttl: 検証用ヘッダーがないページを使い回す秒数（省略時は SUUMO_HTTP_CACHE_TTL）
+    """
+    ttl = DEFAULT_TTL if ttl is None else ttl
+    path = _cache_path(url, headers)
+    meta, body = _read_entry(path)
+
+    extra_headers = {}
+    if meta:
+        if meta.get("etag"):
+            extra_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            extra_headers["If-Modified-Since"] = meta["last_modified"]
+        if not extra_headers and time.time() - meta["fetched_at"] < ttl:
+            _count("hits", meta.get("wire_bytes", len(body)))
+            return _cached_response(url, meta, body)
+
+    response = send(extra_headers)
+
+    if meta and response.status_code == 304:
+        meta["fetched_at"] = time.time()
+        meta["etag"] = response.headers.get("ETag", meta.get("etag"))
+        meta["last_modified"] = response.headers.get("Last-Modified", meta.get("last_modified"))
+        _write_entry(path, meta, body)
+        _count("revalidated", meta.get("wire_bytes", len(body)))
+        return _cached_response(url, meta, body)
+
+    _count("misses")
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if (
+        response.status_code == 200
+        and (etag or last_modified or ttl > 0)
+        and "no-store" not in response.headers.get("Cache-Control", "")
+    ):
+        meta = {
+            "url": response.url,
+            "fetched_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": response.encoding,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() == "content-type"},
+            "wire_bytes": getattr(response, "wire_bytes", len(response.content)),
+        }
+        _write_entry(path, meta, response.content)
+        _count("stored")
+    elif meta:
+        # 使い回せなくなった古いエントリは残さない
+        _remove(path)
+    return response
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def prune(max_age=None):
+    """
+    最後に取得・確認してから max_age 秒（省略時は SUUMO_HTTP_CACHE_MAX_AGE）を過ぎたエントリを削除する
+    エントリは取得・304 での確認のたびに書き直すので、ファイルの更新時刻を fetched_at として使う
+    戻り値: 削除したファイルの数
+    """
+    max_age = MAX_AGE if max_age is None else max_age
+    if max_age <= 0 or not os.path.isdir(HTTP_CACHE_DIR):
+        return 0
+    limit = time.time() - max_age
+    removed = 0
+    for dirpath, _, filenames in os.walk(HTTP_CACHE_DIR):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                if os.stat(path).st_mtime < limit:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+    with _lock:
+        _stats["pruned"] += removed
+    return removed
+
+def get_stats():
+    with _lock:
+        return dict(_stats)
+
+def print_stats():
+    stats = get_stats()
+    print(f"💾 キャッシュ: ヒット {stats['hits']} / 304 {stats['revalidated']} / ミス {stats['misses']}"
+          f"（削減 {stats['bytes_saved'] / 1024:,.0f} KB）/ 保存 {stats['stored']} / 期限切れで削除 {stats['pruned']}")
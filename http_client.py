@@ -0,0 +1,329 @@
+# http_client.py
+# suumo.jp へのリクエストを1つのセッション（keep-alive の接続プール）にまとめる
+#
+# 環境変数
+#   SUUMO_HTTP_POOL_SIZE      : ホストごとに保持する接続数（既定 10）
+#   SUUMO_MAX_RPS_PER_HOST    : ホストごとの秒間リクエスト数の上限（既定 2）。エラーが返るとこれより下げる
+#   SUUMO_HTTP_RETRIES        : 429 / 5xx / 接続エラーのときの再試行回数（既定 4）。使い切ったら TransientFetchError
+#   SUUMO_HTTP_BACKOFF        : 再試行の待ち時間の基準秒数（1, 2, 4 … 倍のうちランダム）
+#   SUUMO_BREAKER_THRESHOLD   : 失敗がこの回数続いたらそのホストへのリクエストを止める
+#   SUUMO_BREAKER_COOLDOWN    : 止める秒数
+#   SUUMO_BREAKER_MAX_TRIPS   : 止めたあとも失敗が続き、この回数を超えたら処理を中止する（CircuitOpenError）
+#
+# 同時に送るリクエストの数は、どのスレッドから送るかに関わらず SUUMO_CONCURRENCY（fetch_engine）までにする
+# （run_all の各行の処理が検索結果のページを並行して取得しても、合計でこの数を超えない）
+
+import email.utils
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+import http_cache
+from fetch_engine import CONCURRENCY
+
+POOL_SIZE = int(os.environ.get("SUUMO_HTTP_POOL_SIZE", "10"))
+MAX_RPS_PER_HOST = float(os.environ.get("SUUMO_MAX_RPS_PER_HOST", "2"))
+TIMEOUT = 30
+
+RETRIES = int(os.environ.get("SUUMO_HTTP_RETRIES", "4"))
+BACKOFF_BASE = float(os.environ.get("SUUMO_HTTP_BACKOFF", "1"))
+BACKOFF_MAX = 60
+RETRY_AFTER_MAX = 300
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MIN_RPS_PER_HOST = 0.2
+RATE_RECOVERY = 0.05  # 成功1回ごとに戻す秒間リクエスト数
+
+BREAKER_THRESHOLD = int(os.environ.get("SUUMO_BREAKER_THRESHOLD", "10"))
+BREAKER_COOLDOWN = float(os.environ.get("SUUMO_BREAKER_COOLDOWN", "60"))
+BREAKER_MAX_TRIPS = int(os.environ.get("SUUMO_BREAKER_MAX_TRIPS", "3"))
+
+def _accept_encoding():
+    # brotli が入っていれば urllib3 が br を展開できる
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return "gzip, deflate"
+    return "gzip, deflate, br"
+
+COMMON_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ja,en-US;q=0.7,en;q=0.3",
+    "Accept-Encoding": _accept_encoding(),
+}
+
+# 物件詳細ページは PC 版のマークアップ（.property_view_* / .property_data）を解析する
+DESKTOP_HEADERS = {
+    **COMMON_HEADERS,
+    "User-Agent": "Mozilla/5.0",
+}
+
+# 検索結果ページはスマホ版のマークアップ（li[data-bukken-cd]）を解析する
+MOBILE_HEADERS = {
+    **COMMON_HEADERS,
+    "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1",
+}
+
+class CircuitOpenError(Exception):
+    """
+    サイト側のエラーが続いたため処理を中止する（取得失敗を「掲載なし」などとして書き込まないため）
+    取得関数はこの例外を握りつぶさずに呼び出し元へ伝える
+    """
+
+class TransientFetchError(Exception):
+    """
+    429 / 5xx / 接続エラーが再試行しても続いた（ページが掲載中かどうかは分からない）
+    取得関数はこの例外を「抽出失敗」や「掲載なし」に読み替えずに呼び出し元へ伝え、呼び出し元はその行の書き込みを見送る
+    """
+
+class HostRateLimiter:
+    """
+    ホストごとにリクエストの間隔を 1 / rate 秒以上空ける（スレッドセーフ）
+    エラーが返ると rate を半分にし（min_rate まで）、成功するたびに少しずつ max_rate まで戻す
+    """
+    def __init__(self, rate, min_rate=MIN_RPS_PER_HOST, recovery=RATE_RECOVERY):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.recovery = recovery
+        self._rates = {}
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def rate(self, host):
+        return self._rates.get(host, self.max_rate)
+
+    def wait(self, host):
+        if self.max_rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + 1 / self.rate(host)
+        if slot > now:
+            time.sleep(slot - now)
+
+    def pause(self, host, seconds):
+        """
+        Retry-After で指定された時間、そのホストへの次のリクエストを遅らせる
+        """
+        if self.max_rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._next_slot[host] = max(self._next_slot.get(host, now), now + seconds)
+
+    def on_success(self, host):
+        if self.max_rate <= 0:
+            return
+        with self._lock:
+            self._rates[host] = min(self.max_rate, self.rate(host) + self.recovery)
+
+    def on_error(self, host):
+        if self.max_rate <= 0:
+            return
+        with self._lock:
+            self._rates[host] = max(self.min_rate, self.rate(host) / 2)
+
+class CircuitBreaker:
+    """
+    ホストごとに続けて失敗した回数を数え、threshold 回に達したら cooldown 秒そのホストへのリクエストを止める
+    止めたあとに成功すれば元に戻る。成功しないまま max_trips 回を超えたら CircuitOpenError で中止する
+    """
+    def __init__(self, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN, max_trips=BREAKER_MAX_TRIPS):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_trips = max_trips
+        self.opened = 0
+        self._failures = {}
+        self._trips = {}
+        self._open_until = {}
+        self._aborted = None
+        self._lock = threading.Lock()
+
+    def before_request(self, host):
+        with self._lock:
+            if self._aborted:
+                raise CircuitOpenError(self._aborted)
+            wait = self._open_until.get(host, 0) - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self, host):
+        with self._lock:
+            self._failures[host] = 0
+            self._trips[host] = 0
+
+    def on_failure(self, host):
+        if self.threshold <= 0:
+            return
+        with self._lock:
+            self._failures[host] = self._failures.get(host, 0) + 1
+            if self._failures[host] < self.threshold:
+                return
+            self._failures[host] = 0
+            self._trips[host] = self._trips.get(host, 0) + 1
+            self.opened += 1
+            trips = self._trips[host]
+            if trips > self.max_trips:
+                self._aborted = f"{host} へのリクエストが失敗し続けたため中止しました"
+                raise CircuitOpenError(self._aborted)
+            self._open_until[host] = time.monotonic() + self.cooldown
+        print(f"⛔ {host} でエラーが続いたため {self.cooldown:g} 秒停止します（{trips}/{self.max_trips}）")
+
+_session = None
+_lock = threading.Lock()
+_stats = {"requests": 0, "bytes": 0, "retries": 0}
+_rate_limiter = HostRateLimiter(MAX_RPS_PER_HOST)
+_breaker = CircuitBreaker()
+# リクエストを送ってから応答を受け取るまで1つ使う（stream=True は本文を読む前に返す）
+_request_slots = threading.BoundedSemaphore(CONCURRENCY)
+
+def get_session():
+    """
+    プロセス内で共有するセッションを返す（初回に作成）
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+def _wire_bytes(response):
+    # 圧縮された状態で受信したバイト数。取れなければ展開後のサイズ
+    try:
+        return response.raw.tell() or len(response.content)
+    except Exception:
+        return len(response.content)
+
+def _retry_after(response):
+    # Retry-After（秒数または HTTP 日付）を秒数にする
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0), RETRY_AFTER_MAX)
+
+def _send(url, headers, method, **kwargs):
+    kwargs.setdefault("timeout", TIMEOUT)
+    host = urlsplit(url).hostname
+    retries = RETRIES if method in ("GET", "HEAD") else 0
+    for attempt in range(retries + 1):
+        _breaker.before_request(host)
+        _rate_limiter.wait(host)
+        try:
+            with _request_slots:
+                response = get_session().request(method, url, headers=headers, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            response, error, retry_after = None, e, None
+        else:
+            if response.status_code not in RETRY_STATUSES:
+                _rate_limiter.on_success(host)
+                _breaker.on_success(host)
+                break
+            error, retry_after = None, _retry_after(response)
+
+        _rate_limiter.on_error(host)
+        _breaker.on_failure(host)
+        if attempt == retries:
+            break
+        # 待ち時間は 0〜基準×2^attempt のランダム（同時に失敗したリクエストが一斉に再試行しないように）
+        delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+            _rate_limiter.pause(host, retry_after)
+        reason = error or response.status_code
+        print(f"🔁 再試行 {attempt + 1}/{retries}（{reason}）: {delay:.1f} 秒後 {url}")
+        if response is not None:
+            response.close()
+        with _lock:
+            _stats["retries"] += 1
+        time.sleep(delay)
+
+    if response is None:
+        raise TransientFetchError(f"{url}: {error}") from error
+    if response.status_code in RETRY_STATUSES:
+        response.close()
+        raise TransientFetchError(f"{url}: HTTP {response.status_code}")
+    if not kwargs.get("stream"):
+        response.wire_bytes = _wire_bytes(response)
+        with _lock:
+            _stats["requests"] += 1
+            _stats["bytes"] += response.wire_bytes
+    return response
+
+def fetch(url, headers=DESKTOP_HEADERS, method="GET", cache_ttl=None, **kwargs):
+    """
+    共有セッションで url を取得する。ステータスの確認（raise_for_status）は呼び出し側で行う
+    GET は http_cache のディスクキャッシュを通す（cache_ttl は http_cache.cached_fetch を参照）
+    """
+    if method != "GET" or kwargs.get("stream") or not http_cache.ENABLED:
+        return _send(url, headers, method, **kwargs)
+
+    def send(extra_headers):
+        return _send(url, {**headers, **extra_headers}, method, **kwargs)
+
+    return http_cache.cached_fetch(url, headers, send, cache_ttl)
+
+def finish_stream(response):
+    """
+    stream=True で取得したレスポンスを閉じ、それまでに受信したバイト数を集計に加える
+    読み残しがあれば接続ごと閉じる（プールには戻らない）
+    """
+    try:
+        received = response.raw.tell()
+    except Exception:
+        received = 0
+    response.close()
+    with _lock:
+        _stats["requests"] += 1
+        _stats["bytes"] += received
+    return received
+
+def get_stats():
+    """
+    {"requests": リクエスト数, "connections": 新規接続数, "reuse_rate": 接続再利用率, "bytes": 受信バイト数,
+     "retries": 再試行の回数, "breaker_opened": リクエストを止めた回数}
+    """
+    connections = 0
+    if _session is not None:
+        seen = set()
+        for adapter in _session.adapters.values():
+            if id(adapter) in seen:
+                continue
+            seen.add(id(adapter))
+            poolmanager = getattr(adapter, "poolmanager", None)
+            if poolmanager is None:
+                continue
+            for key in list(poolmanager.pools.keys()):
+                pool = poolmanager.pools.get(key)
+                if pool is not None:
+                    connections += pool.num_connections
+    with _lock:
+        stats = dict(_stats)
+    stats["connections"] = connections
+    stats["breaker_opened"] = _breaker.opened
+    stats["reuse_rate"] = 1 - connections / stats["requests"] if stats["requests"] else 0.0
+    return stats
+
+def print_stats():
+    stats = get_stats()
+    print(f"🌐 HTTP: {stats['requests']} リクエスト / 新規接続 {stats['connections']} "
+          f"（再利用率 {stats['reuse_rate']:.0%}）/ 受信 {stats['bytes'] / 1024:,.0f} KB")
+    if stats["retries"] or stats["breaker_opened"]:
+        print(f"🔁 再試行 {stats['retries']} 回 / 一時停止 {stats['breaker_opened']} 回")
@@ -0,0 +1,154 @@
+# page_parser.py
+# HTML パーサーの切り替え層。suumo_scrape / suumo_checker はここ経由でページを解析する
+#
+# バックエンドは環境変数 SUUMO_HTML_PARSER で選ぶ
+#   "html.parser" : BeautifulSoup + 標準ライブラリのパーサー（既定。追加の依存なし）
+#   "lxml"        : BeautifulSoup + lxml（pip install lxml）
+#   "selectolax"  : selectolax の lexbor パーサー（pip install selectolax）。最速
+
+import html
+import os
+import re
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+
+DEFAULT_BACKEND = os.environ.get("SUUMO_HTML_PARSER", "html.parser")
+BACKENDS = ("html.parser", "lxml", "selectolax")
+
+_warned = set()
+
+TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title", re.I | re.S)
+
+def _class_filter(classes):
+    # 解析中の class 属性は未分割の文字列で渡ってくる（bs4 のバージョンによってはリスト）
+    def match(value):
+        if not value:
+            return False
+        values = value.split() if isinstance(value, str) else value
+        return any(v in classes for v in values)
+    return match
+
+class SoupNode:
+    def __init__(self, tag):
+        self._tag = tag
+
+    def text(self):
+        return self._tag.text
+
+    def attr(self, name):
+        return self._tag.get(name)
+
+    def select_one(self, selector):
+        tag = self._tag.select_one(selector)
+        return SoupNode(tag) if tag else None
+
+class SoupDocument:
+    def __init__(self, content, features, only_classes=None):
+        self._content = content
+        self._partial = bool(only_classes)
+        if self._partial:
+            strainer = SoupStrainer(class_=_class_filter(set(only_classes)))
+            self._soup = BeautifulSoup(content, features, parse_only=strainer)
+        else:
+            self._soup = BeautifulSoup(content, features)
+
+    def title(self):
+        if not self._partial:
+            return self._soup.title.text if self._soup.title else None
+        # 部分解析では <title> を木に含めないので、元の HTML から直接読む
+        content = self._content
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+            encoding = "utf-8"
+        else:
+            encoding = self._soup.original_encoding or "utf-8"
+        match = TITLE_RE.search(content)
+        return html.unescape(match.group(1).decode(encoding, "replace")) if match else None
+
+    def select_one(self, selector):
+        tag = self._soup.select_one(selector)
+        return SoupNode(tag) if tag else None
+
+    def select(self, selector):
+        return [SoupNode(tag) for tag in self._soup.select(selector)]
+
+    def text(self):
+        return self._soup.get_text()
+
+class LexborNode:
+    def __init__(self, node):
+        self._node = node
+
+    def text(self):
+        return self._node.text(deep=True)
+
+    def attr(self, name):
+        return self._node.attributes.get(name)
+
+    def select_one(self, selector):
+        node = self._node.css_first(selector)
+        return LexborNode(node) if node else None
+
+class LexborDocument:
+    def __init__(self, content):
+        from selectolax.lexbor import LexborHTMLParser
+
+        if isinstance(content, bytes):
+            # lexbor は <meta charset> を見ずに UTF-8 として読むので、BeautifulSoup と同じ判定で先に文字列にする
+            content = UnicodeDammit(content, is_html=True).unicode_markup
+        self._tree = LexborHTMLParser(content)
+
+    def title(self):
+        node = self._tree.css_first("title")
+        return node.text(deep=True) if node else None
+
+    def select_one(self, selector):
+        node = self._tree.css_first(selector)
+        return LexborNode(node) if node else None
+
+    def select(self, selector):
+        return [LexborNode(node) for node in self._tree.css(selector)]
+
+    def text(self):
+        # BeautifulSoup の get_text と同じく script/style の中身は含めない
+        root = self._tree.root
+        if root is None:
+            return ""
+        for node in root.css("script, style, template"):
+            node.decompose()
+        return root.text(deep=True)
+
+def _available(backend):
+    try:
+        if backend == "lxml":
+            import lxml  # noqa: F401
+        elif backend == "selectolax":
+            import selectolax.lexbor  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def resolve_backend(backend=None):
+    """
+    使用するバックエンド名を返す。未インストールなら html.parser に戻す
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"未対応の HTML パーサー: {backend}（{', '.join(BACKENDS)} のいずれか）")
+    if backend != "html.parser" and not _available(backend):
+        if backend not in _warned:
+            print(f"⚠️ {backend} が未インストールのため html.parser を使います")
+            _warned.add(backend)
+        return "html.parser"
+    return backend
+
+def parse_html(content, backend=None, only_classes=None):
+    """
+    HTML（bytes / str）を解析し、title() / select_one() / select() / text() を持つ文書を返す
+    only_classes: 指定すると、その class を持つ要素（と子孫）だけで木を作る（部分解析）
+                  title() は引き続き使える。text() はその部分だけの文字列になる
+                  selectolax は全体を解析しても十分速いので無視する
+    """
+    backend = resolve_backend(backend)
+    if backend == "selectolax":
+        return LexborDocument(content)
+    return SoupDocument(content, backend, only_classes)
@@ -0,0 +1,102 @@
+# result_archive.py
+# 結果列（E列以降。実行ごとに1列増える）のうち古いものをシートから外し、アーカイブに移す
+#
+# シートに残す結果列を一定数にして、毎回の読み込み量が増え続けないようにする
+# アーカイブは「列見出し, 物件名, 部屋, URL, 結果」の縦持ちで、値のあるセルだけを残す
+#
+# 環境変数
+#   SUUMO_RESULT_COLUMNS_KEEP : シートに残す結果列の数（既定 30、0 = アーカイブしない）
+#   SUUMO_RESULT_ARCHIVE      : "sheet"（既定。同じスプレッドシートのワークシートに追記）
+#                               / "local"（.cache/result_history.sqlite3 に保存）
+
+import os
+import sqlite3
+import time
+from gspread.exceptions import WorksheetNotFound
+from http_cache import CACHE_DIR
+from sheets_quota import quota
+
+RESULT_FIRST_COL = 5  # A〜D列は 物件名, 部屋, URL, 検索URL
+KEEP_COLUMNS = int(os.environ.get("SUUMO_RESULT_COLUMNS_KEEP", "30"))
+ARCHIVE_TARGET = os.environ.get("SUUMO_RESULT_ARCHIVE", "sheet")
+ARCHIVE_SHEET_NAME = "結果アーカイブ"
+ARCHIVE_HEADER = ["列見出し", "物件名", "部屋", "URL", "結果"]
+HISTORY_DB_PATH = os.path.join(CACHE_DIR, "result_history.sqlite3")
+
+def columns_to_archive(rows, keep=None, adding=1):
+    """
+    rows: シートの値（get_all_values の戻り値）
+    adding: このあと追加する結果列の数（追加後に keep 列になるように外す）
+    戻り値: 外す結果列の番号（1始まり、古い順）
+    """
+    keep = KEEP_COLUMNS if keep is None else keep
+    if keep <= 0:
+        return []
+    width = max((len(row) for row in rows if any(cell.strip() for cell in row)), default=0)
+    result_cols = list(range(RESULT_FIRST_COL, width + 1))
+    excess = len(result_cols) + adding - keep
+    return result_cols[:excess] if excess > 0 else []
+
+def archive_records(rows, columns):
+    """
+    外す列の値のあるセルを [列見出し, 物件名, 部屋, URL, 結果] のリストにする
+    """
+    header = rows[0] if rows else []
+    records = []
+    for col in columns:
+        title = header[col - 1] if col <= len(header) else ""
+        for row in rows[1:]:
+            value = row[col - 1] if col <= len(row) else ""
+            if value.strip():
+                key = (row[:3] + ["", "", ""])[:3]
+                records.append([title, *key, value])
+    return records
+
+def _save_to_sheet(spreadsheet, records):
+    try:
+        archive = quota.read(spreadsheet.worksheet, ARCHIVE_SHEET_NAME)
+    except WorksheetNotFound:
+        archive = quota.write(spreadsheet.add_worksheet, ARCHIVE_SHEET_NAME, rows=1, cols=len(ARCHIVE_HEADER))
+        quota.write(archive.append_rows, [ARCHIVE_HEADER], value_input_option="RAW")
+    quota.write(archive.append_rows, records, value_input_option="RAW")
+
+def _save_to_local(records, path=HISTORY_DB_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS result_history ("
+            " column_title TEXT NOT NULL,"
+            " name TEXT NOT NULL,"
+            " room TEXT NOT NULL,"
+            " url TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " archived_at REAL NOT NULL)"
+        )
+        now = time.time()
+        conn.executemany(
+            "INSERT INTO result_history VALUES (?, ?, ?, ?, ?, ?)",
+            [(*record, now) for record in records],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+def archive_old_columns(spreadsheet, rows, delete_columns, keep=None, adding=1, target=None):
+    """
+    結果列が keep 列を超える分を古い順にアーカイブへ保存してから、delete_columns(列番号のリスト) で削除する
+    保存に失敗したときは列を削除しない
+    戻り値: 削除した列の番号のリスト
+    """
+    columns = columns_to_archive(rows, keep, adding)
+    if not columns:
+        return []
+    records = archive_records(rows, columns)
+    if records:
+        if (target or ARCHIVE_TARGET) == "local":
+            _save_to_local(records)
+        else:
+            _save_to_sheet(spreadsheet, records)
+    delete_columns(columns)
+    print(f"🗄️ 古い結果列 {len(columns)} 列（{len(records)} セル）をアーカイブに移動")
+    return columns
@@ -0,0 +1,52 @@
+# run_memo.py
+# 1回の実行の中だけで使う関数結果のメモ（キーごとに1回だけ実行する）
+
+import threading
+from concurrent.futures import Future
+
+class SingleFlightMemo:
+    """
+    func(key) の結果をキーごとに覚える。同じキーの同時呼び出しは、先に始まった呼び出しの結果を待つ
+    結果が None（取得失敗）のときは覚えず、次の呼び出しで再実行する
+    """
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0   # func を実際に呼んだ回数
+        self.saved = 0   # メモの結果を返した（func を呼ばずに済んだ）回数
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, key):
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._futures[key] = future
+                self.calls += 1
+            else:
+                self.saved += 1
+
+        if owner:
+            try:
+                result = self.func(key)
+            except BaseException as e:
+                self._forget(key)
+                future.set_exception(e)
+                raise
+            if result is None:
+                self._forget(key)
+            future.set_result(result)
+        return future.result()
+
+    def __contains__(self, key):
+        """
+        key の結果をすでに覚えているか（実行中のものは含まない）
+        """
+        with self._lock:
+            future = self._futures.get(key)
+        return future is not None and future.done()
+
+    def _forget(self, key):
+        with self._lock:
+            self._futures.pop(key, None)
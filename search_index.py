@@ -0,0 +1,80 @@
+# search_index.py
+# 1回の実行の中で、検索URLごとに検索結果の物件IDの集合を覚える
+#
+# 先に行を検索URLごとにまとめて登録し（add）、検索URLごとに1回だけ取得する（fetch_all）
+# 各行の判定は集合に物件IDが含まれるかどうかだけで行う（lookup）
+
+from fetch_engine import run_all
+from run_memo import SingleFlightMemo
+from suumo_checker import fetch_bukken_ids
+
+class SearchIndex:
+    def __init__(self, fetch_ids=fetch_bukken_ids):
+        self.fetch_ids = fetch_ids
+        self.rows = {}      # キー → (検索URL, 物件ID)
+        self.targets = {}   # 検索URL → 登録された物件IDの集合
+        self.failed = set()  # 取得に失敗した検索URL（この実行の中では再取得しない）
+        self.incomplete = set()  # 全ページを読めなかった検索URL（見つからなかった物件IDは判定しない）
+        self._ids = SingleFlightMemo(self._fetch)
+
+    def add(self, key, search_url, bukken_id):
+        """
+        行（キー）を検索URLに登録する。bukken_id が None の行も登録できる（lookup は None を返す）
+        """
+        self.rows[key] = (search_url, bukken_id)
+        targets = self.targets.setdefault(search_url, set())
+        if bukken_id:
+            targets.add(bukken_id)
+
+    def groups(self):
+        """
+        検索URLごとの行のキー: {検索URL: [キー, ...]}（登録順）
+        """
+        groups = {}
+        for key, (search_url, _) in self.rows.items():
+            groups.setdefault(search_url, []).append(key)
+        return groups
+
+    def _fetch(self, search_url):
+        result = self.fetch_ids(search_url, self.targets.get(search_url))
+        if result is None:
+            self.failed.add(search_url)
+            return None
+        bukken_ids, complete = result
+        if not complete:
+            self.incomplete.add(search_url)
+        return bukken_ids
+
+    def ids(self, search_url):
+        """
+        検索結果の物件IDの集合（まだ取得していなければここで取得する）。取得失敗時は None
+        """
+        if search_url in self.failed:
+            return None
+        return self._ids(search_url)
+
+    def fetch_all(self, concurrency=None):
+        """
+        登録された検索URLをそれぞれ1回ずつ並行して取得する
+        """
+        run_all(self.ids, list(self.targets), concurrency)
+
+    def lookup(self, key):
+        """
+        行の物件IDが検索結果にあれば True、なければ False
+        物件IDがない行と、検索結果を取得できなかった行は None
+        全ページを読めなかった検索結果になければ、載っていないとは言えないので None
+        """
+        search_url, bukken_id = self.rows[key]
+        if not bukken_id:
+            return None
+        bukken_ids = self.ids(search_url)
+        if bukken_ids is None:
+            return None
+        if bukken_id in bukken_ids:
+            return True
+        return None if search_url in self.incomplete else False
+
+    def print_stats(self):
+        print(f"🗂️ 検索結果の索引: 検索URL {len(self.targets)} 件で {len(self.rows)} 行を判定"
+              f"（取得 {self._ids.calls} 回）")
@@ -1,11 +1,21 @@
 import gspread
 from google.oauth2.service_account import Credentials
-from suumo_scrape import extract_conditions_from_url
-from suumo_search_url import build_suumo_search_url
-from suumo_checker import find_matching_property, check_company_name
+from conditions_store import ConditionsStore
+from suumo_scrape import probe_listing
+from suumo_search_url import build_suumo_search_url, plan_combined_searches
+from suumo_checker import extract_bukken_id, listing_bukken_id, detail_url_for, find_listing_agency, COMPANY_NAME
+from http_client import CircuitOpenError, TransientFetchError, print_stats as print_http_stats
+from http_cache import prune as prune_http_cache, print_stats as print_cache_stats
+from fetch_engine import run_all
+from run_memo import SingleFlightMemo
+from search_index import SearchIndex
+from sheet_snapshot import SheetSnapshot
+from sheets_quota import quota
+from result_archive import archive_old_columns
+from station_crawl import StationCrawlIndex, plan_station_crawl
 import datetime
 import pytz
-import time
+import sys
 from gspread_formatting import CellFormat, Color, format_cell_range
 from gspread.utils import rowcol_to_a1
 from gspread_formatting import CellFormat, Color, format_cell_range
@@ -23,24 +33,71 @@ client = gspread.authorize(creds)
 
 # === 元シートのデータ取得関数 ===
 def get_source_data():
-    sheet = client.open_by_key(SPREADSHEET_ID_SOURCE).sheet1
-    result = sheet.get(SOURCE_RANGE)
+    spreadsheet = quota.read(client.open_by_key, SPREADSHEET_ID_SOURCE)
+    sheet = quota.read(lambda: spreadsheet.sheet1)
+    result = quota.read(sheet.get, SOURCE_RANGE)
     # 物件名, 部屋番号, 掲載ページURL（URLは10列目＝index9）
     return [(row[0], row[1], row[9]) for row in result if len(row) >= 10 and row[0] and row[9].startswith('http')]
 
+# D列がこの値の行は、条件を抽出し直して検索URLを作り直す
+RETRY_VALUES = ("抽出失敗", "URL失敗", "")
+
+# 再試行しても取得できなかった（TransientFetchError）ことを表す結果。その行はこの実行では書き込まない
+SKIPPED = object()
+
+def skip_transient(func):
+    """
+    func(item) が TransientFetchError を投げたら SKIPPED を返す関数にする（run_all で他の行の処理を止めないため）
+    """
+    def call(item):
+        try:
+            return func(item)
+        except TransientFetchError as e:
+            print(f"⏭️ 取得できなかったため見送り: {e}")
+            return SKIPPED
+    return call
+
+def search_url_cell_value(result):
+    """
+    条件抽出の結果から D列に書く値（検索URL / "URL失敗" / "抽出失敗"）を返す
+    """
+    if not result:
+        return "抽出失敗"
+    search_url = build_suumo_search_url(
+        station_info=result['stations'],
+        price=result['price'],
+        area_max=result['area'],
+        age_max=result['age'],
+        floor_plan=result['floor_plan']
+    )
+    return search_url or "URL失敗"
+
 # === メイン処理 ===
 def main():
-    target_sheet = client.open_by_key(SPREADSHEET_ID).worksheet(SHEET_NAME)
+    spreadsheet = quota.read(client.open_by_key, SPREADSHEET_ID)
+    target_sheet = quota.read(spreadsheet.worksheet, SHEET_NAME)
+
+    # シートは最初に1回だけ読み、以降は手元の写しを読み書きする
+    # 変わったセルはまとめて送る（途中で止まっても、それまでに決まった結果は送る）
+    snapshot = SheetSnapshot(spreadsheet, target_sheet)
+    try:
+        update_sheet(snapshot)
+    finally:
+        snapshot.sync()
+        snapshot.print_stats()
+        quota.print_stats()
+
+def update_sheet(snapshot):
+    # 掲載ページの条件抽出は保存済みの結果を優先し、1回の実行で URL ごとに1回だけ（手順4と6で共有）
+    conditions_store = ConditionsStore()
+    extract_conditions = SingleFlightMemo(conditions_store.extract)
 
     # 1. 元シートから最新データ取得
     source_data = get_source_data()
     source_keys = set(source_data)
 
-    # 2. 既存データ取得
-    existing_data = target_sheet.get_all_values()
-    existing_rows = existing_data[1:] if len(existing_data) >= 2 else []
-
-    existing_keys = {(row[0], row[1], row[2]) for row in existing_rows if len(row) >= 3}
+    # 2. 既存データ取得（読み込み済みの写しを使う）
+    existing_rows = snapshot.rows[1:]
 
     # 3. 不要行削除
     rows_to_delete = []
@@ -49,106 +106,176 @@ def main():
         if key not in source_keys:
             rows_to_delete.append(i)
 
+    # 連続した行は1つの範囲にまとめ、1回の API 呼び出しで削除する
     for row_idx in reversed(rows_to_delete):
         print(f"🗑️ 行 {row_idx} を削除")
-        target_sheet.delete_rows(row_idx)
-        time.sleep(1)
+    ranges = snapshot.delete_rows(rows_to_delete)
+    if ranges:
+        print(f"🗑️ {len(rows_to_delete)} 行（{ranges} 範囲）を削除")
 
-    # 4. 新規物件追加
-    all_values = target_sheet.get_all_values()
+    # 4. 新規物件追加（条件抽出は並行して行い、書き込みは元シートの順）
     existing_key_to_row = {
         (row[0], row[1], row[2]): idx
-        for idx, row in enumerate(all_values[1:], start=2)
+        for idx, row in enumerate(snapshot.rows[1:], start=2)
         if len(row) >= 3
     }
-    max_row = len(all_values)
-
-    for key in source_data:
-        if key not in existing_key_to_row:
-            max_row += 1
-            print(f"➕ 新規追加: {key}")
-            target_sheet.update(f"A{max_row}:C{max_row}", [list(key)])
-            url = key[2]
-            result = extract_conditions_from_url(url)
-
-            if result:
-                search_url = build_suumo_search_url(
-                    station_info=result['stations'],
-                    price=result['price'],
-                    area_max=result['area'],
-                    age_max=result['age'],
-                    floor_plan=result['floor_plan']
-                )
-                if search_url:
-                    target_sheet.update_cell(max_row, 4, search_url)
-                else:
-                    target_sheet.update_cell(max_row, 4, "URL失敗")
-            else:
-                target_sheet.update_cell(max_row, 4, "抽出失敗")
-            time.sleep(0.5)
-
-    # 5. 結果列作成
-    updated_data = target_sheet.get_all_values()
+
+    new_keys = [key for key in source_data if key not in existing_key_to_row]
+    new_results = run_all(skip_transient(extract_conditions), [key[2] for key in new_keys])
+
+    for key, result in zip(new_keys, new_results):
+        print(f"➕ 新規追加: {key}")
+        row = snapshot.append_row(list(key))
+        # 取得できなかった行は D列を空けておき、次の実行で抽出し直す
+        if result is not SKIPPED:
+            snapshot.set_cell(row, 4, search_url_cell_value(result))
+
+    # 5. 結果列作成（結果列が SUUMO_RESULT_COLUMNS_KEEP 列を超える分は、古い順にアーカイブへ移す）
+    archive_old_columns(snapshot.spreadsheet, snapshot.rows, snapshot.delete_columns)
+    updated_data = snapshot.rows
     max_col = max((len(row) for row in updated_data if any(cell.strip() for cell in row)), default=0)
     result_col_index = max_col + 1
-    if result_col_index > target_sheet.col_count:
-        target_sheet.add_cols(result_col_index - target_sheet.col_count)
+    snapshot.ensure_columns(result_col_index)
 
     timestamp = datetime.datetime.now(pytz.timezone('Asia/Tokyo')).strftime("%m-%d %H:%M")
-    target_sheet.update_cell(1, result_col_index, timestamp)
+    snapshot.set_cell(1, result_col_index, timestamp)
 
     # 6. 掲載チェック（D列が "http〜" or "抽出失敗" → 再抽出）
+    # 掲載URLの条件抽出は並行して行い、結果の書き込みは行の順
+    targets = []
     for i, row in enumerate(updated_data[1:], start=2):
         if len(row) < 4:
             continue
-
         d_val = row[3].strip()
-        should_retry = d_val in ["抽出失敗", "URL失敗", ""]
-
-        if should_retry:
-            print(f"🔁 再抽出: {row[2]}")
-            result = extract_conditions_from_url(row[2])
-            if result:
-                search_url = build_suumo_search_url(
-                    station_info=result['stations'],
-                    price=result['price'],
-                    area_max=result['area'],
-                    age_max=result['age'],
-                    floor_plan=result['floor_plan']
-                )
-                if search_url:
-                    target_sheet.update_cell(i, 4, search_url)
-                    d_val = search_url
-                else:
-                    target_sheet.update_cell(i, 4, "URL失敗")
+        if d_val in RETRY_VALUES or d_val.startswith("http"):
+            targets.append((i, row, d_val))
+        else:
+            print("⚠️ 無効なURL、スキップ")
+
+    # 掲載URLから物件IDが分かり、D列に検索URLもある行は掲載ページを読まずに済む
+    # 掲載終了かどうかだけを確認し、条件は保存済みのものがあれば検索をまとめるのに使う
+    # この実行ですでに取得・抽出した掲載URL（手順4で追加した行など）は確認せず、その結果を使う
+    probe_targets = [
+        t for t in targets
+        if t[2].startswith("http") and extract_bukken_id(t[1][2]) and t[1][2] not in extract_conditions
+    ]
+    extract_targets = [t for t in targets if t not in probe_targets]
+    listed = dict(zip([i for i, _, _ in probe_targets],
+                      run_all(probe_listing, [row[2] for _, row, _ in probe_targets])))
+    results = dict(zip([i for i, _, _ in extract_targets],
+                       run_all(skip_transient(extract_conditions), [row[2] for _, row, _ in extract_targets])))
+
+    checks = []  # (行番号, D列の検索URL, 抽出結果)
+    row_ids = {}
+    for i, row, d_val in targets:
+        if i in listed:
+            if listed[i] is False:
+                print(f"🚫 掲載終了: 行 {i}")
+                snapshot.set_cell(i, result_col_index, "掲載終了")
+                continue
+            record = conditions_store.get(row[2])
+            result = record[0] if record else {}
+        else:
+            result = results[i]
+            if result is SKIPPED:
+                continue
+            if d_val in RETRY_VALUES:
+                print(f"🔁 再抽出: {row[2]}")
+                d_val = search_url_cell_value(result)
+                snapshot.set_cell(i, 4, d_val)
+                if not d_val.startswith("http"):
                     continue
-            else:
-                target_sheet.update_cell(i, 4, "抽出失敗")
+
+            if not result:
+                print("⚠️ 抽出失敗（掲載URL）")
+                snapshot.set_cell(i, result_col_index, "抽出失敗")
                 continue
-            time.sleep(0.5)
+        checks.append((i, d_val, result))
+        row_ids[i] = listing_bukken_id(row[2], result)
+    if probe_targets:
+        print(f"🩺 掲載確認のみ: {len(probe_targets)} 行（掲載終了 {list(listed.values()).count(False)} 行）")
 
-        if not d_val.startswith("http"):
-            print("⚠️ 無効なURL、スキップ")
-            continue
+    candidates = []  # (行番号, 物件ID)
 
-        print(f"🔍 掲載チェック: {d_val}")
-        result = extract_conditions_from_url(row[2])
-        if not result:
-            print("⚠️ 抽出失敗（掲載URL）")
-            target_sheet.update_cell(i, result_col_index, "抽出失敗")
+    # 最寄りにしている行が多い駅は駅の検索結果を全部読み、その行は巡回結果で判定する
+    # 巡回で判定できなかった行（巡回の失敗・途中まで）は、下の条件付きの検索で判定する
+    crawl_stations, crawl_rows = plan_station_crawl([(i, result) for i, _, result in checks])
+    crawl_index = StationCrawlIndex()
+    run_all(crawl_index.crawl, crawl_stations)
+    crawl_decided = set()
+    for i in sorted(crawl_rows):
+        found = crawl_index.lookup(row_ids[i], crawl_rows[i])
+        if found:
+            candidates.append((i, row_ids[i]))
+        elif found is False:
+            print(f"🔍 一致なし: 行 {i}")
+        else:
             continue
+        crawl_decided.add(i)
+    checks = [check for check in checks if check[0] not in crawl_decided]
+
+    # 駅以外の条件が同じ行を、最寄駅をまとめた1つの検索にする
+    # まとめられなかった行は D列の検索URLをそのまま使う
+    searches = plan_combined_searches([(i, result) for i, _, result in checks])
+    planned_rows = {i for search in searches for i in search["keys"]}
+    searches += [{"url": d_val, "keys": [i]} for i, d_val, _ in checks if i not in planned_rows]
+
+    # 行を検索URLごとにまとめてから取得する（同じ検索URLは1回だけ取得し、各行は物件IDの有無で判定）
+    search_index = SearchIndex()
+    for search in searches:
+        for i in search["keys"]:
+            search_index.add(i, search["url"], row_ids[i])
+    groups = search_index.groups()
+    print(f"📦 検索ページ {len(groups)} 件で {len(checks)} 行をチェック")
 
-        detail_url = find_matching_property(d_val, result)
-        if detail_url:
-            if check_company_name(detail_url):
-                print("⭕️ 掲載あり")
-                target_sheet.update_cell(i, result_col_index, "⭕️")
-            else:
-                print("❌ 他社掲載")
+    # 検索ページの取得（並行）。探す物件IDがすべて見つかれば残りのページは読まない
+    search_index.fetch_all()
+
+    for search_url, keys in groups.items():
+        print(f"🔍 掲載チェック: {search_url}（{len(keys)}行）")
+        for i in keys:
+            found = search_index.lookup(i)
+            if found:
+                candidates.append((i, search_index.rows[i][1]))
+            elif found is False:
+                print(f"🔍 一致なし: 行 {i}")
+            elif search_url in search_index.incomplete:
+                print(f"⚠️ 検索結果を全部読めなかったため判定なし: 行 {i}")
+            elif search_url not in search_index.failed:
+                print(f"⚠️ 物件IDの抽出失敗: 行 {i}")
+
+    # 一致した物件の詳細ページで掲載会社を確認（並行）
+    candidates.sort()
+    agencies = run_all(skip_transient(find_listing_agency), [detail_url_for(bukken_id) for _, bukken_id in candidates])
+    for (i, _), agency in zip(candidates, agencies):
+        if agency is SKIPPED:
+            continue
+        if agency == COMPANY_NAME:
+            print(f"⭕️ 掲載あり: 行 {i}")
+            snapshot.set_cell(i, result_col_index, "⭕️")
+        elif agency:
+            # 他社の掲載と分かった場合はその社名を残す
+            print(f"❌ 他社掲載: 行 {i}（{agency}）")
+            snapshot.set_cell(i, result_col_index, agency)
         else:
-            print("🔍 一致なし")
+            print(f"❌ 他社掲載: 行 {i}")
 
-        time.sleep(1)
+    print(f"♻️ 条件抽出: 取得 {extract_conditions.calls} 回 / 再利用 {extract_conditions.saved} 回（削減したリクエスト数）")
+    crawl_index.print_stats()
+    crawl_index.close()
+    search_index.print_stats()
+    conditions_store.print_stats()
+    conditions_store.close()
+    print_http_stats()
+    # 古いキャッシュを消してから保存（actions/cache）させる
+    prune_http_cache()
+    print_cache_stats()
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except CircuitOpenError as e:
+        # 取得できなかった行に「抽出失敗」や「掲載なし」を書き込まずに止める
+        print(f"⛔ {e}")
+        print_http_stats()
+        sys.exit(1)
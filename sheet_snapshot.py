@@ -0,0 +1,112 @@
+# sheet_snapshot.py
+# ワークシートを1回だけ読み込んだ手元の写し
+#
+# 行の削除・追加・セルの書き込みは写しに反映し、シートへは変わったセルだけを送る
+# （同じ行の隣り合うセルは1つの範囲にまとめ、values.batchUpdate でまとめて送る）
+
+from gspread.utils import rowcol_to_a1
+from sheet_writer import BatchWriter, delete_columns, delete_rows
+from sheets_quota import quota
+
+class SheetSnapshot:
+    def __init__(self, spreadsheet, worksheet, writer=None):
+        self.spreadsheet = spreadsheet
+        self.worksheet = worksheet
+        self.writer = writer or BatchWriter(spreadsheet, worksheet)
+        self.rows = quota.read(worksheet.get_all_values)  # 1行目が見出し
+        self.col_count = worksheet.col_count  # シートの列数（値のない列も含む）
+        self.reads = 1
+        self.skipped = 0    # 値が変わらないので送らなかった書き込み
+        self._dirty = {}    # (行, 列) → (値, raw)
+
+    def value(self, row, col):
+        """
+        セルの値（行・列は1始まり。範囲外は ""）
+        """
+        if row > len(self.rows) or col > len(self.rows[row - 1]):
+            return ""
+        return self.rows[row - 1][col - 1]
+
+    def set_cell(self, row, col, value, raw=False):
+        """
+        セルに書き込む（raw=False なら update_cell と同じく USER_ENTERED で送る）
+        手元の値と同じで、まだ送っていない書き込みもなければ何もしない
+        """
+        if (row, col) not in self._dirty and self.value(row, col) == str(value):
+            self.skipped += 1
+            return
+        while len(self.rows) < row:
+            self.rows.append([])
+        cells = self.rows[row - 1]
+        if len(cells) < col:
+            cells.extend([""] * (col - len(cells)))
+        cells[col - 1] = str(value)
+        self._dirty[(row, col)] = (value, raw)
+
+    def append_row(self, values, raw=True):
+        """
+        最後の行の次に行を追加し、その行番号を返す
+        """
+        row = len(self.rows) + 1
+        for col, value in enumerate(values, start=1):
+            self.set_cell(row, col, value, raw)
+        return row
+
+    def delete_rows(self, row_numbers):
+        """
+        行を削除する（シートへは1回の batchUpdate で送る）。戻り値: 削除した範囲の数
+        """
+        row_numbers = set(row_numbers)
+        if not row_numbers:
+            return 0
+        # 送っていない書き込みは行番号がずれる前に送る
+        self.sync()
+        ranges = delete_rows(self.spreadsheet, self.worksheet, row_numbers)
+        self.rows = [row for i, row in enumerate(self.rows, start=1) if i not in row_numbers]
+        return ranges
+
+    def delete_columns(self, col_numbers):
+        """
+        列を削除する（シートへは1回の batchUpdate で送る）。戻り値: 削除した範囲の数
+        """
+        col_numbers = set(col_numbers)
+        if not col_numbers:
+            return 0
+        self.sync()
+        ranges = delete_columns(self.spreadsheet, self.worksheet, col_numbers)
+        self.rows = [
+            [cell for col, cell in enumerate(row, start=1) if col not in col_numbers]
+            for row in self.rows
+        ]
+        self.col_count -= len(col_numbers)
+        return ranges
+
+    def ensure_columns(self, count):
+        """
+        シートの列数が count 未満なら列を足す
+        """
+        if count > self.col_count:
+            quota.write(self.worksheet.add_cols, count - self.col_count)
+            self.col_count = count
+
+    def sync(self):
+        """
+        まだ送っていない書き込みをシートへ送る
+        """
+        runs = []  # (行, 開始列, raw, [値, ...])
+        for (row, col), (value, raw) in sorted(self._dirty.items()):
+            last = runs[-1] if runs else None
+            if last and last[0] == row and last[2] == raw and last[1] + len(last[3]) == col:
+                last[3].append(value)
+            else:
+                runs.append((row, col, raw, [value]))
+        for row, col, raw, values in runs:
+            range_name = f"{rowcol_to_a1(row, col)}:{rowcol_to_a1(row, col + len(values) - 1)}"
+            self.writer.update(range_name, [values], raw=raw)
+        # 送れなかった分は writer に残る（次の sync で一緒に送る）
+        self._dirty.clear()
+        self.writer.flush()
+
+    def print_stats(self):
+        print(f"📋 シートの読み込み {self.reads} 回 / 変更なしで省いた書き込み {self.skipped} 件")
+        self.writer.print_stats()
@@ -0,0 +1,121 @@
+# sheet_writer.py
+# ワークシートへのセルの書き込みをためて、values.batchUpdate でまとめて送る
+#
+# 環境変数
+#   SUUMO_SHEET_WRITE_CHUNK : この数の範囲がたまったら途中でも送る（0 = flush するまでためる）
+
+import os
+import time
+from gspread.utils import absolute_range_name, rowcol_to_a1
+from sheets_quota import quota
+
+WRITE_CHUNK = int(os.environ.get("SUUMO_SHEET_WRITE_CHUNK", "500"))
+
+class BatchWriter:
+    """
+    update_cell / update と同じ書き込みを受け付け、flush でまとめて API に送る
+    同じ範囲への書き込みは後のものだけが送られる
+    """
+    def __init__(self, spreadsheet, worksheet, chunk_size=WRITE_CHUNK):
+        self.spreadsheet = spreadsheet
+        self.worksheet = worksheet
+        self.chunk_size = chunk_size
+        self.calls = 0      # values.batchUpdate を呼んだ回数
+        self.writes = 0     # 受け付けた書き込みの数
+        self.elapsed = 0.0  # API 呼び出しにかかった秒数
+        # valueInputOption → {A1 範囲: 値}
+        self._pending = {"RAW": {}, "USER_ENTERED": {}}
+
+    def update_cell(self, row, col, value):
+        """
+        Worksheet.update_cell と同じ（値は USER_ENTERED で解釈される）
+        """
+        self.update(rowcol_to_a1(row, col), [[value]], raw=False)
+
+    def update(self, range_name, values, raw=True):
+        """
+        Worksheet.update と同じ（raw=True なら値をそのまま書き込む）
+        """
+        pending = self._pending["RAW" if raw else "USER_ENTERED"]
+        pending.pop(range_name, None)
+        pending[range_name] = values
+        self.writes += 1
+        if self.chunk_size and self.pending_count() >= self.chunk_size:
+            self.flush()
+
+    def pending_count(self):
+        return sum(len(pending) for pending in self._pending.values())
+
+    def flush(self):
+        """
+        ためた書き込みを送る（valueInputOption ごとに1回）。送れなかった分は残る
+        """
+        for option, pending in self._pending.items():
+            if not pending:
+                continue
+            data = [
+                {"range": absolute_range_name(self.worksheet.title, range_name), "values": values}
+                for range_name, values in pending.items()
+            ]
+            start = time.perf_counter()
+            try:
+                quota.write(self.spreadsheet.values_batch_update, body={"valueInputOption": option, "data": data})
+            finally:
+                self.calls += 1
+                self.elapsed += time.perf_counter() - start
+            pending.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    def print_stats(self):
+        print(f"📝 シート書き込み: {self.writes} 件を {self.calls} 回の API 呼び出しで送信"
+              f"（{self.elapsed:.1f} 秒）")
+
+def row_ranges(row_numbers):
+    """
+    行番号（1始まり）を連続した範囲にまとめ、下の範囲から順に返す: [(開始行, 終了行), ...]
+    列番号にも使える（右の範囲から順になる）
+    """
+    ranges = []
+    for row in sorted(set(row_numbers), reverse=True):
+        if ranges and ranges[-1][0] == row + 1:
+            ranges[-1] = (row, ranges[-1][1])
+        else:
+            ranges.append((row, row))
+    return ranges
+
+def delete_dimension(spreadsheet, worksheet, numbers, dimension):
+    """
+    行（dimension="ROWS"）または列（"COLUMNS"）をまとめて削除する
+    連続したものは1つの範囲にし、1回の batchUpdate で送る
+    後ろの範囲から消すので、まだ消していない行・列の番号はずれない
+    戻り値: 削除した範囲の数
+    """
+    ranges = row_ranges(numbers)
+    if not ranges:
+        return 0
+    requests = [
+        {
+            "deleteDimension": {
+                "range": {
+                    "sheetId": worksheet.id,
+                    "dimension": dimension,
+                    "startIndex": start - 1,
+                    "endIndex": end,
+                }
+            }
+        }
+        for start, end in ranges
+    ]
+    quota.write(spreadsheet.batch_update, {"requests": requests})
+    return len(ranges)
+
+def delete_rows(spreadsheet, worksheet, row_numbers):
+    return delete_dimension(spreadsheet, worksheet, row_numbers, "ROWS")
+
+def delete_columns(spreadsheet, worksheet, col_numbers):
+    return delete_dimension(spreadsheet, worksheet, col_numbers, "COLUMNS")
@@ -0,0 +1,96 @@
+# sheets_quota.py
+# Google Sheets API の呼び出しを、読み取り・書き込みそれぞれの分間クォータに収まるように送る
+#
+# クォータ（既定はユーザーごとの 60 回/分）をトークンバケットで守り、
+# それでも 429（Quota exceeded）や 5xx が返ったら待ち時間を倍にしながら再試行する
+#
+# 環境変数
+#   SUUMO_SHEETS_READS_PER_MIN  : 読み取りの分間上限（既定 60）
+#   SUUMO_SHEETS_WRITES_PER_MIN : 書き込みの分間上限（既定 60）
+
+import os
+import random
+import threading
+import time
+from gspread.exceptions import APIError
+
+READS_PER_MINUTE = float(os.environ.get("SUUMO_SHEETS_READS_PER_MIN", "60"))
+WRITES_PER_MINUTE = float(os.environ.get("SUUMO_SHEETS_WRITES_PER_MIN", "60"))
+# 続けて送れる数は 10 秒分（分間の枠を最初の数秒で使い切らないように）
+BURST_SECONDS = 10
+RETRIES = 5
+BACKOFF_BASE = 2
+BACKOFF_MAX = 64
+RETRY_STATUSES = (429, 500, 503)
+
+class TokenBucket:
+    """
+    1分あたり per_minute 個のトークンを補充し、1回の呼び出しで1個使う（スレッドセーフ）
+    """
+    def __init__(self, per_minute, burst_seconds=BURST_SECONDS):
+        self.rate = per_minute / 60
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        トークンを1個取る。足りなければ補充されるまで待つ。戻り値: 待った秒数
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+class SheetsQuota:
+    def __init__(self, reads_per_minute=READS_PER_MINUTE, writes_per_minute=WRITES_PER_MINUTE):
+        self.buckets = {"read": TokenBucket(reads_per_minute), "write": TokenBucket(writes_per_minute)}
+        self.calls = {"read": 0, "write": 0}
+        self.retries = 0
+        self.throttled = 0.0  # クォータのために待った秒数（トークン待ち + 429 後の待ち）
+        self._lock = threading.Lock()
+
+    def read(self, func, *args, **kwargs):
+        """
+        読み取りの API 呼び出し func(*args, **kwargs) をクォータに合わせて行う
+        """
+        return self._call("read", func, *args, **kwargs)
+
+    def write(self, func, *args, **kwargs):
+        """
+        書き込みの API 呼び出し func(*args, **kwargs) をクォータに合わせて行う
+        """
+        return self._call("write", func, *args, **kwargs)
+
+    def _call(self, kind, func, *args, **kwargs):
+        for attempt in range(RETRIES + 1):
+            waited = self.buckets[kind].acquire()
+            with self._lock:
+                self.calls[kind] += 1
+                self.throttled += waited
+            try:
+                return func(*args, **kwargs)
+            except APIError as e:
+                if e.response.status_code not in RETRY_STATUSES or attempt == RETRIES:
+                    raise
+                delay = min(BACKOFF_MAX, BACKOFF_BASE ** attempt) + random.uniform(0, 1)
+                print(f"⏳ Sheets API {e.response.status_code}: {delay:.1f} 秒待って再試行（{attempt + 1}/{RETRIES}）")
+                with self._lock:
+                    self.retries += 1
+                    self.throttled += delay
+                time.sleep(delay)
+
+    def print_stats(self):
+        print(f"⏳ Sheets API: 読み取り {self.calls['read']} 回 / 書き込み {self.calls['write']} 回"
+              f" / 再試行 {self.retries} 回 / 待ち時間 {self.throttled:.1f} 秒")
+
+# プロセス内で共有する（sheet_reader / ehomaki_checker / sheet_writer / sheet_snapshot）
+quota = SheetsQuota()
@@ -0,0 +1,144 @@
+# station_crawl.py
+# 駅ごとに賃貸の検索結果を全ページ読み、物件ID → 概要 の索引を作る（巡回モード）
+#
+# 同じ駅を最寄りにしている行が多いときは、行ごとに条件付きで検索するより
+# 駅の検索結果を一度全部読むほうがリクエストが少なくて済む。どちらで判定するかは plan_station_crawl が決める
+#
+# 環境変数
+#   SUUMO_CRAWL_MIN_ROWS  : この行数以上が最寄りにしている駅を巡回する（0 = 巡回しない）
+#   SUUMO_CRAWL_MAX_PAGES : 1駅で読む最大ページ数
+#   SUUMO_CRAWL_TTL       : 巡回結果を保存して次の実行でも使う秒数（0 = 保存しない）
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from http_cache import CACHE_DIR
+from suumo_checker import detail_url_for, fetch_bukken_ids
+from suumo_search_url import listing_stations, station_search_base_url
+
+CRAWL_MIN_ROWS = int(os.environ.get("SUUMO_CRAWL_MIN_ROWS", "20"))
+CRAWL_MAX_PAGES = int(os.environ.get("SUUMO_CRAWL_MAX_PAGES", "40"))
+CRAWL_TTL = int(os.environ.get("SUUMO_CRAWL_TTL", "0"))
+CRAWL_DB_PATH = os.path.join(CACHE_DIR, "crawl.sqlite3")
+
+def plan_station_crawl(rows, min_rows=None):
+    """
+    rows: [(キー, extract_conditions_from_url の結果), ...]
+    最寄駅ごとに行数を数え、まだ割り当てていない行が min_rows 以上残る駅から順に巡回する駅に選ぶ
+    戻り値: (巡回する駅のリスト（match_station の結果）, {キー: 駅コード}（巡回で判定する行）)
+    巡回で判定しない行は、これまでどおり条件付きの検索で判定する
+    """
+    min_rows = CRAWL_MIN_ROWS if min_rows is None else min_rows
+    if min_rows <= 0:
+        return [], {}
+
+    stations = {}      # 駅コード → match_station の結果
+    station_rows = {}  # 駅コード → [キー, ...]
+    for key, data in rows:
+        for match, _ in listing_stations(data.get("stations") or []):
+            stations[match["stationCode"]] = match
+            station_rows.setdefault(match["stationCode"], []).append(key)
+
+    crawl_stations = []
+    assigned = {}
+    for code in sorted(station_rows, key=lambda code: -len(station_rows[code])):
+        keys = [key for key in station_rows[code] if key not in assigned]
+        if len(keys) < min_rows:
+            continue
+        crawl_stations.append(stations[code])
+        for key in keys:
+            assigned[key] = code
+    return crawl_stations, assigned
+
+class StationCrawlIndex:
+    def __init__(self, path=CRAWL_DB_PATH, ttl=CRAWL_TTL, max_pages=CRAWL_MAX_PAGES):
+        self.ttl = ttl
+        self.max_pages = max_pages
+        self.listings = {}  # 物件ID → {"station": 駅コード, "url": 詳細ページ}
+        self.crawled = {}   # 駅コード → 見つかった物件数（巡回に失敗した駅は None）
+        self.incomplete = set()  # 全ページを読めなかった駅（max_pages で打ち切った・読めないページがあった）
+        self.stats = {"crawled": 0, "stored": 0}
+        self._lock = threading.Lock()
+        self._conn = None
+        if ttl > 0:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS crawl ("
+                " station_code TEXT PRIMARY KEY,"
+                " bukken_ids TEXT NOT NULL,"
+                " crawled_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def _load(self, code):
+        if self._conn is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT bukken_ids, crawled_at FROM crawl WHERE station_code = ?", (code,)
+            ).fetchone()
+        if row is None or time.time() - row[1] >= self.ttl:
+            return None
+        return set(json.loads(row[0]))
+
+    def _save(self, code, bukken_ids):
+        if self._conn is None:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO crawl (station_code, bukken_ids, crawled_at) VALUES (?, ?, ?)",
+                (code, json.dumps(sorted(bukken_ids)), time.time()),
+            )
+            self._conn.commit()
+
+    def crawl(self, station):
+        """
+        駅（match_station の結果）の検索結果を全ページ読み、索引に加える。保存済みで期限内ならそれを使う
+        全ページを読めなかった巡回結果は保存しない
+        """
+        code = station["stationCode"]
+        bukken_ids = self._load(code)
+        complete = True
+        if bukken_ids is not None:
+            stat = "stored"
+        else:
+            stat = "crawled"
+            url = station_search_base_url(station)
+            print(f"🚃 駅を巡回: {station['stationName']} {url}")
+            result = fetch_bukken_ids(url, max_pages=self.max_pages)
+            bukken_ids, complete = result if result else (None, False)
+            if complete:
+                self._save(code, bukken_ids)
+            elif bukken_ids is not None:
+                print(f"⚠️ 駅の巡回が途中まで（{len(bukken_ids)} 件）: {station['stationName']}")
+
+        with self._lock:
+            self.stats[stat] += 1
+            self.crawled[code] = None if bukken_ids is None else len(bukken_ids)
+            if not complete:
+                self.incomplete.add(code)
+            for bukken_id in bukken_ids or ():
+                self.listings.setdefault(bukken_id, {"station": code, "url": detail_url_for(bukken_id)})
+        return bukken_ids
+
+    def lookup(self, bukken_id, station_code):
+        """
+        巡回結果に物件IDがあれば True、なければ False。物件IDがないか、駅の巡回に失敗していれば None
+        全ページを読めなかった駅では、見つからなくても載っていないとは言えないので None
+        """
+        if not bukken_id or self.crawled.get(station_code) is None:
+            return None
+        if bukken_id in self.listings:
+            return True
+        return None if station_code in self.incomplete else False
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+
+    def print_stats(self):
+        print(f"🚃 駅の巡回: {self.stats['crawled']} 駅 / 保存済みを使用 {self.stats['stored']} 駅"
+              f" / 物件 {len(self.listings)} 件")
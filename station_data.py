@@ -0,0 +1,1011 @@
+# station_data.py
+# 駅データの元データ。変更したら python build_station_table.py で station_table.bin を再生成する
+
+stationData = [
+  { "lineCode": "0005", "stationCode": "000525620", "stationName": "東京", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000540650", "stationName": "有楽町", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000520110", "stationName": "新橋", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000531160", "stationName": "浜松町", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000523500", "stationName": "田町", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000584570", "stationName": "高輪ゲートウェイ", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000517460", "stationName": "品川", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000505780", "stationName": "大崎", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000514970", "stationName": "五反田", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000539110", "stationName": "目黒", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000505050", "stationName": "恵比寿", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000517640", "stationName": "渋谷", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000531250", "stationName": "原宿", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000541280", "stationName": "代々木", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000519670", "stationName": "新宿", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000519120", "stationName": "新大久保", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000522350", "stationName": "高田馬場", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000539120", "stationName": "目白", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000502060", "stationName": "池袋", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000506000", "stationName": "大塚", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000520550", "stationName": "巣鴨", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000515330", "stationName": "駒込", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000523410", "stationName": "田端", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000529160", "stationName": "西日暮里", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000529650", "stationName": "日暮里", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000504160", "stationName": "鶯谷", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000504030", "stationName": "上野", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000506530", "stationName": "御徒町", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000500480", "stationName": "秋葉原", "lineName": "ＪＲ山手線" },
+  { "lineCode": "0005", "stationCode": "000510270", "stationName": "神田", "lineName": "ＪＲ山手線" },
+
+  { "lineCode": "0125", "stationCode": "012500380", "stationName": "赤羽", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012531960", "stationName": "東十条", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012505180", "stationName": "王子", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012509240", "stationName": "上中里", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012523410", "stationName": "田端", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012529160", "stationName": "西日暮里", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012529650", "stationName": "日暮里", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012504160", "stationName": "鶯谷", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012504030", "stationName": "上野", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012506530", "stationName": "御徒町", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012500480", "stationName": "秋葉原", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012510270", "stationName": "神田", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012525620", "stationName": "東京", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012540650", "stationName": "有楽町", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012520110", "stationName": "新橋", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012531160", "stationName": "浜松町", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012523500", "stationName": "田町", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012584570", "stationName": "高輪ゲートウェイ", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012517460", "stationName": "品川", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012505480", "stationName": "大井町", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012506360", "stationName": "大森", "lineName": "ＪＲ京浜東北線" },
+  { "lineCode": "0125", "stationCode": "012508940", "stationName": "蒲田", "lineName": "ＪＲ京浜東北線" },
+
+  { "lineCode": "0160", "stationCode": "016025620", "stationName": "東京", "lineName": "ＪＲ東海道本線" },
+  { "lineCode": "0160", "stationCode": "016020110", "stationName": "新橋", "lineName": "ＪＲ東海道本線" },
+  { "lineCode": "0160", "stationCode": "016017460", "stationName": "品川", "lineName": "ＪＲ東海道本線" },
+
+  { "lineCode": "0500", "stationCode": "050017460", "stationName": "品川", "lineName": "ＪＲ常磐線" },
+  { "lineCode": "0500", "stationCode": "050020110", "stationName": "新橋", "lineName": "ＪＲ常磐線" },
+  { "lineCode": "0500", "stationCode": "050025620", "stationName": "東京", "lineName": "ＪＲ常磐線" },
+  { "lineCode": "0500", "stationCode": "050004030", "stationName": "上野", "lineName": "ＪＲ常磐線" },
+  { "lineCode": "0500", "stationCode": "050029650", "stationName": "日暮里", "lineName": "ＪＲ常磐線" },
+  { "lineCode": "0500", "stationCode": "050036460", "stationName": "三河島", "lineName": "ＪＲ常磐線" },
+  { "lineCode": "0500", "stationCode": "050037600", "stationName": "南千住", "lineName": "ＪＲ常磐線" },
+  { "lineCode": "0500", "stationCode": "050011310", "stationName": "北千住", "lineName": "ＪＲ常磐線" },
+  { "lineCode": "0500", "stationCode": "050001370", "stationName": "綾瀬", "lineName": "ＪＲ常磐線" },
+  { "lineCode": "0500", "stationCode": "050009490", "stationName": "亀有", "lineName": "ＪＲ常磐線" },
+  { "lineCode": "0500", "stationCode": "050008700", "stationName": "金町", "lineName": "ＪＲ常磐線" },
+
+  { "lineCode": "0185", "stationCode": "018540120", "stationName": "矢野口", "lineName": "ＪＲ南武線" },
+  { "lineCode": "0185", "stationCode": "018503240", "stationName": "稲城長沼", "lineName": "ＪＲ南武線" },
+  { "lineCode": "0185", "stationCode": "018537650", "stationName": "南多摩", "lineName": "ＪＲ南武線" },
+  { "lineCode": "0185", "stationCode": "018534360", "stationName": "府中本町", "lineName": "ＪＲ南武線" },
+  { "lineCode": "0185", "stationCode": "018534560", "stationName": "分倍河原", "lineName": "ＪＲ南武線" },
+  { "lineCode": "0185", "stationCode": "018542410", "stationName": "西府", "lineName": "ＪＲ南武線" },
+  { "lineCode": "0185", "stationCode": "018540200", "stationName": "谷保", "lineName": "ＪＲ南武線" },
+  { "lineCode": "0185", "stationCode": "018539710", "stationName": "矢川", "lineName": "ＪＲ南武線" },
+  { "lineCode": "0185", "stationCode": "018528700", "stationName": "西国立", "lineName": "ＪＲ南武線" },
+  { "lineCode": "0185", "stationCode": "018523100", "stationName": "立川", "lineName": "ＪＲ南武線" },
+
+  { "lineCode": "0190", "stationCode": "019028070", "stationName": "成瀬", "lineName": "ＪＲ横浜線" },
+  { "lineCode": "0190", "stationCode": "019035780", "stationName": "町田", "lineName": "ＪＲ横浜線" },
+  { "lineCode": "0190", "stationCode": "019000130", "stationName": "相原", "lineName": "ＪＲ横浜線" },
+  { "lineCode": "0190", "stationCode": "019030670", "stationName": "八王子みなみ野", "lineName": "ＪＲ横浜線" },
+
+  { "lineCode": "0190", "stationCode": "019008370", "stationName": "片倉", "lineName": "ＪＲ横浜線" },
+  { "lineCode": "0190", "stationCode": "019030660", "stationName": "八王子", "lineName": "ＪＲ横浜線" },
+
+  { "lineCode": "0120", "stationCode": "012025620", "stationName": "東京", "lineName": "ＪＲ横須賀線" },
+  { "lineCode": "0120", "stationCode": "012020110", "stationName": "新橋", "lineName": "ＪＲ横須賀線" },
+  { "lineCode": "0120", "stationCode": "012017460", "stationName": "品川", "lineName": "ＪＲ横須賀線" },
+  { "lineCode": "0120", "stationCode": "012028400", "stationName": "西大井", "lineName": "ＪＲ横須賀線" },
+
+  { "lineCode": "0305", "stationCode": "030525620", "stationName": "東京", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030510270", "stationName": "神田", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030506970", "stationName": "御茶ノ水", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030520470", "stationName": "水道橋", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030501820", "stationName": "飯田橋", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030502980", "stationName": "市ケ谷", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030541160", "stationName": "四ツ谷", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030517470", "stationName": "信濃町", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030521520", "stationName": "千駄ケ谷", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030541280", "stationName": "代々木", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030519670", "stationName": "新宿", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030505600", "stationName": "大久保", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030532110", "stationName": "東中野", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030527280", "stationName": "中野", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030513930", "stationName": "高円寺", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030500640", "stationName": "阿佐ケ谷", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030506640", "stationName": "荻窪", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030528500", "stationName": "西荻窪", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030511640", "stationName": "吉祥寺", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030536880", "stationName": "三鷹", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030538740", "stationName": "武蔵境", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030531920", "stationName": "東小金井", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030538710", "stationName": "武蔵小金井", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030514690", "stationName": "国分寺", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030528740", "stationName": "西国分寺", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030512780", "stationName": "国立", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030523100", "stationName": "立川", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030532940", "stationName": "日野", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030526550", "stationName": "豊田", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030530660", "stationName": "八王子", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030529300", "stationName": "西八王子", "lineName": "ＪＲ中央線" },
+  { "lineCode": "0305", "stationCode": "030522180", "stationName": "高尾", "lineName": "ＪＲ中央線" },
+
+
+  { "lineCode": "0325", "stationCode": "032523100", "stationName": "立川", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032529020", "stationName": "西立川", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032532090", "stationName": "東中神", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032526970", "stationName": "中神", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032500460", "stationName": "昭島", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032530150", "stationName": "拝島", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032504240", "stationName": "牛浜", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032534390", "stationName": "福生", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032531170", "stationName": "羽村", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032506800", "stationName": "小作", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032508860", "stationName": "河辺", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032531680", "stationName": "東青梅", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032505340", "stationName": "青梅", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032538310", "stationName": "宮ノ平", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032532920", "stationName": "日向和田", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032502140", "stationName": "石神前", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032534260", "stationName": "二俣尾", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032501940", "stationName": "軍畑", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032516630", "stationName": "沢井", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032536910", "stationName": "御嶽", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032509830", "stationName": "川井", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032515490", "stationName": "古里", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032530870", "stationName": "鳩ノ巣", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032518970", "stationName": "白丸", "lineName": "ＪＲ青梅線" },
+  { "lineCode": "0325", "stationCode": "032506680", "stationName": "奥多摩", "lineName": "ＪＲ青梅線" },
+
+  { "lineCode": "0330", "stationCode": "033030150", "stationName": "拝島", "lineName": "ＪＲ五日市線" },
+  { "lineCode": "0330", "stationCode": "033012850", "stationName": "熊川", "lineName": "ＪＲ五日市線" },
+  { "lineCode": "0330", "stationCode": "033031560", "stationName": "東秋留", "lineName": "ＪＲ五日市線" },
+  { "lineCode": "0330", "stationCode": "033000450", "stationName": "秋川", "lineName": "ＪＲ五日市線" },
+  { "lineCode": "0330", "stationCode": "033038830", "stationName": "武蔵引田", "lineName": "ＪＲ五日市線" },
+  { "lineCode": "0330", "stationCode": "033038850", "stationName": "武蔵増戸", "lineName": "ＪＲ五日市線" },
+  { "lineCode": "0330", "stationCode": "033038690", "stationName": "武蔵五日市", "lineName": "ＪＲ五日市線" },
+
+  { "lineCode": "0335", "stationCode": "033534360", "stationName": "府中本町", "lineName": "ＪＲ武蔵野線" },
+  { "lineCode": "0335", "stationCode": "033511550", "stationName": "北府中", "lineName": "ＪＲ武蔵野線" },
+  { "lineCode": "0335", "stationCode": "033528740", "stationName": "西国分寺", "lineName": "ＪＲ武蔵野線" },
+  { "lineCode": "0335", "stationCode": "033519530", "stationName": "新小平", "lineName": "ＪＲ武蔵野線" },
+  { "lineCode": "0335", "stationCode": "033518980", "stationName": "新秋津", "lineName": "ＪＲ武蔵野線" },
+
+  { "lineCode": "0340", "stationCode": "034030660", "stationName": "八王子", "lineName": "ＪＲ八高線" },
+  { "lineCode": "0340", "stationCode": "034011490", "stationName": "北八王子", "lineName": "ＪＲ八高線" },
+  { "lineCode": "0340", "stationCode": "034015390", "stationName": "小宮", "lineName": "ＪＲ八高線" },
+  { "lineCode": "0340", "stationCode": "034030150", "stationName": "拝島", "lineName": "ＪＲ八高線" },
+  { "lineCode": "0340", "stationCode": "034032340", "stationName": "東福生", "lineName": "ＪＲ八高線" },
+  { "lineCode": "0340", "stationCode": "034030400", "stationName": "箱根ケ崎", "lineName": "ＪＲ八高線" },
+
+  { "lineCode": "0395", "stationCode": "039528400", "stationName": "西大井", "lineName": "ＪＲ埼京線" },
+  { "lineCode": "0395", "stationCode": "039505780", "stationName": "大崎", "lineName": "ＪＲ埼京線" },
+  { "lineCode": "0395", "stationCode": "039505050", "stationName": "恵比寿", "lineName": "ＪＲ埼京線" },
+  { "lineCode": "0395", "stationCode": "039517640", "stationName": "渋谷", "lineName": "ＪＲ埼京線" },
+  { "lineCode": "0395", "stationCode": "039519670", "stationName": "新宿", "lineName": "ＪＲ埼京線" },
+  { "lineCode": "0395", "stationCode": "039502060", "stationName": "池袋", "lineName": "ＪＲ埼京線" },
+  { "lineCode": "0395", "stationCode": "039502890", "stationName": "板橋", "lineName": "ＪＲ埼京線" },
+  { "lineCode": "0395", "stationCode": "039518440", "stationName": "十条", "lineName": "ＪＲ埼京線" },
+  { "lineCode": "0395", "stationCode": "039500380", "stationName": "赤羽", "lineName": "ＪＲ埼京線" },
+  { "lineCode": "0395", "stationCode": "039510870", "stationName": "北赤羽", "lineName": "ＪＲ埼京線" },
+  { "lineCode": "0395", "stationCode": "039504140", "stationName": "浮間舟渡", "lineName": "ＪＲ埼京線" },
+
+  { "lineCode": "0405", "stationCode": "040525620", "stationName": "東京", "lineName": "ＪＲ高崎線" },
+  { "lineCode": "0405", "stationCode": "040504030", "stationName": "上野", "lineName": "ＪＲ高崎線" },
+  { "lineCode": "0405", "stationCode": "040506650", "stationName": "尾久", "lineName": "ＪＲ高崎線" },
+  { "lineCode": "0405", "stationCode": "040500380", "stationName": "赤羽", "lineName": "ＪＲ高崎線" },
+
+  { "lineCode": "0575", "stationCode": "057513900", "stationName": "小岩", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0575", "stationCode": "057519450", "stationName": "新小岩", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0575", "stationCode": "05753190", "stationName": "平井", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0575", "stationCode": "057509500", "stationName": "亀戸", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0575", "stationCode": "057512220", "stationName": "錦糸町", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0575", "stationCode": "057541380", "stationName": "両国", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0575", "stationCode": "057500680", "stationName": "浅草橋", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0575", "stationCode": "057500480", "stationName": "秋葉原", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057306970", "stationName": "御茶ノ水", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057320470", "stationName": "水道橋", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057301820", "stationName": "飯田橋", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057302980", "stationName": "市ケ谷", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057341160", "stationName": "四ツ谷", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057317470", "stationName": "信濃町", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057321520", "stationName": "千駄ケ谷", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057341280", "stationName": "代々木", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057319670", "stationName": "新宿", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057305600", "stationName": "大久保", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057332110", "stationName": "東中野", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057327280", "stationName": "中野", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057313930", "stationName": "高円寺", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057300640", "stationName": "阿佐ケ谷", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057306640", "stationName": "荻窪", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057328500", "stationName": "西荻窪", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057311640", "stationName": "吉祥寺", "lineName": "ＪＲ総武線" },
+  { "lineCode": "0573", "stationCode": "057336880", "stationName": "三鷹", "lineName": "ＪＲ総武線" },
+
+  { "lineCode": "0580", "stationCode": "058025620", "stationName": "東京", "lineName": "ＪＲ総武線快速" },
+  { "lineCode": "0580", "stationCode": "058020080", "stationName": "新日本橋", "lineName": "ＪＲ総武線快速" },
+  { "lineCode": "0580", "stationCode": "058030330", "stationName": "馬喰町", "lineName": "ＪＲ総武線快速" },
+  { "lineCode": "0580", "stationCode": "058012220", "stationName": "錦糸町", "lineName": "ＪＲ総武線快速" },
+  { "lineCode": "0580", "stationCode": "058019450", "stationName": "新小岩", "lineName": "ＪＲ総武線快速" },
+
+
+  { "lineCode": "0600", "stationCode": "060025620", "stationName": "東京", "lineName": "ＪＲ京葉線" },
+  { "lineCode": "0600", "stationCode": "060030820", "stationName": "八丁堀", "lineName": "ＪＲ京葉線" },
+  { "lineCode": "0600", "stationCode": "060004910", "stationName": "越中島", "lineName": "ＪＲ京葉線" },
+  { "lineCode": "0600", "stationCode": "060017090", "stationName": "潮見", "lineName": "ＪＲ京葉線" },
+  { "lineCode": "0600", "stationCode": "060019330", "stationName": "新木場", "lineName": "ＪＲ京葉線" },
+  { "lineCode": "0600", "stationCode": "060007770", "stationName": "葛西臨海公園", "lineName": "ＪＲ京葉線" },
+
+  { "lineCode": "7580", "stationCode": "758000380", "stationName": "赤羽", "lineName": "湘南新宿ライン宇須" },
+  { "lineCode": "7580", "stationCode": "758002060", "stationName": "池袋", "lineName": "湘南新宿ライン宇須" },
+  { "lineCode": "7580", "stationCode": "758019670", "stationName": "新宿", "lineName": "湘南新宿ライン宇須" },
+  { "lineCode": "7580", "stationCode": "758017640", "stationName": "渋谷", "lineName": "湘南新宿ライン宇須" },
+  { "lineCode": "7580", "stationCode": "758005050", "stationName": "恵比寿", "lineName": "湘南新宿ライン宇須" },
+  { "lineCode": "7580", "stationCode": "758005780", "stationName": "大崎", "lineName": "湘南新宿ライン宇須" },
+  { "lineCode": "7580", "stationCode": "758028400", "stationName": "西大井", "lineName": "湘南新宿ライン宇須" },
+  { "lineCode": "7585", "stationCode": "758500380", "stationName": "赤羽", "lineName": "湘南新宿ライン高海" },
+  { "lineCode": "7585", "stationCode": "758502060", "stationName": "池袋", "lineName": "湘南新宿ライン高海" },
+  { "lineCode": "7585", "stationCode": "758519670", "stationName": "新宿", "lineName": "湘南新宿ライン高海" },
+  { "lineCode": "7585", "stationCode": "758517640", "stationName": "渋谷", "lineName": "湘南新宿ライン高海" },
+  { "lineCode": "7585", "stationCode": "758505050", "stationName": "恵比寿", "lineName": "湘南新宿ライン高海" },
+  { "lineCode": "7585", "stationCode": "758505780", "stationName": "大崎", "lineName": "湘南新宿ライン高海" },
+
+  { "lineCode": "0010", "stationCode": "001017640", "stationName": "渋谷", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001007240", "stationName": "表参道", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001007450", "stationName": "外苑前", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001002500", "stationName": "青山一丁目", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001003200", "stationName": "赤坂見附", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001023660", "stationName": "溜池山王", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001026650", "stationName": "虎ノ門", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001020110", "stationName": "新橋", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001012200", "stationName": "銀座", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001012060", "stationName": "京橋", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001029710", "stationName": "日本橋", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001036980", "stationName": "三越前", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001010270", "stationName": "神田", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001020510", "stationName": "末広町", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001004070", "stationName": "上野広小路", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001004030", "stationName": "上野", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001003430", "stationName": "稲荷町", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001023730", "stationName": "田原町", "lineName": "東京メトロ銀座線" },
+  { "lineCode": "0010", "stationCode": "001000670", "stationName": "浅草", "lineName": "東京メトロ銀座線" },
+
+  { "lineCode": "0015", "stationCode": "001502060", "stationName": "池袋", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001519160", "stationName": "新大塚", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001538430", "stationName": "茗荷谷", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001514430", "stationName": "後楽園", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001535340", "stationName": "本郷三丁目", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001506970", "stationName": "御茶ノ水", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001501720", "stationName": "淡路町", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001506050", "stationName": "大手町", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001525620", "stationName": "東京", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001512200", "stationName": "銀座", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001508290", "stationName": "霞ケ関", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001515020", "stationName": "国会議事堂前", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001500320", "stationName": "赤坂見附", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001541160", "stationName": "四ツ谷", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001541170", "stationName": "四谷三丁目", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001519680", "stationName": "新宿御苑前", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001519690", "stationName": "新宿三丁目", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001519670", "stationName": "新宿", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001528860", "stationName": "西新宿", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001527320", "stationName": "中野坂上", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001527360", "stationName": "中野新橋", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001527380", "stationName": "中野富士見町", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001534900", "stationName": "方南町", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001520030", "stationName": "新中野", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001531910", "stationName": "東高円寺", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001519470", "stationName": "新高円寺", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001537270", "stationName": "南阿佐ケ谷", "lineName": "東京メトロ丸ノ内線" },
+  { "lineCode": "0015", "stationCode": "001506640", "stationName": "荻窪", "lineName": "東京メトロ丸ノ内線" },
+
+  { "lineCode": "0020", "stationCode": "002027580", "stationName": "中目黒", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002005050", "stationName": "恵比寿", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002033410", "stationName": "広尾", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002041560", "stationName": "六本木", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002009450", "stationName": "神谷町", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002084580", "stationName": "虎ノ門ヒルズ", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002008290", "stationName": "霞ケ関", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002033040", "stationName": "日比谷", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002012200", "stationName": "銀座", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002031870", "stationName": "東銀座", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002024620", "stationName": "築地", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002030820", "stationName": "八丁堀", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002009680", "stationName": "茅場町", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002029780", "stationName": "人形町", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002015070", "stationName": "小伝馬町", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002000480", "stationName": "秋葉原", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002026940", "stationName": "仲御徒町", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002004030", "stationName": "上野", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002003760", "stationName": "入谷", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002038130", "stationName": "三ノ輪", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002037600", "stationName": "南千住", "lineName": "東京メトロ日比谷線" },
+  { "lineCode": "0020", "stationCode": "002011310", "stationName": "北千住", "lineName": "東京メトロ日比谷線" },
+
+  { "lineCode": "0025", "stationCode": "002527280", "stationName": "中野", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002506940", "stationName": "落合", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002522350", "stationName": "高田馬場", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002541750", "stationName": "早稲田", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002507710", "stationName": "神楽坂", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002501820", "stationName": "飯田橋", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002512720", "stationName": "九段下", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002522950", "stationName": "竹橋", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002506050", "stationName": "大手町", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002529710", "stationName": "日本橋", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002509680", "stationName": "茅場町", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002539600", "stationName": "門前仲町", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002511770", "stationName": "木場", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002525900", "stationName": "東陽町", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002537570", "stationName": "南砂町", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002528520", "stationName": "西葛西", "lineName": "東京メトロ東西線" },
+  { "lineCode": "0025", "stationCode": "002507760", "stationName": "葛西", "lineName": "東京メトロ東西線" },
+
+  { "lineCode": "0030", "stationCode": "003041290", "stationName": "代々木上原", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003041300", "stationName": "代々木公園", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003039010", "stationName": "明治神宮前", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003007240", "stationName": "表参道", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003030010", "stationName": "乃木坂", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003000300", "stationName": "赤坂", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003015020", "stationName": "国会議事堂前", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003008290", "stationName": "霞ケ関", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003033040", "stationName": "日比谷", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003029480", "stationName": "二重橋前", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003006050", "stationName": "大手町", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003019190", "stationName": "新御茶ノ水", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003040710", "stationName": "湯島", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003029860", "stationName": "根津", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003021530", "stationName": "千駄木", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003029160", "stationName": "西日暮里", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003035790", "stationName": "町屋", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003011310", "stationName": "北千住", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003001370", "stationName": "綾瀬", "lineName": "東京メトロ千代田線" },
+  { "lineCode": "0030", "stationCode": "003010900", "stationName": "北綾瀬", "lineName": "東京メトロ千代田線" },
+
+
+  { "lineCode": "0040", "stationCode": "004019330", "stationName": "新木場", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004023180", "stationName": "辰巳", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004026540", "stationName": "豊洲", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004024650", "stationName": "月島", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004019980", "stationName": "新富町", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004012210", "stationName": "銀座一丁目", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004040650", "stationName": "有楽町", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004016170", "stationName": "桜田門", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004027210", "stationName": "永田町", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004014020", "stationName": "麹町", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004002980", "stationName": "市ケ谷", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004002980", "stationName": "市ヶ谷", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004001820", "stationName": "飯田橋", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004004940", "stationName": "江戸川橋", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004014760", "stationName": "護国寺", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004031600", "stationName": "東池袋", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004002060", "stationName": "池袋", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004008710", "stationName": "要町", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004021350", "stationName": "千川", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004014950", "stationName": "小竹向原", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004032630", "stationName": "氷川台", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004034660", "stationName": "平和台", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004004750", "stationName": "地下鉄赤塚", "lineName": "東京メトロ有楽町線" },
+  { "lineCode": "0040", "stationCode": "004004760", "stationName": "地下鉄成増", "lineName": "東京メトロ有楽町線" },
+
+  { "lineCode": "0045", "stationCode": "004517640", "stationName": "渋谷", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004507240", "stationName": "表参道", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004500250", "stationName": "青山一丁目", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004527210", "stationName": "永田町", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004531420", "stationName": "半蔵門", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004512720", "stationName": "九段下", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004520210", "stationName": "神保町", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004506050", "stationName": "大手町", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004536980", "stationName": "三越前", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004520460", "stationName": "水天宮前", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004550050", "stationName": "清澄白河", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004520870", "stationName": "住吉", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004553960", "stationName": "錦糸町", "lineName": "東京メトロ半蔵門線" },
+  { "lineCode": "0045", "stationCode": "004506820", "stationName": "押上", "lineName": "東京メトロ半蔵門線" },
+
+  { "lineCode": "0050", "stationCode": "005039110", "stationName": "目黒", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005018930", "stationName": "白金台", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005018940", "stationName": "白金高輪", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005000800", "stationName": "麻布十番", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005041570", "stationName": "六本木一丁目", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005023660", "stationName": "溜池山王", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005027210", "stationName": "永田町", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005041160", "stationName": "四ツ谷", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005002980", "stationName": "市ケ谷", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005001820", "stationName": "飯田橋", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005014430", "stationName": "後楽園", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005025730", "stationName": "東大前", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005035370", "stationName": "本駒込", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005015330", "stationName": "駒込", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005028560", "stationName": "西ケ原", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005005180", "stationName": "王子", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005005830", "stationName": "王子神谷", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "005017810", "stationName": "志茂", "lineName": "東京メトロ南北線" },
+  { "lineCode": "0050", "stationCode": "000500390", "stationName": "赤羽岩淵", "lineName": "東京メトロ南北線" },
+
+  {"lineCode": "0043", "stationCode": "004317640", "stationName": "渋谷", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004339010", "stationName": "明治神宮前", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004380835", "stationName": "北参道", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004319690", "stationName": "新宿三丁目", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004350015", "stationName": "東新宿", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004380840", "stationName": "西早稲田", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004380845", "stationName": "雑司が谷", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004302060", "stationName": "池袋", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004308710", "stationName": "要町", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004321350", "stationName": "千川", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004314950", "stationName": "小竹向原", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004332630", "stationName": "氷川台", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004334660", "stationName": "平和台", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004304750", "stationName": "地下鉄赤塚", "lineName": "東京メトロ副都心線"},
+  {"lineCode": "0043", "stationCode": "004304760", "stationName": "地下鉄成増", "lineName": "東京メトロ副都心線"},
+
+  {"lineCode": "0035", "stationCode": "003514950", "stationName": "小竹向原", "lineName": "西武有楽町線"},
+  {"lineCode": "0035", "stationCode": "003519600", "stationName": "新桜台", "lineName": "西武有楽町線"},
+  {"lineCode": "0035", "stationCode": "003529900", "stationName": "練馬", "lineName": "西武有楽町線"},
+
+  {"lineCode": "0350", "stationCode": "035021050", "stationName": "西武新宿", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035022350", "stationName": "高田馬場", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035017990", "stationName": "下落合", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035026830", "stationName": "中井", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035001440", "stationName": "新井薬師前", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035029830", "stationName": "沼袋", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035029980", "stationName": "野方", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035026720", "stationName": "都立家政", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035015990", "stationName": "鷺ノ宮", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035017860", "stationName": "下井草", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035001870", "stationName": "井荻", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035009040", "stationName": "上井草", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035009200", "stationName": "上石神井", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035038780", "stationName": "武蔵関", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035032310", "stationName": "東伏見", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035021080", "stationName": "西武柳沢", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035023300", "stationName": "田無", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035030900", "stationName": "花小金井", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035014930", "stationName": "小平", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035012930", "stationName": "久米川", "lineName": "西武新宿線"},
+  {"lineCode": "0350", "stationCode": "035032490", "stationName": "東村山", "lineName": "西武新宿線"},
+
+  {"lineCode": "0370", "stationCode": "037002060", "stationName": "池袋", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037016970", "stationName": "椎名町", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037032100", "stationName": "東長崎", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037004830", "stationName": "江古田", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037016150", "stationName": "桜台", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037029900", "stationName": "練馬", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037027570", "stationName": "中村橋", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037034040", "stationName": "富士見台", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037029920", "stationName": "練馬高野台", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037018350", "stationName": "石神井公園", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037005440", "stationName": "大泉学園", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037034910", "stationName": "保谷", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037033000", "stationName": "ひばりヶ丘", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037031890", "stationName": "東久留米", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037012120", "stationName": "清瀬", "lineName": "西武池袋線"},
+  {"lineCode": "0370", "stationCode": "037000470", "stationName": "秋津", "lineName": "西武池袋線"},
+
+  {"lineCode": "0355", "stationCode": "035514930", "stationName": "小平", "lineName": "西武拝島線"},
+  {"lineCode": "0355", "stationCode": "035530230", "stationName": "萩山", "lineName": "西武拝島線"},
+  {"lineCode": "0355", "stationCode": "035506610", "stationName": "小川", "lineName": "西武拝島線"},
+  {"lineCode": "0355", "stationCode": "035532550", "stationName": "東大和市", "lineName": "西武拝島線"},
+  {"lineCode": "0355", "stationCode": "035523470", "stationName": "玉川上水", "lineName": "西武拝島線"},
+  {"lineCode": "0355", "stationCode": "035538770", "stationName": "武蔵砂川", "lineName": "西武拝島線"},
+  {"lineCode": "0355", "stationCode": "035521060", "stationName": "西武立川", "lineName": "西武拝島線"},
+  {"lineCode": "0355", "stationCode": "035530150", "stationName": "拝島", "lineName": "西武拝島線"},
+
+  {"lineCode": "0365", "stationCode": "036521090", "stationName": "多摩湖", "lineName": "西武山口線"},
+
+  {"lineCode": "0320", "stationCode": "032014690", "stationName": "国分寺", "lineName": "西武国分寺線"},
+  {"lineCode": "0320", "stationCode": "032013850", "stationName": "恋ヶ窪", "lineName": "西武国分寺線"},
+  {"lineCode": "0320", "stationCode": "032022490", "stationName": "鷹の台", "lineName": "西武国分寺線"},
+  {"lineCode": "0320", "stationCode": "032006610", "stationName": "小川", "lineName": "西武国分寺線"},
+  {"lineCode": "0320", "stationCode": "032032490", "stationName": "東村山", "lineName": "西武国分寺線"},
+
+  {"lineCode": "0310", "stationCode": "031038740", "stationName": "武蔵境", "lineName": "西武多摩川線"},
+  {"lineCode": "0310", "stationCode": "031019510", "stationName": "新小金井", "lineName": "西武多摩川線"},
+  {"lineCode": "0310", "stationCode": "031023590", "stationName": "多磨", "lineName": "西武多摩川線"},
+  {"lineCode": "0310", "stationCode": "031011360", "stationName": "白糸台", "lineName": "西武多摩川線"},
+  {"lineCode": "0310", "stationCode": "031011990", "stationName": "競艇場前", "lineName": "西武多摩川線"},
+  {"lineCode": "0310", "stationCode": "031015520", "stationName": "是政", "lineName": "西武多摩川線"},
+
+
+  {"lineCode": "0315", "stationCode": "031514690", "stationName": "国分寺", "lineName": "西武多摩湖線"},
+  {"lineCode": "0315", "stationCode": "031532880", "stationName": "一橋学園", "lineName": "西武多摩湖線"},
+  {"lineCode": "0315", "stationCode": "031505350", "stationName": "青梅街道", "lineName": "西武多摩湖線"},
+  {"lineCode": "0315", "stationCode": "031530230", "stationName": "萩山", "lineName": "西武多摩湖線"},
+  {"lineCode": "0315", "stationCode": "031539850", "stationName": "八坂", "lineName": "西武多摩湖線"},
+  {"lineCode": "0315", "stationCode": "031538870", "stationName": "武蔵大和", "lineName": "西武多摩湖線"},
+  {"lineCode": "0315", "stationCode": "031521090", "stationName": "多摩湖", "lineName": "西武多摩湖線"},
+
+  {"lineCode": "0385", "stationCode": "038502060", "stationName": "池袋", "lineName": "東武東上線"},
+  {"lineCode": "0385", "stationCode": "038510930", "stationName": "北池袋", "lineName": "東武東上線"},
+  {"lineCode": "0385", "stationCode": "038517890", "stationName": "下板橋", "lineName": "東武東上線"},
+  {"lineCode": "0385", "stationCode": "038506420", "stationName": "大山", "lineName": "東武東上線"},
+  {"lineCode": "0385", "stationCode": "038526860", "stationName": "中板橋", "lineName": "東武東上線"},
+  {"lineCode": "0385", "stationCode": "038525970", "stationName": "ときわ台", "lineName": "東武東上線"},
+  {"lineCode": "0385", "stationCode": "038509050", "stationName": "上板橋", "lineName": "東武東上線"},
+  {"lineCode": "0385", "stationCode": "038525870", "stationName": "東武練馬", "lineName": "東武東上線"},
+  {"lineCode": "0385", "stationCode": "038517820", "stationName": "下赤塚", "lineName": "東武東上線"},
+  {"lineCode": "0385", "stationCode": "038528040", "stationName": "成増", "lineName": "東武東上線"},
+
+  {"lineCode": "0440", "stationCode": "044000670", "stationName": "浅草", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044028030", "stationName": "とうきょうスカイツリー", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044006820", "stationName": "押上", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044032640", "stationName": "曳舟", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044032480", "stationName": "東向島", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044008770", "stationName": "鐘ヶ淵", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044035200", "stationName": "堀切", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044004220", "stationName": "牛田", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044011310", "stationName": "北千住", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044014900", "stationName": "小菅", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044014980", "stationName": "五反野", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044004630", "stationName": "梅島", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044028310", "stationName": "西新井", "lineName": "東武伊勢崎線"},
+  {"lineCode": "0440", "stationCode": "044022940", "stationName": "竹ノ塚", "lineName": "東武伊勢崎線"},
+
+  {"lineCode": "0445", "stationCode": "044532640", "stationName": "曳舟", "lineName": "東武亀戸線"},
+  {"lineCode": "0445", "stationCode": "044507200", "stationName": "小村井", "lineName": "東武亀戸線"},
+  {"lineCode": "0445", "stationCode": "044531570", "stationName": "東あずま", "lineName": "東武亀戸線"},
+  {"lineCode": "0445", "stationCode": "044509510", "stationName": "亀戸水神", "lineName": "東武亀戸線"},
+  {"lineCode": "0445", "stationCode": "044509500", "stationName": "亀戸", "lineName": "東武亀戸線"},
+
+  {"lineCode": "0220", "stationCode": "022017640", "stationName": "渋谷", "lineName": "東急東横線"},
+  {"lineCode": "0220", "stationCode": "022021850", "stationName": "代官山", "lineName": "東急東横線"},
+  {"lineCode": "0220", "stationCode": "022027580", "stationName": "中目黒", "lineName": "東急東横線"},
+  {"lineCode": "0220", "stationCode": "022040640", "stationName": "祐天寺", "lineName": "東急東横線"},
+  {"lineCode": "0220", "stationCode": "022007660", "stationName": "学芸大学", "lineName": "東急東横線"},
+  {"lineCode": "0220", "stationCode": "022026730", "stationName": "都立大学", "lineName": "東急東横線"},
+  {"lineCode": "0220", "stationCode": "022018410", "stationName": "自由が丘", "lineName": "東急東横線"},
+  {"lineCode": "0220", "stationCode": "022025320", "stationName": "田園調布", "lineName": "東急東横線"},
+  {"lineCode": "0220", "stationCode": "022023450", "stationName": "多摩川", "lineName": "東急東横線"},
+
+  {"lineCode": "0230", "stationCode": "023017640", "stationName": "渋谷", "lineName": "東急田園都市線"},
+  {"lineCode": "0230", "stationCode": "023002000", "stationName": "池尻大橋", "lineName": "東急田園都市線"},
+  {"lineCode": "0230", "stationCode": "023016720", "stationName": "三軒茶屋", "lineName": "東急田園都市線"},
+  {"lineCode": "0230", "stationCode": "023015340", "stationName": "駒沢大学", "lineName": "東急田園都市線"},
+  {"lineCode": "0230", "stationCode": "023016140", "stationName": "桜新町", "lineName": "東急田園都市線"},
+  {"lineCode": "0230", "stationCode": "023040800", "stationName": "用賀", "lineName": "東急田園都市線"},
+  {"lineCode": "0230", "stationCode": "023034230", "stationName": "二子玉川", "lineName": "東急田園都市線"},
+  {"lineCode": "0230", "stationCode": "023024700", "stationName": "つくし野", "lineName": "東急田園都市線"},
+  {"lineCode": "0230", "stationCode": "023020660", "stationName": "すずかけ台", "lineName": "東急田園都市線"},
+  {"lineCode": "0230", "stationCode": "023037790", "stationName": "南町田グランベリーパーク", "lineName": "東急田園都市線"},
+
+  {"lineCode": "0200", "stationCode": "020014970", "stationName": "五反田", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020005790", "stationName": "大崎広小路", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020026090", "stationName": "戸越銀座", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020005020", "stationName": "荏原中延", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020030650", "stationName": "旗の台", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020027430", "stationName": "長原", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020021480", "stationName": "洗足池", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020002180", "stationName": "石川台", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020040690", "stationName": "雪が谷大塚", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020007440", "stationName": "御嶽山", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020012440", "stationName": "久が原", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020024160", "stationName": "千鳥町", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020001970", "stationName": "池上", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020030530", "stationName": "蓮沼", "lineName": "東急池上線"},
+  {"lineCode": "0200", "stationCode": "020008940", "stationName": "蒲田", "lineName": "東急池上線"},
+
+  {"lineCode": "0205", "stationCode": "020539110", "stationName": "目黒", "lineName": "東急目黒線"},
+  {"lineCode": "0205", "stationCode": "020534410", "stationName": "不動前", "lineName": "東急目黒線"},
+  {"lineCode": "0205", "stationCode": "020538730", "stationName": "武蔵小山", "lineName": "東急目黒線"},
+  {"lineCode": "0205", "stationCode": "020528780", "stationName": "西小山", "lineName": "東急目黒線"},
+  {"lineCode": "0205", "stationCode": "020521470", "stationName": "洗足", "lineName": "東急目黒線"},
+  {"lineCode": "0205", "stationCode": "020505520", "stationName": "大岡山", "lineName": "東急目黒線"},
+  {"lineCode": "0205", "stationCode": "020506660", "stationName": "奥沢", "lineName": "東急目黒線"},
+  {"lineCode": "0205", "stationCode": "020525320", "stationName": "田園調布", "lineName": "東急目黒線"},
+  {"lineCode": "0205", "stationCode": "020523450", "stationName": "多摩川", "lineName": "東急目黒線"},
+
+  {"lineCode": "0210", "stationCode": "021023450", "stationName": "多摩川", "lineName": "東急多摩川"},
+  {"lineCode": "0210", "stationCode": "021029840", "stationName": "沼部", "lineName": "東急多摩川"},
+  {"lineCode": "0210", "stationCode": "021004470", "stationName": "鵜の木", "lineName": "東急多摩川"},
+  {"lineCode": "0210", "stationCode": "021018280", "stationName": "下丸子", "lineName": "東急多摩川"},
+  {"lineCode": "0210", "stationCode": "021038810", "stationName": "武蔵新田", "lineName": "東急多摩川"},
+  {"lineCode": "0210", "stationCode": "021039810", "stationName": "矢口渡", "lineName": "東急多摩川"},
+  {"lineCode": "0210", "stationCode": "021008940", "stationName": "蒲田", "lineName": "東急多摩川"},
+
+  {"lineCode": "0215", "stationCode": "021505480", "stationName": "大井町", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021518100", "stationName": "下神明", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021526100", "stationName": "戸越公園", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021527370", "stationName": "中延", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021505030", "stationName": "荏原町", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021530650", "stationName": "旗の台", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021511320", "stationName": "北千束", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021505520", "stationName": "大岡山", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021537110", "stationName": "緑が丘", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021518410", "stationName": "自由が丘", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021512830", "stationName": "九品仏", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021507280", "stationName": "尾山台", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021526240", "stationName": "等々力", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021509280", "stationName": "上野毛", "lineName": "東急大井町線"},
+  {"lineCode": "0215", "stationCode": "021534230", "stationName": "二子玉川", "lineName": "東急大井町線"},
+
+  {"lineCode": "0235", "stationCode": "023516720", "stationName": "三軒茶屋", "lineName": "東急世田谷線"},
+  {"lineCode": "0235", "stationCode": "023528990", "stationName": "西太子堂", "lineName": "東急世田谷線"},
+  {"lineCode": "0235", "stationCode": "023541620", "stationName": "若林", "lineName": "東急世田谷線"},
+  {"lineCode": "0235", "stationCode": "023518530", "stationName": "松陰神社前", "lineName": "東急世田谷線"},
+  {"lineCode": "0235", "stationCode": "023521210", "stationName": "世田谷", "lineName": "東急世田谷線"},
+  {"lineCode": "0235", "stationCode": "023509410", "stationName": "上町", "lineName": "東急世田谷線"},
+  {"lineCode": "0235", "stationCode": "023538270", "stationName": "宮の坂", "lineName": "東急世田谷線"},
+  {"lineCode": "0235", "stationCode": "023540270", "stationName": "山下", "lineName": "東急世田谷線"},
+  {"lineCode": "0235", "stationCode": "023536030", "stationName": "松原", "lineName": "東急世田谷線"},
+  {"lineCode": "0235", "stationCode": "023518140", "stationName": "下高井戸", "lineName": "東急世田谷線"},
+
+  {"lineCode": "0055", "stationCode": "005529410", "stationName": "西馬込", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005535690", "stationName": "馬込", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005527370", "stationName": "中延", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005526080", "stationName": "戸越", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005514970", "stationName": "五反田", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005522460", "stationName": "高輪台", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005521340", "stationName": "泉岳寺", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005536860", "stationName": "三田", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005522090", "stationName": "大門", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005520110", "stationName": "新橋", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005531870", "stationName": "東銀座", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005522650", "stationName": "宝町", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005529710", "stationName": "日本橋", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005529780", "stationName": "人形町", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005532170", "stationName": "東日本橋", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005500680", "stationName": "浅草橋", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005513010", "stationName": "蔵前", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005500670", "stationName": "浅草", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005535380", "stationName": "本所吾妻橋", "lineName": "都営浅草線"},
+  {"lineCode": "0055", "stationCode": "005506820", "stationName": "押上", "lineName": "都営浅草線"},
+
+  {"lineCode": "0060", "stationCode": "006039110", "stationName": "目黒", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006018930", "stationName": "白金台", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006018940", "stationName": "白金高輪", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006036860", "stationName": "三田", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006017570", "stationName": "芝公園", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006007040", "stationName": "御成門", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006004290", "stationName": "内幸町", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006033040", "stationName": "日比谷", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006006050", "stationName": "大手町", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006020210", "stationName": "神保町", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006020470", "stationName": "水道橋", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006008030", "stationName": "春日", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006030270", "stationName": "白山", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006021410", "stationName": "千石", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006020550", "stationName": "巣鴨", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006028890", "stationName": "西巣鴨", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006019040", "stationName": "新板橋", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006002900", "stationName": "板橋区役所前", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006002910", "stationName": "板橋本町", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006039290", "stationName": "本蓮沼", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006017790", "stationName": "志村坂上", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006017800", "stationName": "志村三丁目", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006030540", "stationName": "蓮根", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006028980", "stationName": "西台", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006022280", "stationName": "高島平", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006019810", "stationName": "新高島平", "lineName": "都営三田線"},
+  {"lineCode": "0060", "stationCode": "006029010", "stationName": "西高島平", "lineName": "都営三田線"},
+
+  {"lineCode": "0065", "stationCode": "006519670", "stationName": "新宿", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006519690", "stationName": "新宿三丁目", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006500590", "stationName": "曙橋", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006502980", "stationName": "市ケ谷", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006512720", "stationName": "九段下", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006520210", "stationName": "神保町", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006506620", "stationName": "小川町", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006503950", "stationName": "岩本町", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006530340", "stationName": "馬喰横山", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006531100", "stationName": "浜町", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006539490", "stationName": "森下", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006510690", "stationName": "菊川", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006520870", "stationName": "住吉", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006528430", "stationName": "西大島", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006505850", "stationName": "大島", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006531700", "stationName": "東大島", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006534520", "stationName": "船堀", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006503060", "stationName": "一之江", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006536730", "stationName": "瑞江", "lineName": "都営新宿線"},
+  {"lineCode": "0065", "stationCode": "006517480", "stationName": "篠崎", "lineName": "都営新宿線"},
+
+  {"lineCode": "0070", "stationCode": "007050010", "stationName": "新宿西口", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007050015", "stationName": "東新宿", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007050020", "stationName": "若松河田", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007050025", "stationName": "牛込柳町", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007050030", "stationName": "牛込神楽坂", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007001820", "stationName": "飯田橋", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007008030", "stationName": "春日", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007035340", "stationName": "本郷三丁目", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007050035", "stationName": "上野御徒町", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007050040", "stationName": "新御徒町", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007013010", "stationName": "蔵前", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007050045", "stationName": "両国", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007039490", "stationName": "森下", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007050050", "stationName": "清澄白河", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007039600", "stationName": "門前仲町", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007024650", "stationName": "月島", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007050055", "stationName": "勝どき", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007050060", "stationName": "築地市場", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007053930", "stationName": "汐留", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007022090", "stationName": "大門", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007050065", "stationName": "赤羽橋", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007000800", "stationName": "麻布十番", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007041560", "stationName": "六本木", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007000250", "stationName": "青山一丁目", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007014730", "stationName": "国立競技場", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007041280", "stationName": "代々木", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007019670", "stationName": "新宿", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007026200", "stationName": "都庁前", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007028870", "stationName": "西新宿五丁目", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007027320", "stationName": "中野坂上", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007032110", "stationName": "東中野", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007026830", "stationName": "中井", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007006960", "stationName": "落合南長崎", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007019110", "stationName": "新江古田", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007029900", "stationName": "練馬", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007026130", "stationName": "豊島園", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007029910", "stationName": "練馬春日町", "lineName": "都営大江戸線"},
+  {"lineCode": "0070", "stationCode": "007032620", "stationName": "光が丘", "lineName": "都営大江戸線"},
+
+  {"lineCode": "0085", "stationCode": "008541740", "stationName": "早稲田", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008507220", "stationName": "面影橋", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008507670", "stationName": "学習院下", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008510820", "stationName": "鬼子母神前", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008521650", "stationName": "都電雑司ヶ谷", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008531610", "stationName": "東池袋四丁目", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008538630", "stationName": "向原", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008506020", "stationName": "大塚駅前", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008520560", "stationName": "巣鴨新田", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008514060", "stationName": "庚申塚", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008519480", "stationName": "新庚申塚", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008528570", "stationName": "西ヶ原四丁目", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008522780", "stationName": "滝野川一丁目", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008500980", "stationName": "飛鳥山", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008505200", "stationName": "王子駅前", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008515770", "stationName": "栄町", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008508010", "stationName": "梶原", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008501480", "stationName": "荒川車庫前", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008501510", "stationName": "荒川遊園地前", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008506850", "stationName": "小台", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008538320", "stationName": "宮ノ前", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008512890", "stationName": "熊野前", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008531740", "stationName": "東尾久三丁目", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008535810", "stationName": "町屋二丁目", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008535800", "stationName": "町屋駅前", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008501490", "stationName": "荒川七丁目", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008501500", "stationName": "荒川二丁目", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008501470", "stationName": "荒川区役所前", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008550070", "stationName": "荒川一中前", "lineName": "都電荒川線"},
+  {"lineCode": "0085", "stationCode": "008538140", "stationName": "三ノ輪橋", "lineName": "都電荒川線"},
+  
+  {"lineCode": "0765", "stationCode": "076529650", "stationName": "日暮里", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076529160", "stationName": "西日暮里", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076580815", "stationName": "赤土小学校前", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076512890", "stationName": "熊野前", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076580816", "stationName": "足立小台", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076580817", "stationName": "扇大橋", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076580818", "stationName": "高野", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076580819", "stationName": "江北", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076580820", "stationName": "西新井大師西", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076580821", "stationName": "谷在家", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076580822", "stationName": "舎人公園", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076580823", "stationName": "舎人", "lineName": "日暮里舎人"},
+  {"lineCode": "0765", "stationCode": "076580824", "stationName": "見沼代親水公園", "lineName": "日暮里舎人"},
+
+  {"lineCode": "0265", "stationCode": "026517640", "stationName": "渋谷", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026519790", "stationName": "神泉", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026515370", "stationName": "駒場東大前", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026502030", "stationName": "池ノ上", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026518010", "stationName": "下北沢", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026519800", "stationName": "新代田", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026532410", "stationName": "東松原", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026539030", "stationName": "明大前", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026504780", "stationName": "永福町", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026528380", "stationName": "西永福", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026531090", "stationName": "浜田山", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026522170", "stationName": "高井戸", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026534030", "stationName": "富士見ヶ丘", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026512460", "stationName": "久我山", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026536890", "stationName": "三鷹台", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026503510", "stationName": "井の頭公園", "lineName": "京王井の頭線"},
+  {"lineCode": "0265", "stationCode": "026511640", "stationName": "吉祥寺", "lineName": "京王井の頭線"},
+
+  {"lineCode": "0270", "stationCode": "027032330", "stationName": "東府中", "lineName": "京王線"},
+  {"lineCode": "0270", "stationCode": "027034350", "stationName": "府中競馬正門前", "lineName": "京王線"},
+  {"lineCode": "0275", "stationCode": "027519670", "stationName": "新宿", "lineName": "京王線"},
+  {"lineCode": "0275", "stationCode": "027530800", "stationName": "初台", "lineName": "京王新線"},
+  {"lineCode": "0275", "stationCode": "027530610", "stationName": "幡ヶ谷", "lineName": "京王新線"},
+  {"lineCode": "0280", "stationCode": "028016280", "stationName": "笹塚", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028021960", "stationName": "代田橋", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028039030", "stationName": "明大前", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028018140", "stationName": "下高井戸", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028016130", "stationName": "桜上水", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028009130", "stationName": "上北沢", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028030710", "stationName": "八幡山", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028041450", "stationName": "芦花公園", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028024130", "stationName": "千歳烏山", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028021360", "stationName": "仙川", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028024850", "stationName": "つつじヶ丘", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028017580", "stationName": "柴崎", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028014740", "stationName": "国領", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028034190", "stationName": "布田", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028024440", "stationName": "調布", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028029060", "stationName": "西調布", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028026310", "stationName": "飛田給", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028038820", "stationName": "武蔵野台", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028023640", "stationName": "多磨霊園", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028032330", "stationName": "東府中", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028034340", "stationName": "府中", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028034560", "stationName": "分倍河原", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028027000", "stationName": "中河原", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028021020", "stationName": "聖蹟桜ヶ丘", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028039160", "stationName": "百草園", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028022520", "stationName": "高幡不動", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028037620", "stationName": "南平", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028033390", "stationName": "平山城址公園", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028027270", "stationName": "長沼", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028011420", "stationName": "北野", "lineName": "京王線"},
+  {"lineCode": "0280", "stationCode": "028013370", "stationName": "京王八王子", "lineName": "京王線"},
+  {"lineCode": "0285", "stationCode": "028523550", "stationName": "多摩動物公園", "lineName": "京王線"},
+
+  {"lineCode": "0290", "stationCode": "029024440", "stationName": "調布", "lineName": "京王相模原線"},
+  {"lineCode": "0290", "stationCode": "029013340", "stationName": "京王多摩川", "lineName": "京王相模原線"},
+  {"lineCode": "0290", "stationCode": "029013390", "stationName": "京王よみうりランド", "lineName": "京王相模原線"},
+  {"lineCode": "0290", "stationCode": "029003230", "stationName": "稲城", "lineName": "京王相模原線"},
+  {"lineCode": "0290", "stationCode": "029013360", "stationName": "京王永山", "lineName": "京王相模原線"},
+  {"lineCode": "0290", "stationCode": "029013350", "stationName": "京王多摩センター", "lineName": "京王相模原線"},
+  {"lineCode": "0290", "stationCode": "029013380", "stationName": "京王堀之内", "lineName": "京王相模原線"},
+  {"lineCode": "0290", "stationCode": "029037360", "stationName": "南大沢", "lineName": "京王相模原線"},
+  {"lineCode": "0290", "stationCode": "029023480", "stationName": "多摩境", "lineName": "京王相模原線"},
+
+  {"lineCode": "0295", "stationCode": "029511420", "stationName": "北野", "lineName": "京王高尾線"},
+  {"lineCode": "0295", "stationCode": "029513330", "stationName": "京王片倉", "lineName": "京王高尾線"},
+  {"lineCode": "0295", "stationCode": "029540320", "stationName": "山田", "lineName": "京王高尾線"},
+  {"lineCode": "0295", "stationCode": "029539130", "stationName": "めじろ台", "lineName": "京王高尾線"},
+  {"lineCode": "0295", "stationCode": "029530430", "stationName": "狭間", "lineName": "京王高尾線"},
+  {"lineCode": "0295", "stationCode": "029522180", "stationName": "高尾", "lineName": "京王高尾線"},
+  {"lineCode": "0295", "stationCode": "029522210", "stationName": "高尾山口", "lineName": "京王高尾線"},
+
+  {"lineCode": "0540", "stationCode": "054000190", "stationName": "青砥", "lineName": "京成押上線"},
+  {"lineCode": "0540", "stationCode": "054013610", "stationName": "京成立石", "lineName": "京成押上線"},
+  {"lineCode": "0540", "stationCode": "054041140", "stationName": "四ツ木", "lineName": "京成押上線"},
+  {"lineCode": "0540", "stationCode": "054040170", "stationName": "八広", "lineName": "京成押上線"},
+  {"lineCode": "0540", "stationCode": "054013670", "stationName": "京成曳舟", "lineName": "京成押上線"},
+  {"lineCode": "0540", "stationCode": "054006820", "stationName": "押上", "lineName": "京成押上線"},
+
+  {"lineCode": "0550", "stationCode": "055013600", "stationName": "京成高砂", "lineName": "京成金町線"},
+  {"lineCode": "0550", "stationCode": "055017620", "stationName": "柴又", "lineName": "京成金町線"},
+  {"lineCode": "0550", "stationCode": "055013550", "stationName": "京成金町", "lineName": "京成金町線"},
+
+  {"lineCode": "0555", "stationCode": "055513510", "stationName": "京成上野", "lineName": "京成本線"},
+  {"lineCode": "0555", "stationCode": "055529650", "stationName": "日暮里", "lineName": "京成本線"},
+  {"lineCode": "0555", "stationCode": "055520290", "stationName": "新三河島", "lineName": "京成本線"},
+  {"lineCode": "0555", "stationCode": "055535790", "stationName": "町屋", "lineName": "京成本線"},
+  {"lineCode": "0555", "stationCode": "055521440", "stationName": "千住大橋", "lineName": "京成本線"},
+  {"lineCode": "0555", "stationCode": "055513590", "stationName": "京成関屋", "lineName": "京成本線"},
+  {"lineCode": "0555", "stationCode": "055535210", "stationName": "堀切菖蒲園", "lineName": "京成本線"},
+  {"lineCode": "0555", "stationCode": "055507120", "stationName": "お花茶屋", "lineName": "京成本線"},
+  {"lineCode": "0555", "stationCode": "055500190", "stationName": "青砥", "lineName": "京成本線"},
+  {"lineCode": "0555", "stationCode": "055513600", "stationName": "京成高砂", "lineName": "京成本線"},
+  {"lineCode": "0555", "stationCode": "055513560", "stationName": "京成小岩", "lineName": "京成本線"},
+  {"lineCode": "0555", "stationCode": "055504920", "stationName": "江戸川", "lineName": "京成本線"},
+
+  {"lineCode": "0095", "stationCode": "009521340", "stationName": "泉岳寺", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009517460", "stationName": "品川", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009511210", "stationName": "北品川", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009520140", "stationName": "新馬場", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009500240", "stationName": "青物横丁", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009516530", "stationName": "鮫洲", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009523090", "stationName": "立会川", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009506380", "stationName": "大森海岸", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009534650", "stationName": "平和島", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009506400", "stationName": "大森町", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009504660", "stationName": "梅屋敷", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009513410", "stationName": "京急蒲田", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009521660", "stationName": "雑色", "lineName": "京急本線"},
+  {"lineCode": "0095", "stationCode": "009541470", "stationName": "六郷土手", "lineName": "京急本線"},
+
+  {"lineCode": "0100", "stationCode": "010013410", "stationName": "京急蒲田", "lineName": "京急空港線"},
+  {"lineCode": "0100", "stationCode": "010014030", "stationName": "糀谷", "lineName": "京急空港線"},
+  {"lineCode": "0100", "stationCode": "010006110", "stationName": "大鳥居", "lineName": "京急空港線"},
+  {"lineCode": "0100", "stationCode": "010001130", "stationName": "穴守稲荷", "lineName": "京急空港線"},
+  {"lineCode": "0100", "stationCode": "010025350", "stationName": "天空橋", "lineName": "京急空港線"},
+  {"lineCode": "0100", "stationCode": "010075907", "stationName": "羽田空港第３ターミナル", "lineName": "京急空港線"},
+  {"lineCode": "0100", "stationCode": "010075910", "stationName": "羽田空港第１・第２ターミナル", "lineName": "京急空港線"},
+
+  {"lineCode": "0240", "stationCode": "024019670", "stationName": "新宿", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024037560", "stationName": "南新宿", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024016710", "stationName": "参宮橋", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024041310", "stationName": "代々木八幡", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024041290", "stationName": "代々木上原", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024031840", "stationName": "東北沢", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024018010", "stationName": "下北沢", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024021220", "stationName": "世田谷代田", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024004590", "stationName": "梅ヶ丘", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024014220", "stationName": "豪徳寺", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024012020", "stationName": "経堂", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024024140", "stationName": "千歳船橋", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024021760", "stationName": "祖師ヶ谷大蔵", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024020990", "stationName": "成城学園前", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024011580", "stationName": "喜多見", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024015260", "stationName": "狛江", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024002510", "stationName": "和泉多摩川", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024024990", "stationName": "鶴川", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024023460", "stationName": "玉川学園前", "lineName": "小田急線"},
+  {"lineCode": "0240", "stationCode": "024035780", "stationName": "町田", "lineName": "小田急線"},
+
+  {"lineCode": "0250", "stationCode": "025006890", "stationName": "小田急永山", "lineName": "小田急多摩線"},
+  {"lineCode": "0250", "stationCode": "025006880", "stationName": "小田急多摩センター", "lineName": "小田急多摩線"},
+  {"lineCode": "0250", "stationCode": "025009710", "stationName": "唐木田", "lineName": "小田急多摩線"},
+
+  {"lineCode": "0300", "stationCode": "030023490", "stationName": "多摩センター", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030035880", "stationName": "松が谷", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030006010", "stationName": "大塚・帝京大学", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030024320", "stationName": "中央大学・明星大学", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030023550", "stationName": "多摩動物公園", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030035160", "stationName": "程久保", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030022520", "stationName": "高幡不動", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030036220", "stationName": "万願寺", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030014050", "stationName": "甲州街道", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030017590", "stationName": "柴崎体育館", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030023120", "stationName": "立川南", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030023110", "stationName": "立川北", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030022550", "stationName": "高松", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030023150", "stationName": "立飛", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030002500", "stationName": "泉体育館", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030020760", "stationName": "砂川七番", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030023470", "stationName": "玉川上水", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030016060", "stationName": "桜街道", "lineName": "多摩都市モノレール"},
+  {"lineCode": "0300", "stationCode": "030009140", "stationName": "上北台", "lineName": "多摩都市モノレール"},
+
+  {"lineCode": "0090", "stationCode": "000901933", "stationName": "新木場", "lineName": "りんかい線"},
+  {"lineCode": "0090", "stationCode": "000901751", "stationName": "東雲", "lineName": "りんかい線"},
+  {"lineCode": "0090", "stationCode": "000901466", "stationName": "国際展示場", "lineName": "りんかい線"},
+  {"lineCode": "0090", "stationCode": "000902563", "stationName": "東京テレポート", "lineName": "りんかい線"},
+  {"lineCode": "0090", "stationCode": "000902544", "stationName": "天王洲アイル", "lineName": "りんかい線"},
+  {"lineCode": "0090", "stationCode": "000905394", "stationName": "品川シーサイド", "lineName": "りんかい線"},
+  {"lineCode": "0090", "stationCode": "000900548", "stationName": "大井町", "lineName": "りんかい線"},
+  {"lineCode": "0090", "stationCode": "000900578", "stationName": "大崎", "lineName": "りんかい線"},
+
+  {"lineCode": "0560", "stationCode": "056013600", "stationName": "京成高砂", "lineName": "北総線"},
+  {"lineCode": "0560", "stationCode": "056019660", "stationName": "新柴又", "lineName": "北総線"},
+
+  {"lineCode": "0080", "stationCode": "008031160", "stationName": "浜松町", "lineName": "東京モノレール"},
+  {"lineCode": "0080", "stationCode": "008025440", "stationName": "天王洲アイル", "lineName": "東京モノレール"},
+  {"lineCode": "0080", "stationCode": "008005410", "stationName": "大井競馬場前", "lineName": "東京モノレール"},
+  {"lineCode": "0080", "stationCode": "008041350", "stationName": "流通センター", "lineName": "東京モノレール"},
+  {"lineCode": "0080", "stationCode": "008018760", "stationName": "昭和島", "lineName": "東京モノレール"},
+  {"lineCode": "0080", "stationCode": "008031030", "stationName": "整備場", "lineName": "東京モノレール"},
+  {"lineCode": "0080", "stationCode": "008025350", "stationName": "天空橋", "lineName": "東京モノレール"},
+  {"lineCode": "0080", "stationCode": "008031025", "stationName": "羽田空港第３ターミナル", "lineName": "東京モノレール"},
+  {"lineCode": "0080", "stationCode": "008019760", "stationName": "新整備場", "lineName": "東京モノレール"},
+  {"lineCode": "0080", "stationCode": "008031020", "stationName": "羽田空港第１ターミナル", "lineName": "東京モノレール"},
+  {"lineCode": "0080", "stationCode": "008075900", "stationName": "羽田空港第２ターミナル", "lineName": "東京モノレール"},
+
+  {"lineCode": "0075", "stationCode": "000752011", "stationName": "新橋", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000755393", "stationName": "汐留", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000752289", "stationName": "竹芝", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000753296", "stationName": "日の出", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000751756", "stationName": "芝浦ふ頭", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000750686", "stationName": "お台場海浜公園", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000752203", "stationName": "台場", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000753455", "stationName": "東京国際クルーズターミナル", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000752531", "stationName": "テレコムセンター", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000750023", "stationName": "青海", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000751467", "stationName": "東京ビッグサイト", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000750158", "stationName": "有明", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000757995", "stationName": "有明テニスの森", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000758000", "stationName": "市場前", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000758005", "stationName": "新豊洲", "lineName": "新交通ゆりかもめ"},
+  {"lineCode": "0075", "stationCode": "000752654", "stationName": "豊洲", "lineName": "新交通ゆりかもめ"},
+
+  {"lineCode": "0640", "stationCode": "064000390", "stationName": "赤羽岩淵", "lineName": "埼玉高速鉄道"},
+
+  {"lineCode": "0760", "stationCode": "076000480", "stationName": "秋葉原", "lineName": "つくばエクスプレス"},
+  {"lineCode": "0760", "stationCode": "076050040", "stationName": "新御徒町", "lineName": "つくばエクスプレス"},
+  {"lineCode": "0760", "stationCode": "076076085", "stationName": "浅草", "lineName": "つくばエクスプレス"},
+  {"lineCode": "0760", "stationCode": "076037600", "stationName": "南千住", "lineName": "つくばエクスプレス"},
+  {"lineCode": "0760", "stationCode": "076011310", "stationName": "北千住", "lineName": "つくばエクスプレス"},
+  {"lineCode": "0760", "stationCode": "076076090", "stationName": "青井", "lineName": "つくばエクスプレス"},
+  {"lineCode": "0760", "stationCode": "076076095", "stationName": "六町", "lineName": "つくばエクスプレス"},
+
+  {"lineCode": "0563", "stationCode": "056313510", "stationName": "京成上野", "lineName": "成田スカイアクセス"},
+  {"lineCode": "0563", "stationCode": "056329650", "stationName": "日暮里", "lineName": "成田スカイアクセス"},
+  {"lineCode": "0563", "stationCode": "056300190", "stationName": "青砥", "lineName": "成田スカイアクセス"},
+  {"lineCode": "0563", "stationCode": "056313600", "stationName": "京成高砂", "lineName": "成田スカイアクセス"},
+]
+
+# SUUMO の都道府県スラッグ（検索 URL の /chintai/<スラッグ>/ 部分）
+# 東京都外の駅を追加するときは路線コード・駅コード単位で上書きする（駅コードが優先）
+DEFAULT_PREFECTURE = "tokyo"
+LINE_PREFECTURES = {}
+STATION_PREFECTURES = {}
@@ -0,0 +1,184 @@
+# station_matcher.py
+
+import unicodedata
+from station_codes import iter_stations
+
+# 路線名の先頭に付く事業者名（正規化後の表記）。長いものから順に外す
+OPERATOR_PREFIXES = sorted([
+    "JR", "東京メトロ", "都営", "東急", "京王", "西武", "東武", "京成", "京急",
+    "小田急", "相鉄", "つくば", "埼玉高速鉄道", "東京モノレール", "新交通",
+], key=len, reverse=True)
+
+# 事業者名を外したあとにこれしか残らない路線名は、事業者名ごと路線名として扱う（京王線、京成本線など）
+BARE_LINE_SUFFIXES = ("", "本")
+
+# 信頼度の下限。これ未満の候補は一致なしとして扱う
+MIN_FUZZY_SCORE = 0.5
+
+# 初回の match_station 呼び出し時に一度だけ作る索引
+_raw_index = None       # (路線名, 駅名)（stationData の表記そのまま） → 駅データ
+_exact_index = None     # (正規化路線名, 正規化駅名) → 駅データ
+_station_index = None   # 正規化駅名 → [駅データ, ...]
+_ngram_index = None     # 駅名の2文字 n-gram → {正規化駅名, ...}
+
+def normalize_name(name):
+    """
+    NFKC 正規化（全角英数→半角など）、空白除去、末尾の「駅」を除去する
+    """
+    if not name:
+        return ""
+    text = unicodedata.normalize("NFKC", name)
+    text = "".join(text.split())
+    # 「ヶ」「ケ」の表記ゆれ（市ケ谷／市ヶ谷）
+    text = text.replace("ヶ", "ケ").replace("ヵ", "カ")
+    if text.endswith("駅") and len(text) > 1:
+        text = text[:-1]
+    return text
+
+def normalize_line_name(name):
+    """
+    駅名と同じ正規化に加え、事業者名（JR、東京メトロ等）と末尾の「線」を外す
+    例: "ＪＲ山手線" / "JR山手線" / "山手線" → "山手"
+    事業者名を外すと「線」「本線」しか残らないときは外さない（"京王線" → "京王"、"京成本線" → "京成本"）
+    """
+    text = normalize_name(name)
+    for prefix in OPERATOR_PREFIXES:
+        if text.startswith(prefix):
+            rest = text[len(prefix):]
+            if rest.removesuffix("線") not in BARE_LINE_SUFFIXES:
+                text = rest
+            break
+    if text.endswith("線") and len(text) > 1:
+        text = text[:-1]
+    return text
+
+def _ngrams(text, n=2):
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+def _similarity(a, b):
+    # Dice 係数（2文字 n-gram）
+    if a == b:
+        return 1.0
+    grams_a, grams_b = _ngrams(a), _ngrams(b)
+    if not grams_a or not grams_b:
+        return 0.0
+    return 2 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+def _build_index():
+    global _raw_index, _exact_index, _station_index, _ngram_index
+    raw_index = {}
+    exact_index = {}
+    station_index = {}
+    ngram_index = {}
+    for item in iter_stations():
+        entry = dict(item, line_key=normalize_line_name(item["lineName"]))
+        station_key = normalize_name(item["stationName"])
+        raw_index.setdefault((item["lineName"], item["stationName"]), entry)
+        exact_index.setdefault((entry["line_key"], station_key), entry)
+        station_index.setdefault(station_key, []).append(entry)
+        for gram in _ngrams(station_key):
+            ngram_index.setdefault(gram, set()).add(station_key)
+    _raw_index = raw_index
+    _exact_index = exact_index
+    _station_index = station_index
+    _ngram_index = ngram_index
+
+def _best_for_line(candidates, line_key):
+    # 同名駅の中から路線名が最も近いものを選ぶ（同点なら先頭）
+    best, best_score = None, -1.0
+    for entry in candidates:
+        score = _similarity(line_key, entry["line_key"]) if line_key else 0.0
+        if score > best_score:
+            best, best_score = entry, score
+    return best, best_score
+
+def match_station(line_name, station_name):
+    """
+    路線名・駅名を stationData の駅に対応付ける
+    戻り値: {"lineCode", "stationCode", "lineName", "stationName", "prefecture", "invalid",
+             "confidence", "method"}
+            一致なしなら None
+    confidence は 0〜1。method は "exact" / "normalized" / "station" / "fuzzy"
+    """
+    if _exact_index is None:
+        _build_index()
+
+    # 1. stationData の表記そのままの (路線, 駅) 一致
+    entry = _raw_index.get((line_name, station_name))
+    if entry:
+        return _result(entry, 1.0, "exact")
+
+    line_key = normalize_line_name(line_name)
+    station_key = normalize_name(station_name)
+    if not station_key:
+        return None
+
+    # 2. 正規化後の (路線, 駅) 一致
+    entry = _exact_index.get((line_key, station_key))
+    if entry:
+        return _result(entry, 0.95, "normalized")
+
+    # 3. 駅名一致 → 路線名の近さで候補を選ぶ
+    candidates = _station_index.get(station_key)
+    if candidates:
+        entry, line_score = _best_for_line(candidates, line_key)
+        if len(candidates) == 1:
+            confidence = 0.85 + 0.1 * line_score
+        else:
+            confidence = 0.6 + 0.3 * line_score
+        return _result(entry, confidence, "station")
+
+    # 4. 駅名の n-gram による曖昧一致
+    shared = {}
+    for gram in _ngrams(station_key):
+        for key in _ngram_index.get(gram, ()):
+            shared[key] = shared.get(key, 0) + 1
+
+    best, best_score = None, 0.0
+    for key in shared:
+        station_score = _similarity(station_key, key)
+        if station_score < MIN_FUZZY_SCORE:
+            continue
+        entry, line_score = _best_for_line(_station_index[key], line_key)
+        score = station_score * (0.7 + 0.3 * max(line_score, 0.0))
+        if score > best_score:
+            best, best_score = entry, score
+
+    if best is None or best_score < MIN_FUZZY_SCORE:
+        return None
+    return _result(best, round(best_score, 3), "fuzzy")
+
+def _result(entry, confidence, method):
+    return {
+        "lineCode": entry["lineCode"],
+        "stationCode": entry["stationCode"],
+        "lineName": entry["lineName"],
+        "stationName": entry["stationName"],
+        "prefecture": entry["prefecture"],
+        "invalid": entry["invalid"],
+        "confidence": round(confidence, 3),
+        "method": method,
+    }
+
+
+if __name__ == "__main__":
+    import timeit
+
+    # テスト例
+    samples = [
+        ("山手線", "東京"),
+        ("JR山手線", "渋谷"),
+        ("ＪＲ山手線", "新宿"),
+        ("丸ノ内線", "四谷三丁目駅"),
+        ("東京メトロ有楽町線", "市ヶ谷"),
+        ("都営大江戸線", "都庁"),
+        ("京王線", "千歳烏山"),
+    ]
+    for line, station in samples:
+        print(f"{line} / {station} → {match_station(line, station)}")
+
+    number = 2000
+    elapsed = timeit.timeit(lambda: [match_station(l, s) for l, s in samples], number=number)
+    print(f"⏱️ {elapsed / (number * len(samples)) * 1e6:.2f} µs/回")
@@ -1,18 +1,19 @@
 # suumo_checker.py
 
-import requests
-from bs4 import BeautifulSoup
+from page_parser import parse_html
+from http_client import CircuitOpenError, TransientFetchError, fetch, finish_stream, DESKTOP_HEADERS, MOBILE_HEADERS
+from agency_scanner import AgencyScanner, load_agency_names
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit, urlunsplit
+import itertools
+import os
 import re
 
-headers = {
-    "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1"
-}
-
 def extract_bukken_id(text):
     """
-    bc_123456789 または SUUMO タイトルの末尾（100123456789）の数字を抽出
+    bc_123456789 / ?bc=123456789（URL）または SUUMO タイトルの末尾（100123456789）の数字を抽出
     """
-    match = re.search(r'bc_(\d+)', text)
+    match = re.search(r'(?<![A-Za-z])bc[_=](\d+)', text)  # ?abc=123 などの別のパラメーターには一致させない
     if match:
         return match.group(1)
 
@@ -22,46 +23,285 @@ def extract_bukken_id(text):
 
     return None
 
-def find_matching_property(search_url, original_data):
+# 検索結果のページ送り
+#   SUUMO_SEARCH_PAGE_SIZE        : 1ページの表示件数（pc）。既定は SUUMO で選べる最大の 50
+#   SUUMO_SEARCH_MAX_PAGES        : 1つの検索で読む最大ページ数
+#   SUUMO_SEARCH_PAGE_CONCURRENCY : 2ページ目以降を同時に取得する数（送るリクエストは全体で SUUMO_CONCURRENCY まで）
+SEARCH_PAGE_SIZE = int(os.environ.get("SUUMO_SEARCH_PAGE_SIZE", "50"))
+SEARCH_MAX_PAGES = int(os.environ.get("SUUMO_SEARCH_MAX_PAGES", "20"))
+SEARCH_PAGE_CONCURRENCY = int(os.environ.get("SUUMO_SEARCH_PAGE_CONCURRENCY", "3"))
+
+HIT_COUNT_SELECTOR = ".paginate_set-hit"
+HIT_COUNT_RE = re.compile(r"([\d,]+)\s*件")
+
+def search_page_url(search_url, page, page_size=None):
     """
-    検索結果ページから data-bukken-cd を取得し、対象物件IDが含まれるか確認する
+    検索URLに表示件数（pc）とページ番号（page）を付ける（もとのクエリの書き方はそのまま残す）
     """
-    bukken_id = extract_bukken_id(original_data.get("title", ""))
-    if not bukken_id:
-        print("⚠️ 物件IDの抽出失敗")
+    parts = urlsplit(search_url)
+    params = [p for p in parts.query.split("&") if p and p.split("=")[0] not in ("pc", "page")]
+    params.append(f"pc={page_size or SEARCH_PAGE_SIZE}")
+    if page > 1:
+        params.append(f"page={page}")
+    return urlunsplit(parts._replace(query="&".join(params)))
+
+def listing_bukken_id(listing_url, data=None):
+    """
+    掲載URLから物件IDを取り、取れなければ抽出結果（extract_conditions_from_url の戻り値）のタイトルから取る
+    """
+    return extract_bukken_id(listing_url) or extract_bukken_id((data or {}).get("title", ""))
+
+def fetch_bukken_ids(search_url, targets=None, max_pages=None):
+    """
+    検索結果に載っている物件ID（data-bukken-cd）を集め、(物件IDの集合, 確定したか) を返す
+    1ページ目の取得に失敗したら None
+    確定したか: 全ページを読めた（または targets がすべて見つかった）なら True
+                読めなかったページや max_pages で読まなかったページがあれば False（集合にない物件IDも載っているかもしれない）
+    1ページ目の総件数から残りのページ数を求め、2ページ目以降は並行して取得する
+    総件数が読めなければ、1ページ目より件数が少ないページが出るまで SUUMO_SEARCH_PAGE_CONCURRENCY ページずつ読む
+    1ページの件数は pc ではなく1ページ目に実際に載っていた件数（サーバーが pc を無視しても数え違えない）
+    targets: 探している物件IDの集合。すべて見つかった時点で残りのページは取得しない
+    max_pages: 読む最大ページ数（省略時は SUUMO_SEARCH_MAX_PAGES）
+    """
+    max_pages = max_pages or SEARCH_MAX_PAGES
+    first = fetch_search_page(search_page_url(search_url, 1))
+    if first is None:
         return None
 
+    bukken_ids, total, page_size = first
+    if total == 0 or _found_all(bukken_ids, targets):
+        return bukken_ids, True
+    if not page_size:
+        if total is None:
+            return bukken_ids, True
+        print(f"⚠️ 検索結果が {total} 件あるのに1ページ目に物件がない: {search_url}")
+        return bukken_ids, False
+    if total is not None:
+        pages = -(-total // page_size)
+    else:
+        pages = None  # 総件数が分からない
+    last_page = min(pages if pages is not None else max_pages, max_pages)
+    # 総件数が分からず1ページ目が pc に満たないときは、たいてい1ページで終わりなので2ページ目だけ確かめる
+    batch_size = SEARCH_PAGE_CONCURRENCY if page_size >= SEARCH_PAGE_SIZE else 1
+
+    failed = False
+    ended = False  # 1ページ目より件数が少ないページ（最後のページ）を読んだか
+    executor = ThreadPoolExecutor(max_workers=SEARCH_PAGE_CONCURRENCY)
     try:
-        response = requests.get(search_url, headers=headers)
+        page = 2
+        while page <= last_page and not failed:
+            batch_end = last_page if pages is not None else min(last_page, page + batch_size - 1)
+            futures = [
+                executor.submit(fetch_search_page, search_page_url(search_url, number))
+                for number in range(page, batch_end + 1)
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    # 読めなかったページがあれば、見つからなかった物件IDは判定しない
+                    failed = True
+                    continue
+                bukken_ids |= result[0]
+                if result[2] < page_size:
+                    ended = True
+                if _found_all(bukken_ids, targets):
+                    return bukken_ids, True
+            if ended:
+                break
+            page = batch_end + 1
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    if pages is not None:
+        truncated = pages > max_pages
+    else:
+        truncated = not ended and not failed
+    if truncated:
+        print(f"⚠️ 検索結果のうち {last_page} ページ分だけ確認（総件数 {total if total is not None else '不明'}）: {search_url}")
+    return bukken_ids, not (failed or truncated)
+
+def _found_all(bukken_ids, targets):
+    return bool(targets) and set(targets) <= bukken_ids
+
+def fetch_search_page(page_url):
+    """
+    検索結果の1ページを取得し、parse_search_page の戻り値を返す。取得失敗時は None
+    """
+    try:
+        response = fetch(page_url, headers=MOBILE_HEADERS)
         response.raise_for_status()
+    except CircuitOpenError:
+        raise
     except Exception as e:
         print(f"❌ 検索ページ取得失敗: {e}")
         return None
 
-    soup = BeautifulSoup(response.content, "html.parser")
-    bukken_elements = soup.select("li[data-bukken-cd]")
+    return parse_search_page(response.content)
+
+def parse_search_page(content, backend=None):
+    """
+    検索結果ページの (物件IDの集合, 総件数, 載っていた物件の数) を返す。総件数が見つからなければ None
+    載っていた物件の数は重複を数えたままの件数（ページ送りの判定に使う）
+    """
+    doc = parse_html(content, backend)
+    bukken_ids = [el.attr("data-bukken-cd") for el in doc.select("li[data-bukken-cd]")]
+    total = None
+    hit_count = doc.select_one(HIT_COUNT_SELECTOR)
+    if hit_count is not None:
+        match = HIT_COUNT_RE.search(hit_count.text())
+        if match:
+            total = int(match.group(1).replace(",", ""))
+    return {bukken_id for bukken_id in bukken_ids if bukken_id is not None}, total, len(bukken_ids)
+
+def extract_bukken_ids_from_html(content, backend=None):
+    return parse_search_page(content, backend)[0]
+
+def detail_url_for(bukken_id):
+    return f"https://suumo.jp/chintai/bc_{bukken_id}/"
 
-    bukken_ids = {el["data-bukken-cd"] for el in bukken_elements if el.has_attr("data-bukken-cd")}
+def find_matching_property(search_url, original_data, index=None):
+    """
+    検索結果ページから data-bukken-cd を取得し、対象物件IDが含まれるか確認する
+    index: search_index.SearchIndex を渡すと、同じ検索URLの結果を使い回す
+    """
+    bukken_id = extract_bukken_id(original_data.get("title", ""))
+    if not bukken_id:
+        print("⚠️ 物件IDの抽出失敗")
+        return None
 
-    if bukken_id in bukken_ids:
-        return f"https://suumo.jp/chintai/bc_{bukken_id}/"
+    if index is not None:
+        bukken_ids = index.ids(search_url)
+    else:
+        result = fetch_bukken_ids(search_url, {bukken_id})
+        bukken_ids = result[0] if result else None
+    if bukken_ids and bukken_id in bukken_ids:
+        return detail_url_for(bukken_id)
     else:
         return None
 
+COMPANY_NAME = "合同会社えほうまき"
+
+# 掲載会社として探す社名（先頭が自社）。agencies.txt があればそちらを使う
+AGENCY_NAMES = load_agency_names(default=[COMPANY_NAME])
+agency_scanner = AgencyScanner(AGENCY_NAMES)
+_company_scanner = AgencyScanner([COMPANY_NAME])
+
+# ストリーミング判定の設定
+#   SUUMO_COMPANY_SCAN_STREAMING : "0" なら従来どおりページ全体を取得・解析する
+#   SUUMO_COMPANY_SCAN_MAX_BYTES : 展開後この位置まで読んで見つからなければ打ち切る（0 = 最後まで）
+#   SUUMO_COMPANY_SCAN_HEAD_ONLY : "0" なら </head> で打ち切らずに最後まで読む
+# 掲載会社は PC 版の <title> に「（社名提供）」として出るので、</head> まで読めば判定できる
+COMPANY_SCAN_STREAMING = os.environ.get("SUUMO_COMPANY_SCAN_STREAMING", "1") != "0"
+COMPANY_SCAN_MAX_BYTES = int(os.environ.get("SUUMO_COMPANY_SCAN_MAX_BYTES", "0"))
+COMPANY_SCAN_HEAD_ONLY = os.environ.get("SUUMO_COMPANY_SCAN_HEAD_ONLY", "1") != "0"
+COMPANY_SCAN_END_MARKERS = ("</head>",) if COMPANY_SCAN_HEAD_ONLY else ()
+COMPANY_SCAN_CHUNK_SIZE = 16 * 1024
+
+CHARSET_SNIFF_BYTES = 1024
+META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.I)
+
+def pick_agency(found):
+    """
+    ページに現れた社名から掲載会社を決める（自社があれば自社、なければ最初に現れた社名）
+    """
+    if COMPANY_NAME in found:
+        return COMPANY_NAME
+    return found[0] if found else None
+
 def check_company_name(detail_url):
     """
     対象物件ページに『合同会社えほうまき』という文字があるか確認する
     """
+    return find_listing_agency(detail_url) == COMPANY_NAME
+
+def find_listing_agency(detail_url):
+    """
+    対象物件ページの掲載会社（AGENCY_NAMES のいずれか）を返す。見つからなければ None
+    再試行しても取得できなかったときは TransientFetchError（他社掲載とはみなさない）
+    """
+    if COMPANY_SCAN_STREAMING:
+        return find_listing_agency_streaming(detail_url)
+    return find_listing_agency_full(detail_url)
+
+def find_listing_agency_full(detail_url):
+    """
+    ページ全体を取得・解析して社名を探す（従来の方式）
+    """
+    try:
+        response = fetch(detail_url, headers=DESKTOP_HEADERS)
+        response.raise_for_status()
+    except (CircuitOpenError, TransientFetchError):
+        raise
+    except Exception as e:
+        print(f"❌ 詳細ページ取得失敗: {e}")
+        return None
+
+    return pick_agency(agency_scanner.scan_text(parse_html(response.content).text()))
+
+def has_company_name(content, backend=None):
+    text = parse_html(content, backend).text()
+    return COMPANY_NAME in text
+
+def scan_agencies(chunks, encoding=None, max_bytes=None, end_markers=None, scanner=None):
+    """
+    HTML のバイト列を先頭から順に（チャンクごとに）走査し、現れた社名を調べる
+    自社名が見つかった時点、または打ち切り位置で走査をやめる
+    encoding: 省略時は先頭の <meta charset> から判定（なければ UTF-8）
+    戻り値: (社名のリスト（出現順）, 走査したバイト数)
+    """
+    max_bytes = COMPANY_SCAN_MAX_BYTES if max_bytes is None else max_bytes
+    end_markers = COMPANY_SCAN_END_MARKERS if end_markers is None else end_markers
+    scanner = scanner or agency_scanner
+
+    chunks = iter(chunks)
+    head = []
+    if encoding is None:
+        # <meta charset> はチャンクの境目をまたぐことがあるので、先頭 CHARSET_SNIFF_BYTES までまとめて見る
+        while sum(len(chunk) for chunk in head) < CHARSET_SNIFF_BYTES:
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            head.append(chunk)
+        match = META_CHARSET_RE.search(b"".join(head))
+        encoding = match.group(1).decode("ascii") if match else "utf-8"
+    return scanner.scan(itertools.chain(head, chunks), encoding, COMPANY_NAME, max_bytes, end_markers)
+
+def scan_company_name(chunks, encoding=None, max_bytes=None, end_markers=None):
+    """
+    scan_agencies の自社名だけ版。戻り値: (見つかったか, 走査したバイト数)
+    """
+    found, scanned = scan_agencies(chunks, encoding, max_bytes, end_markers, _company_scanner)
+    return COMPANY_NAME in found, scanned
+
+def find_listing_agency_streaming(detail_url):
+    """
+    ページを少しずつ読みながら社名を探し、自社名が見つかった時点で接続を閉じる
+    """
+    try:
+        response = fetch(detail_url, headers=DESKTOP_HEADERS, stream=True)
+    except (CircuitOpenError, TransientFetchError):
+        raise
+    except Exception as e:
+        print(f"❌ 詳細ページ取得失敗: {e}")
+        return None
     try:
-        response = requests.get(detail_url, headers=headers)
         response.raise_for_status()
     except Exception as e:
+        # stream=True のレスポンスは閉じないと接続がプールに戻らない
+        finish_stream(response)
         print(f"❌ 詳細ページ取得失敗: {e}")
-        return False
+        return None
 
-    soup = BeautifulSoup(response.content, "html.parser")
-    text = soup.get_text()
-    return "合同会社えほうまき" in text
+    try:
+        # requests は Content-Type に charset がないと ISO-8859-1 とみなすので、そのときは本文から判定する
+        encoding = response.encoding if "charset" in response.headers.get("Content-Type", "") else None
+        found, _ = scan_agencies(response.iter_content(COMPANY_SCAN_CHUNK_SIZE), encoding)
+    except Exception as e:
+        # 本文の途中で読めなくなったときは、社名がなかったとはみなさない
+        raise TransientFetchError(f"{detail_url}: {e}") from e
+    finally:
+        finish_stream(response)
+    return pick_agency(found)
 
 if __name__ == "__main__":
     # テスト用の検索URLと元データタイトル（物件IDを含む）
@@ -1,25 +1,66 @@
 # suumo_scrape.py
 
-from bs4 import BeautifulSoup
-import requests
+from page_parser import parse_html
+from http_client import CircuitOpenError, TransientFetchError, fetch, finish_stream, DESKTOP_HEADERS
+from urllib.parse import urljoin, urlsplit
+import os
 import re
 
-headers = {"User-Agent": "Mozilla/5.0"}
+# extract_conditions_from_html が参照する要素の class。部分解析ではこれ以外の要素を木に入れない
+DETAIL_PAGE_CLASSES = (
+    "property_view_detail-body",
+    "property_view_main-emphasis",
+    "property_data",
+)
 
-def get_property_value(soup, title_name):
-    for section in soup.select(".property_data"):
-        title = section.select_one(".property_data-title")
-        body = section.select_one(".property_data-body")
-        if title and title_name in title.text:
-            return body.text.strip()
+# 物件詳細ページは検証用ヘッダーがなくても、この秒数はキャッシュを使い回す
+DETAIL_CACHE_TTL = int(os.environ.get("SUUMO_DETAIL_CACHE_TTL", str(6 * 60 * 60)))
+
+STATION_INFO_SELECTOR = ".property_view_detail-body .property_view_detail-text"
+PRICE_SELECTOR = ".property_view_main-emphasis"
+PROPERTY_DATA_SELECTOR = ".property_data"
+PROPERTY_TITLE_SELECTOR = ".property_data-title"
+PROPERTY_BODY_SELECTOR = ".property_data-body"
+
+# 掲載確認（probe_listing）でこのステータスなら掲載終了とみなす
+PROBE_GONE_STATUSES = (404, 410)
+
+STATION_LINE_RE = re.compile(r'(.+?)[/／](.+?)駅\s*歩(\d+)分')
+NUMBER_RE = re.compile(r"[\d\.]+")
+INTEGER_RE = re.compile(r"(\d+)")
+
+def get_property_table(doc):
+    """
+    物件概要（.property_data）を1回走査し、{項目名: 値} の辞書にする
+    例: {"間取り": "1K", "専有面積": "25.5m2", "築年数": "築10年", ...}
+    同じ項目名が複数あれば先頭を採用する
+    """
+    table = {}
+    for section in doc.select(PROPERTY_DATA_SELECTOR):
+        title = section.select_one(PROPERTY_TITLE_SELECTOR)
+        body = section.select_one(PROPERTY_BODY_SELECTOR)
+        if title and body:
+            table.setdefault(title.text().strip(), body.text().strip())
+    return table
+
+def lookup_property(table, title_name):
+    """
+    get_property_table の辞書から、項目名に title_name を含む最初の値を返す（なければ "N/A"）
+    """
+    for title, value in table.items():
+        if title_name in title:
+            return value
     return "N/A"
 
+def get_property_value(doc, title_name):
+    return lookup_property(get_property_table(doc), title_name)
+
 def parse_station_info(station_info_raw):
     lines = station_info_raw.strip().split('\n')
     results = []
 
     for line in lines:
-        match = re.match(r'(.+?)[/／](.+?)駅\s*歩(\d+)分', line)
+        match = STATION_LINE_RE.match(line)
         if match:
             line_name, station_name, distance = match.groups()
             results.append({
@@ -29,37 +70,85 @@ def parse_station_info(station_info_raw):
             })
     return results
 
-def extract_conditions_from_url(url):
+def fetch_listing_page(url):
+    """
+    物件詳細ページの HTML（bytes）を返す。取得失敗時は None
+    再試行しても 429 / 5xx / 接続エラーが続いたときは TransientFetchError（抽出失敗にはしない）
+    """
     try:
-        response = requests.get(url, headers=headers)
+        response = fetch(url, headers=DESKTOP_HEADERS, cache_ttl=DETAIL_CACHE_TTL)
         response.raise_for_status()
+    except (CircuitOpenError, TransientFetchError):
+        raise
     except Exception as e:
         print(f"❌ リクエスト失敗: {url} - {e}")
         return None
+    return response.content
+
+def probe_listing(url):
+    """
+    物件詳細ページが掲載中かを本文を読まずに確認する（HEAD。使えなければ GET の応答ヘッダーだけ読んで閉じる）
+    戻り値: True（掲載中）/ False（掲載終了: 404・410、または別のページへの転送）/ None（判定できない）
+    """
+    try:
+        response = fetch(url, headers=DESKTOP_HEADERS, method="HEAD", allow_redirects=False)
+        if response.status_code in (405, 501):
+            response = fetch(url, headers=DESKTOP_HEADERS, stream=True, allow_redirects=False)
+            finish_stream(response)
+    except CircuitOpenError:
+        raise
+    except Exception as e:
+        print(f"❌ 掲載確認失敗: {url} - {e}")
+        return None
+
+    if response.status_code in PROBE_GONE_STATUSES:
+        return False
+    if response.is_redirect:
+        # スキームや末尾の / だけが違う転送は同じページとみなす
+        location = urlsplit(urljoin(url, response.headers.get("Location", "")))
+        return location.path.rstrip("/") == urlsplit(url).path.rstrip("/")
+    if response.ok:
+        return True
+    return None
+
+def extract_conditions_from_url(url):
+    content = fetch_listing_page(url)
+    if content is None:
+        return None
+    return extract_conditions_from_html(content)
 
-    soup = BeautifulSoup(response.content, "html.parser")
+def extract_conditions_from_html(content, backend=None, partial=True):
+    """
+    物件詳細ページの HTML から検索条件を抜き出す
+    backend: page_parser のバックエンド名（省略時は SUUMO_HTML_PARSER）
+    partial: True なら必要な要素（DETAIL_PAGE_CLASSES）だけを解析する
+    """
+    doc = parse_html(content, backend, DETAIL_PAGE_CLASSES if partial else None)
 
-    title = soup.title.text.strip()
+    title = doc.title().strip()
 
-    station_info_tag = soup.select_one(".property_view_detail-body .property_view_detail-text")
-    station_info_raw = station_info_tag.text.strip() if station_info_tag else "N/A"
+    station_info_tag = doc.select_one(STATION_INFO_SELECTOR)
+    station_info_raw = station_info_tag.text().strip() if station_info_tag else "N/A"
     station_list = parse_station_info(station_info_raw)
 
-    price_tag = soup.select_one(".property_view_main-emphasis")
-    price_text = price_tag.text.strip() if price_tag else "N/A"
+    price_tag = doc.select_one(PRICE_SELECTOR)
+    price_text = price_tag.text().strip() if price_tag else "N/A"
     if price_text != "N/A":
-        match = re.search(r"[\d\.]+", price_text)
+        match = NUMBER_RE.search(price_text)
         price_number = float(match.group()) if match else None
     else:
         price_number = None
 
-    floor_plan = get_property_value(soup, "間取り")
+    # 物件概要は1回だけ走査し、以降は辞書から引く
+    properties = get_property_table(doc)
+
+    floor_plan = lookup_property(properties, "間取り")
 
-    area_text = get_property_value(soup, "専有面積")
-    area_number = float(re.search(r"[\d\.]+", area_text).group()) if area_text != "N/A" else None
+    area_text = lookup_property(properties, "専有面積")
+    area_number = float(NUMBER_RE.search(area_text).group()) if area_text != "N/A" else None
 
-    age_text = get_property_value(soup, "築年数")
-    age_match = re.search(r"(\d+)", age_text)
+    age_text = lookup_property(properties, "築年数")
+    age_match = INTEGER_RE.search(age_text)
     age_number = int(age_match.group(1)) if age_match else None
 
     return {
@@ -69,5 +158,7 @@ def extract_conditions_from_url(url):
         "price": price_number,
         "floor_plan": floor_plan,
         "area": area_number,
-        "age": age_number
+        "age": age_number,
+        # 管理費・敷金・礼金など物件概要の全項目（追加の解析なし）
+        "properties": properties
     }
@@ -1,6 +1,6 @@
 #suumo_search_url.py
 
-from station_codes import get_codes
+from station_matcher import match_station
 import math
 
 def round_price_range(price):
@@ -98,6 +98,34 @@ def format_price(val):
     """
     return str(int(val)) if val == int(val) else str(val)
 
+def station_search_base_url(station):
+    """
+    駅データ（prefecture, stationCode を持つ辞書）から駅単位の検索 URL を作る
+    駅コード下5桁を使用
+    """
+    return f"https://suumo.jp/chintai/{station['prefecture']}/ek_{station['stationCode'][-5:]}/"
+
+def resolve_search_station(station_info):
+    """
+    station_info の先頭から順に、検索 URL を作れる駅を探す
+    戻り値: (station_info の要素, match_station の結果)。見つからなければ (None, None)
+    """
+    for station in station_info:
+        line_name = station['line']
+        station_name = station['station']
+        match = match_station(line_name, station_name)
+        if not match:
+            print(f"⚠️ 駅コード取得失敗: {line_name} / {station_name}")
+            continue
+        if match["method"] != "exact":
+            print(f"🔤 駅名照合: {line_name} / {station_name} → {match['lineName']} / {match['stationName']}"
+                  f"（{match['method']}, 信頼度 {match['confidence']}）")
+        if match["invalid"]:
+            print(f"⚠️ 検索対象外の駅: {match['lineName']} / {match['stationName']}（{match['invalid']}）")
+            continue
+        return station, match
+    return None, None
+
 def build_suumo_search_url(station_info, price=None, area_max=None, age_max=None, floor_plan=None):
     print(f"📥 引数: price={price}, area_max={area_max}, age_max={age_max}, floor_plan={floor_plan}")
     """
@@ -110,18 +138,11 @@ def build_suumo_search_url(station_info, price=None, area_max=None, age_max=None
     if not station_info:
         return None
 
-    # 1つ目の駅を使う
-    first_station = station_info[0]
-    line_name = first_station['line']
-    station_name = first_station['station']
-    line_code, station_code = get_codes(line_name, station_name)
-    if not line_code or not station_code:
-        print(f"⚠️ 駅コード取得失敗: {line_name} / {station_name}")
+    # 検索 URL を作れる最初の駅を使う（都道府県は駅データから決める）
+    first_station, match = resolve_search_station(station_info)
+    if not match:
         return None
-
-    # 駅コード下5桁を使用
-    station_code_short = station_code[-5:]
-    base_url = f"https://suumo.jp/chintai/tokyo/ek_{station_code_short}/"
+    base_url = station_search_base_url(match)
 
     params = []
 
@@ -163,6 +184,118 @@ def build_suumo_search_url(station_info, price=None, area_max=None, age_max=None
     else:
         return base_url
 
+# === 複数駅をまとめた検索 ===
+# 駅単位の URL（/chintai/tokyo/ek_xxxxx/）は1駅しか指定できないため、
+# 一覧検索（FR301FC001）の ek パラメータを並べて複数駅を1回で検索する
+MULTI_SEARCH_URL = "https://suumo.jp/jj/chintai/ichiran/FR301FC001/"
+MAX_STATIONS_PER_SEARCH = 10
+
+# SUUMO の都道府県スラッグ → 都道府県コード（ta パラメータ）
+PREFECTURE_CODES = {
+    "ibaraki": "08", "tochigi": "09", "gumma": "10", "saitama": "11",
+    "chiba": "12", "tokyo": "13", "kanagawa": "14", "yamanashi": "19",
+}
+
+def round_conditions(price=None, area_max=None, age_max=None, floor_plan=None):
+    """
+    検索条件を build_suumo_search_url と同じ刻みに丸めて返す
+    戻り値: (賃料下限, 賃料上限, 面積下限, 面積上限, 築年数, 間取りコード)
+    この値が同じ行は、駅以外の条件が同じ検索にまとめられる
+    """
+    price_range = round_price_range(price) if price else (None, None)
+    area_range = round_area_range(area_max) if area_max is not None else (None, None)
+    age = round_age_range(age_max) if age_max is not None else None
+    floor_plan_code = get_floor_plan_code(floor_plan) if floor_plan else None
+    return price_range + area_range + (age, floor_plan_code)
+
+def build_multi_station_search_url(stations, conditions, walk=None):
+    """
+    stations: match_station の結果のリスト（同じ都道府県の駅）
+    conditions: round_conditions の戻り値
+    walk: 丸め済みの徒歩分数（None なら指定なし）
+    """
+    chinryomin, chinryomax, area_min, area_max, age, floor_plan_code = conditions
+    params = [
+        "ar=030",
+        "bs=040",
+        f"ta={PREFECTURE_CODES[stations[0]['prefecture']]}",
+    ]
+    params += [f"ek={station['stationCode']}" for station in stations]
+    if chinryomin is not None:
+        params.append(f"cb={format_price(chinryomin)}")
+    if chinryomax is not None:
+        params.append(f"ct={format_price(chinryomax)}")
+    if area_min is not None:
+        params.append(f"mb={area_min}")
+    if area_max is not None:
+        params.append(f"mt={area_max}")
+    if age is not None:
+        params.append(f"cn={age}")
+    if floor_plan_code:
+        params.append(f"md={floor_plan_code}")
+    if walk is not None:
+        params.append(f"et={walk}")
+    return MULTI_SEARCH_URL + "?" + "&".join(params)
+
+def listing_stations(station_info):
+    # 物件の最寄駅のうち検索に使える駅と、徒歩分数の丸め値
+    stations = []
+    for station in station_info:
+        match = match_station(station['line'], station['station'])
+        if not match or match["invalid"]:
+            continue
+        stations.append((match, round_walk_time(station.get('distance'))))
+    return stations
+
+def plan_combined_searches(rows, max_stations=MAX_STATIONS_PER_SEARCH):
+    """
+    rows: [(キー, extract_conditions_from_url の結果), ...]
+    駅以外の条件（賃料・面積・築年数・間取りの刻み）が同じ行をまとめ、
+    最寄駅をすべて含む検索 URL をできるだけ少なく作る
+    戻り値: [{"url": 検索URL, "keys": [キー, ...]}, ...]
+    駅が1つも解決できない行は含まれない
+    """
+    groups = {}
+    for key, data in rows:
+        stations = listing_stations(data.get("stations") or [])
+        if not stations:
+            continue
+        conditions = round_conditions(data.get("price"), data.get("area"), data.get("age"), data.get("floor_plan"))
+        # ta パラメータは1つなので、最初の駅と同じ都道府県の駅だけを使う
+        prefecture = stations[0][0]["prefecture"]
+        stations = [(match, walk) for match, walk in stations if match["prefecture"] == prefecture]
+        groups.setdefault((prefecture, conditions), []).append((key, stations))
+
+    plans = []
+    for (prefecture, conditions), members in groups.items():
+        # 駅の多い行から詰める（同じ駅を持つ行が同じ検索に入りやすい）
+        members.sort(key=lambda member: -len(member[1]))
+        searches = []
+        for key, stations in members:
+            codes = {match["stationCode"] for match, _ in stations}
+            for search in searches:
+                if len(search["codes"] | codes) <= max_stations:
+                    break
+            else:
+                search = {"codes": set(), "stations": [], "walks": [], "keys": []}
+                searches.append(search)
+            for match, walk in stations:
+                if match["stationCode"] not in search["codes"] and len(search["codes"]) < max_stations:
+                    search["codes"].add(match["stationCode"])
+                    search["stations"].append(match)
+                search["walks"].append(walk)
+            search["keys"].append(key)
+
+        for search in searches:
+            # 徒歩分数は一番広い条件に合わせる（20分超が含まれれば指定なし）
+            walks = search["walks"]
+            walk = None if None in walks else max(walks)
+            plans.append({
+                "url": build_multi_station_search_url(search["stations"], conditions, walk),
+                "keys": search["keys"],
+            })
+    return plans
+
 # テスト用
 if __name__ == "__main__":
     test_station_info = [{'line': '山手線', 'station': '東京', 'distance': 10}]
@@ -173,3 +306,15 @@ if __name__ == "__main__":
         age_max=10
     )
     print(url)
+
+    test_rows = [
+        ("A", {"stations": [{'line': '山手線', 'station': '東京', 'distance': 10},
+                            {'line': '丸ノ内線', 'station': '大手町', 'distance': 4}],
+               "price": 9.9, "area": 27.49, "age": 10, "floor_plan": "1K"}),
+        ("B", {"stations": [{'line': 'JR中央線', 'station': '神田', 'distance': 6}],
+               "price": 9.7, "area": 26.0, "age": 8, "floor_plan": "1K"}),
+        ("C", {"stations": [{'line': '山手線', 'station': '渋谷', 'distance': 3}],
+               "price": 15.0, "area": 40.0, "age": 3, "floor_plan": "1LDK"}),
+    ]
+    for plan in plan_combined_searches(test_rows):
+        print(plan["keys"], plan["url"])
@@ -0,0 +1,47 @@
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT_DIR, "tests", "fixtures")
+
+sys.path.insert(0, ROOT_DIR)
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+class FakeSpreadsheet:
+    """
+    gspread.Spreadsheet の代わり。送られた batchUpdate を calls に記録する
+    """
+    def __init__(self):
+        self.calls = []  # (メソッド名, body)
+
+    def values_batch_update(self, body):
+        self.calls.append(("values_batch_update", body))
+
+    def batch_update(self, body):
+        self.calls.append(("batch_update", body))
+
+class FakeWorksheet:
+    title = "シート1"
+    id = 7
+
+    def __init__(self, rows=(), col_count=10):
+        self.rows = [list(row) for row in rows]
+        self.col_count = col_count
+
+    def get_all_values(self):
+        return [list(row) for row in self.rows]
+
+@pytest.fixture
+def unlimited_sheets_quota(monkeypatch):
+    # テストでは Sheets API のクォータ待ちをしない
+    import sheet_snapshot
+    import sheet_writer
+    from sheets_quota import SheetsQuota
+
+    unlimited = SheetsQuota(0, 0)
+    monkeypatch.setattr(sheet_writer, "quota", unlimited)
+    monkeypatch.setattr(sheet_snapshot, "quota", unlimited)
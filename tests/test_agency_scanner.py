@@ -0,0 +1,26 @@
+import pytest
+from agency_scanner import AgencyScanner
+
+NAMES = ["株式会社X", "えほうまき", "合同会社えほうまき"]
+
+def chunked(content, size):
+    return [content[i:i + size] for i in range(0, len(content), size)]
+
+@pytest.mark.parametrize("text, expected", [
+    ("前 合同会社えほうまき 後", ["合同会社えほうまき"]),
+    ("前 えほうまき 後", ["えほうまき"]),
+    ("株式会社X と 合同会社えほうまき と えほうまき", ["株式会社X", "合同会社えほうまき", "えほうまき"]),
+])
+def test_scan_every_chunk_size(text, expected):
+    scanner = AgencyScanner(NAMES)
+    content = text.encode("utf-8")
+    assert scanner.scan_text(text) == expected
+    for size in range(1, len(content) + 1):
+        assert scanner.scan(chunked(content, size))[0] == expected, size
+
+def test_longer_name_across_chunks():
+    # 短い社名が長い社名の前方部分になっている場合、境目で短い方を確定させない
+    scanner = AgencyScanner(["株式会社A", "株式会社AB"])
+    content = "…株式会社AB…".encode("utf-8")
+    for size in range(1, len(content) + 1):
+        assert scanner.scan(chunked(content, size))[0] == ["株式会社AB"], size
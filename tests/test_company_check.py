@@ -0,0 +1,42 @@
+# 社名判定のストリーミング走査が、ページ全体を解析する従来方式と同じ結果になるか確かめる
+
+import pytest
+import requests
+import suumo_checker
+from conftest import read_fixture
+from suumo_checker import COMPANY_SCAN_CHUNK_SIZE, has_company_name, scan_company_name
+
+PAGES = ("detail_own.html", "detail_own_sjis.html", "detail_other.html")
+CHUNK_SIZES = (7, 1024, COMPANY_SCAN_CHUNK_SIZE)
+
+def chunked(content, size):
+    return (content[i:i + size] for i in range(0, len(content), size))
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize("page", PAGES)
+def test_streaming_parity(page, size):
+    content = read_fixture(page)
+    found, _ = scan_company_name(chunked(content, size))
+    assert found == has_company_name(content)
+
+@pytest.mark.parametrize("page", PAGES)
+def test_stops_at_end_of_head(page):
+    content = read_fixture(page)
+    _, scanned = scan_company_name(chunked(content, 64), end_markers=("</head>",))
+    assert scanned < content.index(b"</head>") + 64 + len("</head>")
+
+def test_ignores_name_after_head():
+    content = read_fixture("detail_other.html").replace(
+        "株式会社サンプル不動産</span>".encode("utf-8"), "合同会社えほうまき</span>".encode("utf-8"))
+    assert scan_company_name([content], end_markers=("</head>",))[0] is False
+    assert scan_company_name([content], end_markers=())[0] is True
+
+def test_error_status_closes_stream(monkeypatch):
+    response = requests.Response()
+    response.status_code = 404
+    response.url = "https://suumo.jp/chintai/bc_100000000001/"
+    finished = []
+    monkeypatch.setattr(suumo_checker, "fetch", lambda url, **kwargs: response)
+    monkeypatch.setattr(suumo_checker, "finish_stream", finished.append)
+    assert suumo_checker.find_listing_agency_streaming(response.url) is None
+    assert finished == [response]
@@ -0,0 +1,34 @@
+import os
+import requests
+import pytest
+import http_cache
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "HTTP_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+def ok(headers=None):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"<html></html>"
+    response.headers.update(headers or {})
+    return response
+
+def entries(cache_dir):
+    return [os.path.join(d, f) for d, _, files in os.walk(cache_dir) for f in files]
+
+def test_store_only_reusable_entries(cache_dir):
+    http_cache.cached_fetch("https://suumo.jp/a", {}, lambda extra: ok(), ttl=0)
+    assert entries(cache_dir) == []
+    http_cache.cached_fetch("https://suumo.jp/b", {}, lambda extra: ok({"ETag": '"1"'}), ttl=0)
+    http_cache.cached_fetch("https://suumo.jp/c", {}, lambda extra: ok(), ttl=60)
+    assert len(entries(cache_dir)) == 2
+
+def test_prune_old_entries(cache_dir):
+    http_cache.cached_fetch("https://suumo.jp/a", {}, lambda extra: ok({"ETag": '"1"'}))
+    http_cache.cached_fetch("https://suumo.jp/b", {}, lambda extra: ok({"ETag": '"2"'}))
+    old = entries(cache_dir)[0]
+    os.utime(old, (0, 0))
+    assert http_cache.prune(max_age=60) == 1
+    assert old not in entries(cache_dir) and len(entries(cache_dir)) == 1
@@ -0,0 +1,89 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+import http_client
+import suumo_scrape
+from http_client import CircuitBreaker, HostRateLimiter, TransientFetchError
+
+class StatusAdapter(BaseAdapter):
+    def __init__(self, statuses):
+        super().__init__()
+        self.statuses = list(statuses)
+        self.requests = 0
+
+    def send(self, request, **kwargs):
+        self.requests += 1
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        if status is None:
+            raise requests.ConnectionError("接続できません")
+        response = requests.Response()
+        response.status_code = status
+        response.url = request.url
+        response.request = request
+        response.raw = io.BytesIO(b"<html></html>")
+        return response
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def adapter(monkeypatch):
+    def mount(statuses):
+        session = requests.Session()
+        adapter = StatusAdapter(statuses)
+        session.mount("https://", adapter)
+        monkeypatch.setattr(http_client, "_session", session)
+        return adapter
+    monkeypatch.setattr(http_client, "RETRIES", 2)
+    monkeypatch.setattr(http_client, "_rate_limiter", HostRateLimiter(0))
+    monkeypatch.setattr(http_client, "_breaker", CircuitBreaker(threshold=0))
+    monkeypatch.setattr(http_client.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(http_client.http_cache, "ENABLED", False)
+    return mount
+
+@pytest.mark.parametrize("status", [503, 429, None])
+def test_retries_exhausted_raise(adapter, status):
+    mounted = adapter([status])
+    with pytest.raises(TransientFetchError):
+        http_client.fetch("https://suumo.jp/chintai/bc_1/")
+    assert mounted.requests == 3
+
+def test_retry_then_success(adapter):
+    mounted = adapter([503, 200])
+    assert http_client.fetch("https://suumo.jp/chintai/bc_1/").status_code == 200
+    assert mounted.requests == 2
+
+def test_listing_page_not_mapped_to_failure(adapter):
+    adapter([503])
+    with pytest.raises(TransientFetchError):
+        suumo_scrape.fetch_listing_page("https://suumo.jp/chintai/bc_1/")
+
+def test_listing_page_not_found(adapter):
+    adapter([404])
+    assert suumo_scrape.fetch_listing_page("https://suumo.jp/chintai/bc_1/") is None
+
+def test_requests_in_flight_limited(adapter, monkeypatch):
+    # run_all の中でさらに並行して取得しても、同時に送るのは _request_slots の数まで
+    mounted = adapter([200])
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+    send = mounted.send
+
+    def slow_send(request, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        threading.Event().wait(0.02)  # time.sleep は adapter で止めてある
+        with lock:
+            in_flight[0] -= 1
+        return send(request, **kwargs)
+
+    monkeypatch.setattr(mounted, "send", slow_send)
+    monkeypatch.setattr(http_client, "_request_slots", threading.BoundedSemaphore(2))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(http_client.fetch, [f"https://suumo.jp/chintai/bc_{n}/" for n in range(8)]))
+    assert mounted.requests == 8
+    assert peak[0] == 2
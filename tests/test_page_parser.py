@@ -0,0 +1,53 @@
+# HTML パーサーのバックエンドごとに、保存したページからの抽出結果が html.parser と同じになるか確かめる
+
+import pytest
+from conftest import read_fixture
+from page_parser import BACKENDS, resolve_backend
+from suumo_checker import extract_bukken_ids_from_html, has_company_name
+from suumo_scrape import extract_conditions_from_html
+
+PAGES = ("detail_own.html", "detail_other.html", "detail_own_sjis.html", "search.html")
+EXTRACTORS = {
+    "条件抽出": extract_conditions_from_html,
+    "物件ID": extract_bukken_ids_from_html,
+    "社名判定": has_company_name,
+}
+
+def installed(backend):
+    if resolve_backend(backend) != backend:
+        pytest.skip(f"{backend} が未インストール")
+    return backend
+
+@pytest.mark.parametrize("backend", BACKENDS[1:])
+@pytest.mark.parametrize("page", PAGES)
+@pytest.mark.parametrize("name", EXTRACTORS)
+def test_backend_parity(name, page, backend):
+    content = read_fixture(page)
+    func = EXTRACTORS[name]
+    assert func(content, installed(backend)) == func(content, "html.parser")
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("page", ("detail_own.html", "detail_other.html"))
+def test_partial_parse_parity(page, backend):
+    content = read_fixture(page)
+    backend = installed(backend)
+    assert extract_conditions_from_html(content, backend) == extract_conditions_from_html(content, backend, partial=False)
+
+def test_extract_conditions():
+    data = extract_conditions_from_html(read_fixture("detail_own.html"))
+    assert data["title"].endswith("岩本町駅の賃貸・部屋探し情報（100446479749） | 賃貸マンション・賃貸アパート")
+    assert data["stations"] == [
+        {"line": "ＪＲ山手線", "station": "秋葉原", "distance": 8},
+        {"line": "都営新宿線", "station": "岩本町", "distance": 2},
+        {"line": "東京メトロ日比谷線", "station": "秋葉原", "distance": 6},
+    ]
+    assert data["price"] == 9.9
+    assert data["floor_plan"] == "1K"
+    assert data["area"] == 25.5
+    assert data["age"] == 10
+    assert data["properties"]["管理費・共益費"] == "5000円"
+
+def test_extract_bukken_ids():
+    bukken_ids = extract_bukken_ids_from_html(read_fixture("search.html"))
+    assert len(bukken_ids) == 50
+    assert "100446479700" in bukken_ids
@@ -0,0 +1,19 @@
+import pytest
+from run_memo import SingleFlightMemo
+
+def test_contains_only_finished_results():
+    memo = SingleFlightMemo(lambda url: {"url": url} if "ok" in url else None)
+    assert memo("https://suumo.jp/ok") == {"url": "https://suumo.jp/ok"}
+    assert memo("https://suumo.jp/ng") is None
+    assert "https://suumo.jp/ok" in memo
+    assert "https://suumo.jp/ng" not in memo  # 取得失敗は覚えない
+    assert "https://suumo.jp/other" not in memo
+
+def test_failed_call_not_contained():
+    def fail(url):
+        raise RuntimeError(url)
+
+    memo = SingleFlightMemo(fail)
+    with pytest.raises(RuntimeError):
+        memo("https://suumo.jp/x")
+    assert "https://suumo.jp/x" not in memo
@@ -0,0 +1,119 @@
+import pytest
+from conftest import read_fixture
+import suumo_checker
+from search_index import SearchIndex
+from suumo_checker import extract_bukken_id, fetch_bukken_ids, parse_search_page, search_page_url
+
+PAGE_SIZE = suumo_checker.SEARCH_PAGE_SIZE
+
+def test_parse_search_page():
+    bukken_ids, total, items = parse_search_page(read_fixture("search.html"))
+    assert len(bukken_ids) == items == PAGE_SIZE
+    assert total == 1234
+
+def test_parse_search_page_without_total():
+    content = read_fixture("search.html").replace(b"paginate_set-hit", b"other")
+    assert parse_search_page(content)[1] is None
+
+def fake_pages(monkeypatch, count, total, failing=(), page_size=PAGE_SIZE, repeat=()):
+    """
+    count 件の検索結果を page_size 件ずつのページにした fetch_search_page に差し替える
+    repeat: 同じ物件が2回載るページ
+    """
+    ids = [f"1000000{n:05d}" for n in range(count)]
+    requested = []
+
+    def fetch_search_page(page_url):
+        page = int(page_url.split("page=")[1]) if "page=" in page_url else 1
+        requested.append(page)
+        if page in failing:
+            return None
+        items = ids[(page - 1) * page_size:page * page_size]
+        if page in repeat:
+            items = items[:-1] + items[:1]
+        return set(items), total, len(items)
+
+    monkeypatch.setattr(suumo_checker, "fetch_search_page", fetch_search_page)
+    return ids, requested
+
+def test_reads_all_pages_from_total(monkeypatch):
+    ids, requested = fake_pages(monkeypatch, PAGE_SIZE * 3 + 1, PAGE_SIZE * 3 + 1)
+    bukken_ids, complete = fetch_bukken_ids("https://suumo.jp/chintai/tokyo/ek_38430/")
+    assert bukken_ids == set(ids) and complete
+    assert sorted(requested) == [1, 2, 3, 4]
+
+def test_reads_until_short_page_without_total(monkeypatch):
+    ids, requested = fake_pages(monkeypatch, PAGE_SIZE * 5 + 1, None)
+    bukken_ids, complete = fetch_bukken_ids("https://suumo.jp/chintai/tokyo/ek_38430/", max_pages=40)
+    assert bukken_ids == set(ids) and complete
+    assert max(requested) >= 6
+
+def test_truncated_result_is_incomplete(monkeypatch):
+    ids, _ = fake_pages(monkeypatch, PAGE_SIZE * 100, PAGE_SIZE * 100)
+    bukken_ids, complete = fetch_bukken_ids("https://suumo.jp/chintai/tokyo/ek_38430/", max_pages=40)
+    assert ids[PAGE_SIZE * 60] not in bukken_ids
+    assert not complete
+
+def test_failed_page_is_incomplete(monkeypatch):
+    fake_pages(monkeypatch, PAGE_SIZE * 3, PAGE_SIZE * 3, failing={2})
+    assert fetch_bukken_ids("https://suumo.jp/chintai/tokyo/ek_38430/")[1] is False
+
+def test_zero_hits_reads_one_page(monkeypatch):
+    _, requested = fake_pages(monkeypatch, 0, 0)
+    assert fetch_bukken_ids("https://suumo.jp/chintai/tokyo/ek_38430/") == (set(), True)
+    assert requested == [1]
+
+def test_empty_page_without_total(monkeypatch):
+    _, requested = fake_pages(monkeypatch, 0, None)
+    assert fetch_bukken_ids("https://suumo.jp/chintai/tokyo/ek_38430/") == (set(), True)
+    assert requested == [1]
+
+def test_page_size_from_first_page(monkeypatch):
+    # サーバーが pc を無視して 20 件ずつ返す
+    ids, requested = fake_pages(monkeypatch, 95, 95, page_size=20)
+    bukken_ids, complete = fetch_bukken_ids("https://suumo.jp/chintai/tokyo/ek_38430/")
+    assert bukken_ids == set(ids) and complete
+    assert sorted(requested) == [1, 2, 3, 4, 5]
+
+def test_page_size_from_first_page_without_total(monkeypatch):
+    ids, requested = fake_pages(monkeypatch, 95, None, page_size=20)
+    bukken_ids, complete = fetch_bukken_ids("https://suumo.jp/chintai/tokyo/ek_38430/")
+    assert bukken_ids == set(ids) and complete
+    assert max(requested) == 5
+
+def test_repeated_item_counts_toward_page_size(monkeypatch):
+    # 1ページ目に同じ物件が2回載っていても、ページ数を少なく見積もらない
+    ids, requested = fake_pages(monkeypatch, PAGE_SIZE * 2, PAGE_SIZE * 2, repeat={1})
+    bukken_ids, complete = fetch_bukken_ids("https://suumo.jp/chintai/tokyo/ek_38430/")
+    assert sorted(requested) == [1, 2] and complete
+    assert set(ids[PAGE_SIZE:]) <= bukken_ids
+
+def test_stops_when_targets_found(monkeypatch):
+    ids, requested = fake_pages(monkeypatch, PAGE_SIZE * 3, PAGE_SIZE * 3)
+    bukken_ids, complete = fetch_bukken_ids("https://suumo.jp/chintai/tokyo/ek_38430/", {ids[0]})
+    assert complete and requested == [1]
+
+@pytest.mark.parametrize("result, expected", [
+    (({"1"}, True), {"a": True, "b": False}),
+    (({"1"}, False), {"a": True, "b": None}),
+    (None, {"a": None, "b": None}),
+])
+def test_search_index_lookup(result, expected):
+    index = SearchIndex(lambda search_url, targets: result)
+    index.add("a", "https://suumo.jp/s", "1")
+    index.add("b", "https://suumo.jp/s", "2")
+    index.fetch_all()
+    assert {key: index.lookup(key) for key in ("a", "b")} == expected
+
+def test_search_page_url():
+    url = search_page_url("https://suumo.jp/chintai/tokyo/ek_38430/?ts=1&pc=30&page=3", 2)
+    assert url == f"https://suumo.jp/chintai/tokyo/ek_38430/?ts=1&pc={PAGE_SIZE}&page=2"
+
+@pytest.mark.parametrize("text, expected", [
+    ("https://suumo.jp/chintai/bc_100446479749/", "100446479749"),
+    ("https://suumo.jp/jj/chintai/shosai/?bc=100446479749&abc=1", "100446479749"),
+    ("https://suumo.jp/chintai/jnc_000012345678/?abc=123", None),
+    ("【SUUMO】ＨＯＰＥ　ＣＩＴＹ（100446479749） | 賃貸", "100446479749"),
+])
+def test_extract_bukken_id(text, expected):
+    assert extract_bukken_id(text) == expected
@@ -0,0 +1,85 @@
+# 手元の写しへの書き込み・削除が、どの API 呼び出しになるかを偽のスプレッドシートで確かめる
+
+import pytest
+from conftest import FakeSpreadsheet, FakeWorksheet
+from sheet_snapshot import SheetSnapshot
+
+pytestmark = pytest.mark.usefixtures("unlimited_sheets_quota")
+
+@pytest.fixture
+def snapshot():
+    rows = [
+        ["路線", "駅", "URL", "検索URL", "結果"],
+        ["山手線", "東京", "u2", "", "⭕️"],
+        ["山手線", "神田", "u3", "", ""],
+        ["京王線", "新宿", "u4", "", "⭕️"],
+        ["京王線", "笹塚", "u5", "", ""],
+    ]
+    return SheetSnapshot(FakeSpreadsheet(), FakeWorksheet(rows))
+
+def written(call):
+    method, body = call
+    assert method == "values_batch_update"
+    return body["valueInputOption"], [(item["range"], item["values"]) for item in body["data"]]
+
+def test_pending_writes_sent_before_delete(snapshot):
+    snapshot.set_cell(5, 5, "❌")
+    snapshot.delete_rows([2, 3])
+    first, second = snapshot.spreadsheet.calls
+    # 書き込みは削除前の行番号のまま送られる
+    assert written(first) == ("USER_ENTERED", [("'シート1'!E5:E5", [["❌"]])])
+    assert second[0] == "batch_update"
+
+def test_pending_writes_sent_before_column_delete(snapshot):
+    snapshot.set_cell(2, 5, "❌")
+    snapshot.delete_columns([3])
+    assert [method for method, _ in snapshot.spreadsheet.calls] == ["values_batch_update", "batch_update"]
+    assert written(snapshot.spreadsheet.calls[0])[1] == [("'シート1'!E2:E2", [["❌"]])]
+
+def test_delete_nothing_sends_nothing(snapshot):
+    snapshot.set_cell(2, 5, "❌")
+    assert snapshot.delete_rows([]) == 0
+    assert snapshot.delete_columns([]) == 0
+    assert snapshot.spreadsheet.calls == []
+
+def test_raw_and_user_entered_kept_apart(snapshot):
+    snapshot.set_cell(3, 3, "u3b", raw=True)
+    snapshot.set_cell(3, 4, "=HYPERLINK(\"x\")")
+    snapshot.set_cell(3, 5, "⭕️")
+    snapshot.sync()
+    calls = dict(written(call) for call in snapshot.spreadsheet.calls)
+    assert calls == {
+        "RAW": [("'シート1'!C3:C3", [["u3b"]])],
+        "USER_ENTERED": [("'シート1'!D3:E3", [["=HYPERLINK(\"x\")", "⭕️"]])],
+    }
+
+def test_unchanged_value_not_sent(snapshot):
+    snapshot.set_cell(2, 5, "⭕️")
+    snapshot.sync()
+    assert snapshot.skipped == 1
+    assert snapshot.spreadsheet.calls == []
+
+def test_rewrite_to_original_value_still_sent(snapshot):
+    # 送っていない書き込みを元の値に戻したときも、最後の値を送る
+    snapshot.set_cell(2, 5, "❌")
+    snapshot.set_cell(2, 5, "⭕️")
+    snapshot.sync()
+    assert written(snapshot.spreadsheet.calls[0]) == ("USER_ENTERED", [("'シート1'!E2:E2", [["⭕️"]])])
+
+def test_local_rows_after_delete(snapshot):
+    assert snapshot.delete_rows([2, 4]) == 2
+    assert [row[1] for row in snapshot.rows] == ["駅", "神田", "笹塚"]
+    assert snapshot.value(3, 3) == "u5"
+
+def test_local_columns_after_delete(snapshot):
+    assert snapshot.delete_columns([3, 4]) == 1
+    assert snapshot.rows[1] == ["山手線", "東京", "⭕️"]
+    assert snapshot.col_count == 8
+    assert snapshot.value(2, 3) == "⭕️"
+    assert snapshot.value(2, 4) == ""
+
+def test_append_row_after_delete(snapshot):
+    snapshot.delete_rows([5])
+    assert snapshot.append_row(["小田急線", "新宿", "u6"]) == 5
+    snapshot.sync()
+    assert written(snapshot.spreadsheet.calls[-1]) == ("RAW", [("'シート1'!A5:C5", [["小田急線", "新宿", "u6"]])])
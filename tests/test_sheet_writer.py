@@ -0,0 +1,35 @@
+# 行・列の削除が、下（右）の範囲から順の1回の batchUpdate になるか確かめる
+
+import pytest
+from conftest import FakeSpreadsheet, FakeWorksheet
+from sheet_writer import delete_columns, delete_rows, row_ranges
+
+pytestmark = pytest.mark.usefixtures("unlimited_sheets_quota")
+
+def deleted(call, dimension):
+    method, body = call
+    assert method == "batch_update"
+    ranges = [request["deleteDimension"]["range"] for request in body["requests"]]
+    assert all(r["sheetId"] == FakeWorksheet.id and r["dimension"] == dimension for r in ranges)
+    return [(r["startIndex"], r["endIndex"]) for r in ranges]
+
+def test_row_ranges_bottom_up():
+    assert row_ranges([2, 3, 4, 7, 9, 10]) == [(9, 10), (7, 7), (2, 4)]
+    assert row_ranges([5, 5, 3]) == [(5, 5), (3, 3)]
+    assert row_ranges([]) == []
+
+def test_delete_rows_one_batch():
+    spreadsheet = FakeSpreadsheet()
+    assert delete_rows(spreadsheet, FakeWorksheet(), [10, 2, 9, 3, 7, 4]) == 3
+    assert len(spreadsheet.calls) == 1
+    assert deleted(spreadsheet.calls[0], "ROWS") == [(8, 10), (6, 7), (1, 4)]
+
+def test_delete_columns_one_batch():
+    spreadsheet = FakeSpreadsheet()
+    assert delete_columns(spreadsheet, FakeWorksheet(), [6, 5]) == 1
+    assert deleted(spreadsheet.calls[0], "COLUMNS") == [(4, 6)]
+
+def test_delete_nothing_sends_nothing():
+    spreadsheet = FakeSpreadsheet()
+    assert delete_rows(spreadsheet, FakeWorksheet(), []) == 0
+    assert spreadsheet.calls == []
@@ -0,0 +1,25 @@
+import station_crawl
+from station_crawl import StationCrawlIndex
+
+STATION = {"stationCode": "38430", "stationName": "岩本町"}
+
+def crawl_with(monkeypatch, result):
+    monkeypatch.setattr(station_crawl, "station_search_base_url", lambda station: "https://suumo.jp/s")
+    monkeypatch.setattr(station_crawl, "fetch_bukken_ids", lambda url, max_pages=None: result)
+    index = StationCrawlIndex(ttl=0)
+    index.crawl(STATION)
+    return index
+
+def test_complete_crawl(monkeypatch):
+    index = crawl_with(monkeypatch, ({"1"}, True))
+    assert index.lookup("1", "38430") is True
+    assert index.lookup("2", "38430") is False
+
+def test_truncated_crawl_is_undecided(monkeypatch):
+    index = crawl_with(monkeypatch, ({"1"}, False))
+    assert index.lookup("1", "38430") is True
+    assert index.lookup("2", "38430") is None
+
+def test_failed_crawl_is_undecided(monkeypatch):
+    index = crawl_with(monkeypatch, None)
+    assert index.lookup("1", "38430") is None
@@ -0,0 +1,34 @@
+import pytest
+from station_matcher import match_station, normalize_line_name
+
+@pytest.mark.parametrize("line_name, expected", [
+    ("ＪＲ山手線", "山手"),
+    ("JR山手線", "山手"),
+    ("山手線", "山手"),
+    ("東京メトロ有楽町線", "有楽町"),
+    ("京王線", "京王"),
+    ("小田急線", "小田急"),
+    ("京成本線", "京成本"),
+    ("京急本線", "京急本"),
+])
+def test_normalize_line_name(line_name, expected):
+    assert normalize_line_name(line_name) == expected
+
+@pytest.mark.parametrize("line_name, station_name", [
+    ("小田急線", "新宿"),
+    ("京王線", "新宿"),
+    ("京成本線", "青砥"),
+    ("京急本線", "品川"),
+])
+def test_exact_pair_wins(line_name, station_name):
+    match = match_station(line_name, station_name)
+    assert (match["lineName"], match["method"], match["confidence"]) == (line_name, "exact", 1.0)
+
+@pytest.mark.parametrize("line_name, station_name, expected_line", [
+    ("小田急", "新宿", "小田急線"),
+    ("京王", "新宿", "京王線"),
+    ("JR山手線", "渋谷駅", "ＪＲ山手線"),
+])
+def test_normalized_pair_keeps_operator(line_name, station_name, expected_line):
+    match = match_station(line_name, station_name)
+    assert match["lineName"] == expected_line and match["method"] == "normalized"